@@ -0,0 +1,18 @@
+from celery import shared_task
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True, acks_late=True)
+def deliver_outbox():
+    """
+    Drain the email outbox now instead of waiting for the scheduler's next poll;
+    queued by EmailOutboxService.request_delivery() after a registration OTP
+    """
+    from mvp.services.email_outbox import EmailOutboxService
+
+    sent, failed = EmailOutboxService.deliver_all()
+    if sent or failed:
+        logger.info(f"Email outbox delivery: {sent} sent, {failed} failed")
+    return sent, failed
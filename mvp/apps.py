@@ -1,5 +1,8 @@
 from django.apps import AppConfig
 from django.conf import settings
+import atexit
+import os
+import sys
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,10 +17,11 @@ class MvpConfig(AppConfig):
         """
         # Import here to avoid circular import
         try:
-            if hasattr(settings, 'SCHEDULER_AUTOSTART') and settings.SCHEDULER_AUTOSTART:
-                from .scheduler import start_scheduler
-                scheduler = start_scheduler()
-                logger.info("Scheduler started successfully")
+            if getattr(settings, 'SCHEDULER_AUTOSTART', False) and self._runs_scheduler():
+                # Every opted-in process campaigns; only the lease holder runs the jobs
+                from .scheduler import leader
+                leader.start()
+                atexit.register(leader.stop)
                 
         except Exception as e:
             logger.error(f"Failed to start scheduler: {e}")
@@ -27,4 +31,24 @@ class MvpConfig(AppConfig):
             from . import signals
             logger.info("Signals registered successfully")
         except Exception as e:
-            logger.error(f"Failed to register signals: {e}")
\ No newline at end of file
+            logger.error(f"Failed to register signals: {e}")
+
+        # Register domain event handlers
+        try:
+            from . import handlers
+        except Exception as e:
+            logger.error(f"Failed to register event handlers: {e}")
+
+    @staticmethod
+    def _runs_scheduler():
+        """
+        Whether a process with SCHEDULER_AUTOSTART set campaigns: False for
+        manage.py commands (migrate, shell...) and the runserver reloader process
+        """
+        if os.path.basename(sys.argv[0]) not in ('manage.py', 'django-admin'):
+            return True
+        command = sys.argv[1] if len(sys.argv) > 1 else ''
+        if command != 'runserver':
+            # run_scheduler starts its own election
+            return False
+        return os.environ.get('RUN_MAIN') == 'true' or '--noreload' in sys.argv
@@ -0,0 +1,210 @@
+"""
+Outbound email throughput benchmark.
+
+Drives the production send paths (AcceptanceNotificationService and the
+outbox worker, the meeting/document reminder services, NotificationService)
+against a local SMTPSink with synthetic, unsaved translations. Their users
+are saved, with immediate-email preferences, so that ChannelRouter can
+resolve them; every database write made along the way (users, outbox rows)
+is rolled back at the end.
+"""
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.mail.backends.smtp import EmailBackend
+from django.db import transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+from datetime import timedelta
+from decimal import Decimal
+import time
+
+from translations.models import EmailOutbox, Language, NotificationPreference, TranslationRequest
+from translations.services.channels import preference_cache
+from translations.services.notification import NotificationService
+
+from ..email_backends.circuit_breaker import breaker
+from ..services.document_reminder import DocumentReminderService
+from ..services.email_outbox import EmailOutboxService
+from ..services.email_rendering import EmailRenderer
+from ..services.meeting_reminder import MeetingReminderService
+from ..services.notification_service import AcceptanceNotificationService
+from .smtp_sink import SMTPSink
+
+TIMED_BACKEND = 'mvp.benchmarks.email_throughput.TimedSMTPBackend'
+
+
+class Recorder:
+    """Collects render and send durations (in seconds) for the running scenario"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.render_times = []
+        self.send_times = []
+
+
+recorder = Recorder()
+
+
+class TimedSMTPBackend(EmailBackend):
+    """SMTP backend recording the duration of every send_messages call"""
+
+    def send_messages(self, email_messages):
+        started = time.perf_counter()
+        try:
+            return super().send_messages(email_messages)
+        finally:
+            recorder.send_times.append(time.perf_counter() - started)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile; None for an empty sample"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+class EmailBenchmark:
+    SCENARIOS = ('acceptance', 'reminders', 'notification')
+
+    def __init__(self, count=100, batch_size=None):
+        self.count = count
+        self.batch_size = batch_size
+
+    def run(self, scenarios=None):
+        """Run the scenarios in order; returns one result dict per scenario"""
+        results = []
+        with SMTPSink() as sink:
+            overrides = {
+                'EMAIL_HOST': sink.host,
+                'EMAIL_PORT': sink.port,
+                'EMAIL_HOST_USER': '',
+                'EMAIL_HOST_PASSWORD': '',
+                'EMAIL_USE_TLS': False,
+                'EMAIL_USE_SSL': False,
+                'EMAIL_TRANSPORT_BACKEND': TIMED_BACKEND,
+                'EMAIL_OUTBOX_BACKEND': TIMED_BACKEND,
+                'DEFAULT_FROM_EMAIL': settings.DEFAULT_FROM_EMAIL or 'benchmark@localhost'
+            }
+            with override_settings(**overrides):
+                with transaction.atomic():
+                    # Keep real queued mail out of the measurement; undone by the rollback
+                    EmailOutbox.objects.filter(status__in=['PENDING', 'SENDING']).update(
+                        next_attempt_at=timezone.now() + timedelta(days=365)
+                    )
+                    for scenario in scenarios or self.SCENARIOS:
+                        results.append(self._measure(scenario, sink))
+                    transaction.set_rollback(True)
+            # Drop the preferences cached for the rolled-back users
+            preference_cache.invalidate()
+        return results
+
+    def _measure(self, scenario, sink):
+        translations = [self._synthetic_translation(i) for i in range(self.count)]
+        EmailRenderer.clear()
+        breaker.record_success()
+        recorder.reset()
+        before = sink.snapshot()
+
+        original_render = EmailRenderer.render
+
+        def timed_render(template_name, context):
+            started = time.perf_counter()
+            try:
+                return original_render(template_name, context)
+            finally:
+                recorder.render_times.append(time.perf_counter() - started)
+
+        EmailRenderer.render = staticmethod(timed_render)
+        started = time.perf_counter()
+        try:
+            getattr(self, f'_run_{scenario}')(translations)
+            # Anything queued (or deferred by the breaker) goes out through the worker
+            EmailOutboxService.deliver_all(self.batch_size)
+        finally:
+            elapsed = time.perf_counter() - started
+            EmailRenderer.render = staticmethod(original_render)
+
+        after = sink.snapshot()
+        messages = after['messages'] - before['messages']
+        return {
+            'scenario': scenario,
+            'translations': self.count,
+            'messages': messages,
+            'seconds': elapsed,
+            'messages_per_second': messages / elapsed if elapsed else 0.0,
+            'render_p50_ms': self._ms(percentile(recorder.render_times, 50)),
+            'render_p99_ms': self._ms(percentile(recorder.render_times, 99)),
+            'send_p50_ms': self._ms(percentile(recorder.send_times, 50)),
+            'send_p99_ms': self._ms(percentile(recorder.send_times, 99)),
+            'connections': after['connections'] - before['connections'],
+            'bytes': after['bytes'] - before['bytes']
+        }
+
+    def _run_acceptance(self, translations):
+        for translation in translations:
+            AcceptanceNotificationService.send_all_notifications(translation)
+
+    def _run_reminders(self, translations):
+        for translation in translations:
+            if translation.translation_type == 'DOCUMENT':
+                DocumentReminderService.send_document_reminder(translation, 7)
+            else:
+                MeetingReminderService.send_meeting_reminder(translation, 24)
+
+    def _run_notification(self, translations):
+        service = NotificationService()
+        for translation in translations:
+            service.send_email_notification(
+                template='translator_confirmation',
+                context={
+                    'translation': translation,
+                    'translator_name': translation.translator.get_full_name()
+                },
+                recipient=translation.translator.email,
+                subject=f'Translation Assignment Confirmation: {translation.title}'
+            )
+
+    @staticmethod
+    def _synthetic_translation(index):
+        now = timezone.now()
+        translator = EmailBenchmark._synthetic_user(f'bench_translator_{index}', f'Translator {index}',
+                                                    f'translator{index}@bench.invalid')
+        client = EmailBenchmark._synthetic_user(f'bench_client_{index}', f'Client {index}',
+                                                f'client{index}@bench.invalid')
+        translation_type = 'DOCUMENT' if index % 2 == 0 else 'REMOTE_MEETING'
+        return TranslationRequest(
+            id=index + 1,
+            title=f'Benchmark translation {index}',
+            description='Synthetic request generated by the email benchmark',
+            source_language=Language(name='English', code='en'),
+            target_language=Language(name='French', code='fr'),
+            status='ASSIGNED',
+            translation_type=translation_type,
+            deadline=now + timedelta(days=7),
+            start_date=now + timedelta(days=1),
+            duration_minutes=60,
+            meeting_link='https://meet.bench.invalid/room',
+            client_price=Decimal('120.00'),
+            translator_price=Decimal('80.00'),
+            client=client,
+            translator=translator
+        )
+
+    @staticmethod
+    def _synthetic_user(username, last_name, email):
+        """Saved once per run (inside the rolled-back transaction), emailed immediately"""
+        user, created = User.objects.get_or_create(
+            username=username,
+            defaults={'first_name': 'Bench', 'last_name': last_name, 'email': email}
+        )
+        if created:
+            NotificationPreference.objects.update_or_create(user=user, defaults={'reminder_frequency': 0})
+        return user
+
+    @staticmethod
+    def _ms(seconds):
+        return None if seconds is None else seconds * 1000
@@ -0,0 +1,119 @@
+import socketserver
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: EHLO/HELO, MAIL, RCPT, DATA, RSET, NOOP, QUIT"""
+
+    def handle(self):
+        sink = self.server.sink
+        sink.record_connection()
+        self._reply(220, 'localhost SMTP sink ready')
+        recipients = 0
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                break
+            verb = line.split(b' ', 1)[0].strip().upper()
+
+            if verb == b'EHLO':
+                self.wfile.write(b'250-localhost\r\n250 8BITMIME\r\n')
+            elif verb in (b'HELO', b'NOOP'):
+                self._reply(250, 'OK')
+            elif verb in (b'MAIL', b'RSET'):
+                recipients = 0
+                self._reply(250, 'OK')
+            elif verb == b'RCPT':
+                recipients += 1
+                self._reply(250, 'OK')
+            elif verb == b'DATA':
+                self._reply(354, 'End data with <CR><LF>.<CR><LF>')
+                size = 0
+                for data_line in self.rfile:
+                    if data_line == b'.\r\n':
+                        break
+                    size += len(data_line)
+                sink.record_message(recipients, size)
+                recipients = 0
+                self._reply(250, 'OK: queued')
+            elif verb == b'QUIT':
+                self._reply(221, 'Bye')
+                break
+            else:
+                self._reply(502, 'Command not implemented')
+
+    def _reply(self, code, text):
+        self.wfile.write(f'{code} {text}\r\n'.encode('ascii'))
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SMTPSink:
+    """
+    In-process SMTP server that accepts and discards every message.
+
+    Runs on a background thread, binds to a loopback port (0 picks a free
+    one) and counts connections, messages, recipients and bytes received.
+
+        with SMTPSink() as sink:
+            ... EMAIL_HOST='127.0.0.1', EMAIL_PORT=sink.port ...
+    """
+
+    def __init__(self, host='127.0.0.1', port=0):
+        self.host = host
+        self.requested_port = port
+        self.port = None
+        self.connections = 0
+        self.messages = 0
+        self.recipients = 0
+        self.bytes = 0
+        self._server = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        self._server = _Server((self.host, self.requested_port), _SMTPHandler)
+        self._server.sink = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name='smtp-sink', daemon=True)
+        self._thread.start()
+        logger.info(f"SMTP sink listening on {self.host}:{self.port}")
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def record_connection(self):
+        with self._lock:
+            self.connections += 1
+
+    def record_message(self, recipients, size):
+        with self._lock:
+            self.messages += 1
+            self.recipients += recipients
+            self.bytes += size
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'connections': self.connections,
+                'messages': self.messages,
+                'recipients': self.recipients,
+                'bytes': self.bytes
+            }
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
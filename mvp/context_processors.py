@@ -0,0 +1,17 @@
+from django.utils.functional import SimpleLazyObject
+from translations.services.inbox import InboxService
+
+
+def notifications(request):
+    """
+    Expose the unread notification badge to every template.
+
+    The value is lazy: the single-row counter lookup only runs on pages that
+    actually render the badge.
+    """
+    user = getattr(request, 'user', None)
+    if user is None or not user.is_authenticated:
+        return {}
+    return {
+        'unread_notification_count': SimpleLazyObject(lambda: InboxService().unread_count(user))
+    }
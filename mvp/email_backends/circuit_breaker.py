@@ -0,0 +1,196 @@
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from mvp.services.suppression import suppression_list
+import smtplib
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Classic three-state breaker.
+
+    CLOSED: calls go through; consecutive transport failures are counted.
+    OPEN: calls are refused until reset_timeout seconds have passed.
+    HALF_OPEN: a single trial call decides between CLOSED and OPEN.
+    """
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+    HALF_OPEN = 'HALF_OPEN'
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.last_error = ''
+        self.trial_in_flight = False
+        self.total_failures = 0
+        self.total_deferred = 0
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self.trial_in_flight = False
+            if self.state == self.HALF_OPEN:
+                if self.trial_in_flight:
+                    return False
+                self.trial_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("Email circuit breaker closed")
+            self.state = self.CLOSED
+            self.failures = 0
+            self.trial_in_flight = False
+
+    def record_failure(self, error):
+        with self._lock:
+            self.failures += 1
+            self.total_failures += 1
+            self.last_error = str(error)
+            self.trial_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"Email circuit breaker opened after {self.failures} failure(s): {error}")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def release_trial(self):
+        """End a HALF_OPEN trial that proved nothing about the transport"""
+        with self._lock:
+            self.trial_in_flight = False
+
+    def record_deferred(self, count):
+        with self._lock:
+            self.total_deferred += count
+
+    def snapshot(self):
+        """State exposed for monitoring"""
+        with self._lock:
+            retry_in = None
+            if self.state == self.OPEN:
+                retry_in = max(0, round(self.reset_timeout - (time.monotonic() - self.opened_at), 1))
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'failure_threshold': self.failure_threshold,
+                'retry_in_seconds': retry_in,
+                'last_error': self.last_error,
+                'total_failures': self.total_failures,
+                'total_deferred': self.total_deferred,
+            }
+
+
+# One breaker per process, shared by every connection
+breaker = CircuitBreaker(
+    failure_threshold=getattr(settings, 'EMAIL_BREAKER_FAILURE_THRESHOLD', 3),
+    reset_timeout=getattr(settings, 'EMAIL_BREAKER_RESET_SECONDS', 60),
+)
+
+
+def is_transport_error(error):
+    """
+    Failures that say the provider is unhealthy, as opposed to a problem with
+    one message (refused recipient or sender, rejected data)
+    """
+    if isinstance(error, (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError)):
+        return False
+    return isinstance(error, (OSError, smtplib.SMTPException))
+
+
+class CircuitBreakerEmailBackend(BaseEmailBackend):
+    """
+    Email backend with bounded latency.
+
+    Wraps the real transport (EMAIL_TRANSPORT_BACKEND) with separate connect
+    and send deadlines. Repeated transport failures open the circuit breaker;
+    while it is open, and for any message that fails on a transport error,
+    messages are spilled to the email outbox instead of blocking the caller.
+    """
+
+    def __init__(self, fail_silently=False, **kwargs):
+        super().__init__(fail_silently=fail_silently)
+        self.connect_timeout = settings.EMAIL_CONNECT_TIMEOUT
+        self.send_timeout = settings.EMAIL_SEND_TIMEOUT
+        self.transport = get_connection(
+            settings.EMAIL_TRANSPORT_BACKEND,
+            fail_silently=fail_silently,
+            timeout=self.connect_timeout,
+            **kwargs
+        )
+
+    def open(self):
+        opened = self.transport.open()
+        # Once connected, the socket uses the send deadline
+        sock = getattr(getattr(self.transport, 'connection', None), 'sock', None)
+        if sock is not None:
+            sock.settimeout(self.send_timeout)
+        return opened
+
+    def close(self):
+        try:
+            self.transport.close()
+        except Exception:
+            pass
+
+    def send_messages(self, email_messages):
+        # Known dead addresses are dropped before any network round-trip
+        email_messages = suppression_list.filter_messages(email_messages)
+        if not email_messages:
+            return 0
+
+        if not breaker.allow_request():
+            return self._defer(email_messages)
+
+        sent = 0
+        new_connection = False
+        try:
+            new_connection = self.open()
+            for index, message in enumerate(email_messages):
+                try:
+                    sent += self.transport.send_messages([message])
+                except Exception as e:
+                    if isinstance(e, smtplib.SMTPRecipientsRefused):
+                        suppression_list.record_refusal(e)
+                    if not is_transport_error(e):
+                        if not self.fail_silently:
+                            # The provider answered: end a HALF_OPEN trial before raising
+                            breaker.record_success()
+                            raise
+                        continue
+                    breaker.record_failure(e)
+                    return sent + self._defer(email_messages[index:])
+        except Exception as e:
+            if not is_transport_error(e):
+                # Never leave a trial in flight, or the breaker refuses every later send
+                breaker.release_trial()
+                raise
+            # Connection could not be opened within the connect deadline
+            breaker.record_failure(e)
+            return self._defer(email_messages)
+        finally:
+            if new_connection:
+                self.close()
+
+        breaker.record_success()
+        return sent
+
+    def _defer(self, email_messages):
+        from mvp.services.email_outbox import EmailOutboxService
+
+        count = EmailOutboxService.queue_messages(email_messages)
+        breaker.record_deferred(count)
+        logger.warning(f"Deferred {count} email(s) to the outbox (breaker {breaker.state})")
+        return count
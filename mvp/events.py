@@ -0,0 +1,104 @@
+# events.py
+"""
+Domain event bus.
+
+Views publish typed events; handlers registered with @bus.subscribe run
+after the surrounding transaction commits, on a thread pool, so the request
+returns without waiting for SMTP or calendar work. Events only carry ids:
+handlers reload what they need from the database.
+
+Handlers live in mvp/handlers.py and are registered in MvpConfig.ready().
+Pending handlers are lost if the process dies; anything that must survive
+(email) goes through a durable queue such as the email outbox.
+"""
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from django.conf import settings
+from django.db import connection, transaction
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TranslationAccepted:
+    translation_id: int
+    translator_id: int
+
+
+@dataclass(frozen=True)
+class ScheduleChanged:
+    translation_id: int
+    previous_start_date: Optional[datetime]
+    start_date: datetime
+
+
+@dataclass(frozen=True)
+class TranslationCancelled:
+    translation_id: int
+    previous_status: str
+
+
+class EventBus:
+    def __init__(self):
+        self._handlers = defaultdict(list)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_type, handler=None):
+        """Register a handler; usable as @bus.subscribe(EventType)"""
+        if handler is None:
+            return lambda func: self.subscribe(event_type, func)
+        if handler not in self._handlers[event_type]:
+            self._handlers[event_type].append(handler)
+        return handler
+
+    def publish(self, event):
+        """Dispatch once the current transaction commits (immediately outside one)"""
+        transaction.on_commit(lambda: self.dispatch(event))
+
+    def dispatch(self, event):
+        handlers = self._handlers.get(type(event), ())
+        if not handlers:
+            logger.debug(f"No handler for {type(event).__name__}")
+        for handler in handlers:
+            if getattr(settings, 'EVENT_BUS_SYNC', False):
+                self._run(handler, event)
+            else:
+                self.executor.submit(self._run, handler, event)
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=getattr(settings, 'EVENT_BUS_WORKERS', 4),
+                        thread_name_prefix='event-bus'
+                    )
+        return self._executor
+
+    def shutdown(self, wait=True):
+        """Wait for queued handlers; the pool is recreated on the next event"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    @staticmethod
+    def _run(handler, event):
+        try:
+            handler(event)
+        except Exception as e:
+            logger.error(f"Error in {handler.__name__} for {event}: {e}", exc_info=True)
+        finally:
+            if not getattr(settings, 'EVENT_BUS_SYNC', False):
+                # Worker threads hold their own connection; do not leak it
+                connection.close()
+
+
+bus = EventBus()
@@ -0,0 +1,76 @@
+# handlers.py
+from translations.models import TranslationRequest
+from .events import bus, ScheduleChanged, TranslationAccepted, TranslationCancelled
+from .services.calendar_service import CalendarService
+from .services.document_reminder import DocumentReminderService
+from .services.meeting_reminder import MeetingReminderService
+from .services.notification_service import AcceptanceNotificationService
+from .services.reminder_dispatcher import reminder_dispatcher
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _load(translation_id):
+    return TranslationRequest.objects.select_related(
+        'client', 'translator', 'source_language', 'target_language'
+    ).filter(id=translation_id).first()
+
+
+@bus.subscribe(TranslationAccepted)
+def send_acceptance_notifications(event):
+    """Emails to the admins, the translator and the client"""
+    translation = _load(event.translation_id)
+    if translation is not None:
+        AcceptanceNotificationService.send_all_notifications(translation)
+
+
+@bus.subscribe(TranslationAccepted)
+def schedule_reminders(event):
+    """Reminders based on the translation type"""
+    translation = _load(event.translation_id)
+    if translation is None:
+        return
+
+    if translation.translation_type == 'DOCUMENT':
+        DocumentReminderService.schedule_document_reminders(translation)
+    else:
+        # For all other types (LIVE_ON_SITE, REMOTE_PHONE, REMOTE_MEETING)
+        MeetingReminderService.schedule_meeting_reminders(translation)
+    logger.info(f"Reminders scheduled for translation {translation.id}")
+
+
+@bus.subscribe(TranslationAccepted)
+def send_calendar_invitation(event):
+    """Calendar invitation for live interpretations"""
+    translation = _load(event.translation_id)
+    if translation is not None and translation.is_live_interpretation():
+        CalendarService.send_calendar_invitation(translation)
+        logger.info(f"Calendar invitation sent for translation {translation.id}")
+
+
+@bus.subscribe(ScheduleChanged)
+def send_calendar_update(event):
+    translation = _load(event.translation_id)
+    if translation is not None and translation.is_live_interpretation():
+        CalendarService.update_calendar_event(translation)
+
+
+@bus.subscribe(ScheduleChanged)
+def reschedule_reminders(event):
+    """Move the pending session reminders to the new start date"""
+    translation = _load(event.translation_id)
+    if translation is not None and translation.is_live_interpretation():
+        MeetingReminderService.schedule_meeting_reminders(translation)
+
+
+@bus.subscribe(TranslationCancelled)
+def cancel_reminders(event):
+    reminder_dispatcher.cancel([event.translation_id])
+
+
+@bus.subscribe(TranslationCancelled)
+def send_calendar_cancellation(event):
+    translation = _load(event.translation_id)
+    if translation is not None and translation.is_live_interpretation():
+        CalendarService.cancel_calendar_event(translation)
@@ -0,0 +1,132 @@
+# leader.py
+"""
+Leader election over a database row lease.
+
+Every process that may run a singleton role (the APScheduler jobs and the
+reminder dispatcher) starts a LeaderElection. Each heartbeat, the holder
+renews the SchedulerLease row; the others try to take it over, which only
+succeeds once the lease has expired. Failover therefore takes at most
+SCHEDULER_LEASE_SECONDS + SCHEDULER_HEARTBEAT_SECONDS.
+
+A leader that cannot renew before its lease expires steps down on its own,
+so two processes never run the jobs at the same time (assuming the hosts'
+clocks agree to well under the lease duration).
+"""
+from django.apps import apps
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+from datetime import timedelta
+import os
+import socket
+import threading
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderElection:
+    def __init__(self, name, on_elected, on_demoted):
+        self.name = name
+        self.identity = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.is_leader = False
+        self._expires_at = None
+        self._stopping = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name=f'leader-{self.name}', daemon=True)
+            self._thread.start()
+        logger.info(f"Leader election for '{self.name}' started as {self.identity}")
+
+    def stop(self, release=True):
+        """Stop campaigning; a leader steps down and frees the lease for the others"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        self._stopping.set()
+        if thread is not None:
+            thread.join()
+        if self.is_leader:
+            self._step_down()
+            if release:
+                self.release()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        # Started from AppConfig.ready(): no query before every app is loaded
+        while not apps.ready and not self._stopping.is_set():
+            self._stopping.wait(0.1)
+
+        heartbeat = settings.SCHEDULER_HEARTBEAT_SECONDS
+        while not self._stopping.is_set():
+            try:
+                self.heartbeat()
+            except Exception as e:
+                logger.error(f"Leader election heartbeat failed: {e}")
+                if self.is_leader and timezone.now() >= self._expires_at:
+                    # Someone else may hold the lease by now
+                    self._step_down()
+            finally:
+                close_old_connections()
+            self._stopping.wait(heartbeat)
+
+    def heartbeat(self):
+        """Renew or try to acquire the lease, then start or stop the role accordingly"""
+        held = self.try_acquire()
+        if held and not self.is_leader:
+            logger.info(f"{self.identity} elected leader for '{self.name}'")
+            self.is_leader = True
+            try:
+                self.on_elected()
+            except Exception as e:
+                logger.error(f"Error starting '{self.name}' after election: {e}", exc_info=True)
+        elif not held and self.is_leader:
+            logger.warning(f"{self.identity} lost the '{self.name}' lease")
+            self._step_down()
+        return held
+
+    def try_acquire(self):
+        from translations.models import SchedulerLease
+
+        now = timezone.now()
+        expires_at = now + timedelta(seconds=settings.SCHEDULER_LEASE_SECONDS)
+        SchedulerLease.objects.bulk_create([SchedulerLease(name=self.name, expires_at=now)], ignore_conflicts=True)
+
+        held = SchedulerLease.objects.filter(name=self.name, holder=self.identity).update(
+            renewed_at=now, expires_at=expires_at
+        )
+        if not held:
+            held = SchedulerLease.objects.filter(name=self.name, expires_at__lte=now).update(
+                holder=self.identity, acquired_at=now, renewed_at=now, expires_at=expires_at
+            )
+        if held:
+            self._expires_at = expires_at
+        return bool(held)
+
+    def release(self):
+        from translations.models import SchedulerLease
+
+        try:
+            SchedulerLease.objects.filter(name=self.name, holder=self.identity).update(
+                holder='', expires_at=timezone.now()
+            )
+        except Exception as e:
+            logger.error(f"Error releasing the '{self.name}' lease: {e}")
+
+    def _step_down(self):
+        self.is_leader = False
+        try:
+            self.on_demoted()
+        except Exception as e:
+            logger.error(f"Error stopping '{self.name}' after losing the lease: {e}", exc_info=True)
@@ -0,0 +1,51 @@
+# management/commands/archive_notifications.py
+from django.core.management.base import BaseCommand
+from translations.services.retention import RetentionService
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Move old read notifications to the monthly archive and purge expired archive months'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=None,
+            help='Archive read notifications older than this many days (default: NOTIFICATION_RETENTION_DAYS)'
+        )
+        parser.add_argument(
+            '--archive-days',
+            type=int,
+            default=None,
+            help='Purge archive months older than this many days (default: NOTIFICATION_ARCHIVE_RETENTION_DAYS)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='Rows moved or deleted per transaction (default: NOTIFICATION_RETENTION_CHUNK_SIZE)'
+        )
+
+    def handle(self, *args, **options):
+        service = RetentionService(
+            retention_days=options['days'],
+            archive_retention_days=options['archive_days'],
+            chunk_size=options['chunk_size']
+        )
+        self.stdout.write(
+            f'Archiving read notifications older than {service.retention_days} days, '
+            f'purging archive older than {service.archive_retention_days} days...'
+        )
+
+        try:
+            result = service.run()
+            self.stdout.write(
+                self.style.SUCCESS(f"{result['archived']} archived, {result['purged']} purged")
+            )
+        except Exception as e:
+            self.stdout.write(
+                self.style.ERROR(f'Error archiving notifications: {e}')
+            )
+            logger.error(f"Notification archive error: {e}", exc_info=True)
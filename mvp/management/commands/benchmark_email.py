@@ -0,0 +1,63 @@
+# management/commands/benchmark_email.py
+from django.core.management.base import BaseCommand
+from mvp.benchmarks.email_throughput import EmailBenchmark
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Measure outbound email throughput against a local SMTP sink (no mail leaves the machine)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=100,
+            help='Synthetic translations per scenario (default: 100)'
+        )
+        parser.add_argument(
+            '--scenario',
+            action='append',
+            choices=EmailBenchmark.SCENARIOS,
+            help='Scenario to run, may be repeated (default: all)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Outbox batch size (default: EMAIL_OUTBOX_BATCH_SIZE)'
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Print the results as JSON'
+        )
+
+    def handle(self, *args, **options):
+        benchmark = EmailBenchmark(count=options['count'], batch_size=options['batch_size'])
+        results = benchmark.run(options['scenario'])
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        header = f"{'scenario':<14}{'msgs':>7}{'msgs/s':>10}{'render p50':>12}{'render p99':>12}{'send p50':>10}{'send p99':>10}{'conns':>7}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for result in results:
+            self.stdout.write(
+                f"{result['scenario']:<14}"
+                f"{result['messages']:>7}"
+                f"{result['messages_per_second']:>10.1f}"
+                f"{self._ms(result['render_p50_ms']):>12}"
+                f"{self._ms(result['render_p99_ms']):>12}"
+                f"{self._ms(result['send_p50_ms']):>10}"
+                f"{self._ms(result['send_p99_ms']):>10}"
+                f"{result['connections']:>7}"
+            )
+        self.stdout.write(self.style.SUCCESS('Times in milliseconds; database changes were rolled back'))
+
+    @staticmethod
+    def _ms(value):
+        return '-' if value is None else f'{value:.2f}'
@@ -7,7 +7,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 class Command(BaseCommand):
-    help = 'Clean up old scheduler jobs and their execution records'
+    help = 'Clean up old scheduler job executions, keeping daily per-job summaries'
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -16,18 +16,36 @@ class Command(BaseCommand):
             default=7,
             help='Number of days of history to keep (default: 7)'
         )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=settings.JOB_EXECUTION_PURGE_CHUNK_SIZE,
+            help='Execution ids deleted per transaction'
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=settings.JOB_EXECUTION_PURGE_PAUSE_SECONDS,
+            help='Seconds to sleep between two chunks'
+        )
 
     def handle(self, *args, **options):
         days = options['days']
-        
+
         self.stdout.write(f'Cleaning up jobs older than {days} days...')
-        
-        try:
-            clean_old_jobs(days)
+
+        def progress(last_done, last_id, deleted):
+            self.stdout.write(f'  up to id {last_done}/{last_id}: {deleted} executions deleted')
+
+        result = clean_old_jobs(days, progress=progress, chunk_size=options['chunk_size'], pause=options['pause'])
+        if result is None:
             self.stdout.write(
-                self.style.SUCCESS(f'Successfully cleaned up old jobs')
+                self.style.ERROR('Error cleaning up jobs, see the logs')
             )
-        except Exception as e:
-            self.stdout.write(
-                self.style.ERROR(f'Error cleaning up jobs: {e}')
-            )
\ No newline at end of file
+            return
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully cleaned up old jobs: {result['deleted']} executions deleted "
+                f"in {result['chunks']} chunks"
+            )
+        )
@@ -0,0 +1,31 @@
+# management/commands/deliver_outbox.py
+from django.core.management.base import BaseCommand
+from mvp.services.email_outbox import EmailOutboxService
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Send every due message from the email outbox'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Messages sent per SMTP connection (default: EMAIL_OUTBOX_BATCH_SIZE)'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Delivering email outbox...')
+        
+        try:
+            sent, failed = EmailOutboxService.deliver_all(options['batch_size'])
+            self.stdout.write(
+                self.style.SUCCESS(f'{sent} sent, {failed} failed')
+            )
+        except Exception as e:
+            self.stdout.write(
+                self.style.ERROR(f'Error delivering outbox: {e}')
+            )
+            logger.error(f"Outbox delivery error: {e}", exc_info=True)
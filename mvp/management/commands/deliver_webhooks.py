@@ -0,0 +1,23 @@
+# management/commands/deliver_webhooks.py
+from django.core.management.base import BaseCommand
+from mvp.services.webhooks import WebhookService
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Push every due TranslationRequest status change to client webhooks'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Delivering webhooks...')
+        
+        try:
+            delivered, failed = WebhookService.deliver_all()
+            self.stdout.write(
+                self.style.SUCCESS(f'{delivered} event(s) delivered, {failed} failed')
+            )
+        except Exception as e:
+            self.stdout.write(
+                self.style.ERROR(f'Error delivering webhooks: {e}')
+            )
+            logger.error(f"Webhook delivery error: {e}", exc_info=True)
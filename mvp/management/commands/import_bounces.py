@@ -0,0 +1,86 @@
+# management/commands/import_bounces.py
+from django.core.management.base import BaseCommand, CommandError
+from mvp.services.suppression import normalize, suppression_list
+import csv
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Postfix / Exim style: "... to=<user@example.com>, ... dsn=5.1.1, status=bounced (host said: 550 ...)"
+MAILLOG_PATTERN = re.compile(r'to=<(?P<email>[^>]+)>.*?dsn=(?P<dsn>\d\.\d+\.\d+).*?status=(?P<status>\w+)(?P<detail>.*)')
+EMAIL_PATTERN = re.compile(r'^[^@\s,;]+@[^@\s,;]+\.[^@\s,;]+$')
+REASONS = ('HARD_BOUNCE', 'REJECTED', 'COMPLAINT', 'MANUAL')
+
+class Command(BaseCommand):
+    help = 'Import hard bounces from a local log file into the recipient suppression list'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Mail server log (postfix style) or CSV of "email[,reason[,detail]]"')
+        parser.add_argument(
+            '--reason',
+            choices=REASONS,
+            default='HARD_BOUNCE',
+            help='Reason recorded when the line does not give one (default: HARD_BOUNCE)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report what would be suppressed'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with open(options['path'], encoding='utf-8', errors='replace') as log_file:
+                bounces, skipped = self.parse(log_file, options['reason'])
+        except OSError as e:
+            raise CommandError(f'Cannot read {options["path"]}: {e}')
+
+        self.stdout.write(f'{len(bounces)} address(es) found, {skipped} line(s) ignored')
+        if options['dry_run']:
+            for email, (reason, detail) in sorted(bounces.items()):
+                self.stdout.write(f'{email}\t{reason}\t{detail}')
+            return
+
+        # One bulk call per (reason, detail) group keeps the import to a few queries
+        groups = {}
+        for email, key in bounces.items():
+            groups.setdefault(key, []).append(email)
+        created = 0
+        for (reason, detail), emails in groups.items():
+            created += suppression_list.suppress(emails, reason=reason, detail=detail, source='import_bounces')
+
+        self.stdout.write(
+            self.style.SUCCESS(f'{created} new suppression(s), {len(bounces) - created} already known')
+        )
+
+    def parse(self, lines, default_reason):
+        """Returns ({email: (reason, detail)}, ignored line count)"""
+        bounces, skipped = {}, 0
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            match = MAILLOG_PATTERN.search(line)
+            if match:
+                # Only permanent failures; 4.x.x deferrals are retried by the server
+                if match.group('status') != 'bounced' or not match.group('dsn').startswith('5'):
+                    skipped += 1
+                    continue
+                email = normalize(match.group('email'))
+                detail = f"dsn={match.group('dsn')}{match.group('detail')}".strip()
+                bounces[email] = (default_reason, detail[:2000])
+                continue
+
+            row = next(csv.reader([line]))
+            email = normalize(row[0]) if row else ''
+            if not EMAIL_PATTERN.match(email):
+                skipped += 1
+                continue
+            reason = row[1].strip().upper() if len(row) > 1 and row[1].strip() else default_reason
+            if reason not in REASONS:
+                reason = default_reason
+            detail = row[2].strip() if len(row) > 2 else ''
+            bounces[email] = (reason, detail[:2000])
+        return bounces, skipped
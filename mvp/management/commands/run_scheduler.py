@@ -1,32 +1,133 @@
 # management/commands/run_scheduler.py
 from django.core.management.base import BaseCommand
 from django.conf import settings
-from mvp.scheduler import start_scheduler
+from django.utils import timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from mvp.scheduler import job_stats, leader, stop_scheduler
+import json
+import os
+import signal
+import threading
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
 class Command(BaseCommand):
-    help = 'Runs the APScheduler for translation reminders'
+    help = 'Runs the APScheduler jobs and the reminder dispatcher as a daemon (leader-elected)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--heartbeat-file',
+            default=settings.SCHEDULER_HEARTBEAT_FILE,
+            help='File rewritten every heartbeat with the current stats, for file-based liveness probes'
+        )
+        parser.add_argument(
+            '--health-port',
+            type=int,
+            default=settings.SCHEDULER_HEALTH_PORT,
+            help='Serve /health and /ready on this local port (0: disabled)'
+        )
+        parser.add_argument(
+            '--stats-interval',
+            type=int,
+            default=settings.SCHEDULER_STATS_INTERVAL_SECONDS,
+            help='Seconds between two job statistics log lines'
+        )
 
     def handle(self, *args, **options):
+        self.shutdown = threading.Event()
+        self.last_beat = time.monotonic()
+        signal.signal(signal.SIGTERM, self._request_shutdown)
+        signal.signal(signal.SIGINT, self._request_shutdown)
+
         self.stdout.write('Starting scheduler...')
-        
         try:
-            scheduler = start_scheduler()
-            
-            self.stdout.write(self.style.SUCCESS('Scheduler started successfully'))
-            self.stdout.write('Press Ctrl+C to exit')
-            
-            try:
-                # Keep the main thread alive
-                scheduler.print_jobs()
-                while True:
-                    pass
-            except KeyboardInterrupt:
-                if scheduler.running:
-                    scheduler.shutdown()
-                    self.stdout.write('Scheduler shut down successfully')
+            server = self._start_health_server(options['health_port']) if options['health_port'] else None
+            # Jobs only start once this process holds the scheduler lease
+            leader.start()
         except Exception as e:
             self.stdout.write(self.style.ERROR(f'Error starting scheduler: {e}'))
-            logger.error(f"Scheduler error: {e}", exc_info=True)
\ No newline at end of file
+            logger.error(f"Scheduler error: {e}", exc_info=True)
+            return
+
+        self.stdout.write(self.style.SUCCESS('Scheduler started successfully'))
+        self.stdout.write('Send SIGTERM or press Ctrl+C to stop')
+
+        heartbeat = settings.SCHEDULER_HEARTBEAT_SECONDS
+        next_stats = time.monotonic() + options['stats_interval']
+        # Blocks between beats: the process is idle unless a job runs
+        while not self.shutdown.wait(heartbeat):
+            self.last_beat = time.monotonic()
+            if options['heartbeat_file']:
+                self._write_heartbeat(options['heartbeat_file'])
+            if options['stats_interval'] and self.last_beat >= next_stats:
+                logger.info(f"Scheduler stats: {self._stats()}")
+                next_stats = self.last_beat + options['stats_interval']
+
+        self.stdout.write('Draining running jobs...')
+        # Wait for in-flight jobs before giving the lease up
+        stop_scheduler(wait=True)
+        leader.stop()
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        if options['heartbeat_file']:
+            try:
+                os.remove(options['heartbeat_file'])
+            except OSError:
+                pass
+        self.stdout.write('Scheduler shut down successfully')
+
+    def _request_shutdown(self, signum, frame):
+        logger.info(f"Received {signal.Signals(signum).name}, shutting down scheduler")
+        self.shutdown.set()
+
+    def _stats(self):
+        stats = job_stats.snapshot()
+        stats['last_heartbeat_seconds'] = round(time.monotonic() - self.last_beat, 1)
+        return stats
+
+    def _write_heartbeat(self, path):
+        stats = self._stats()
+        stats['at'] = timezone.now().isoformat()
+        temporary = f'{path}.tmp'
+        try:
+            with open(temporary, 'w') as heartbeat_file:
+                json.dump(stats, heartbeat_file)
+            os.replace(temporary, path)
+        except OSError as e:
+            logger.error(f"Error writing scheduler heartbeat file {path}: {e}")
+
+    def _start_health_server(self, port):
+        command = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stats = command._stats()
+                if self.path == '/health':
+                    # Live while the main loop keeps beating
+                    ok = stats['last_heartbeat_seconds'] <= 3 * settings.SCHEDULER_HEARTBEAT_SECONDS
+                elif self.path == '/ready':
+                    # Ready while campaigning: leader or standby
+                    ok = leader.running and not command.shutdown.is_set()
+                else:
+                    return self._reply(404, {})
+                self._reply(200 if ok else 503, stats)
+
+            def _reply(self, status, payload):
+                body = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='scheduler-health', daemon=True).start()
+        self.stdout.write(f"Health probe on http://127.0.0.1:{port}/health and /ready")
+        return server
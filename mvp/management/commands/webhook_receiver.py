@@ -0,0 +1,57 @@
+# management/commands/webhook_receiver.py
+from django.core.management.base import BaseCommand
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from mvp.services.webhooks import SIGNATURE_HEADER, verify_signature
+import json
+
+class Command(BaseCommand):
+    help = 'Local HTTP stand-in for a client webhook endpoint: verifies signatures and prints events'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--port', type=int, default=8765, help='Port to listen on (default: 8765)')
+        parser.add_argument('--secret', default='', help='Webhook secret used to verify signatures')
+        parser.add_argument(
+            '--fail-status',
+            type=int,
+            default=None,
+            help='Answer every request with this status code, to exercise retries'
+        )
+
+    def handle(self, *args, **options):
+        command = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                signature = self.headers.get(SIGNATURE_HEADER, '')
+                if options['secret'] and not verify_signature(options['secret'], signature, body):
+                    command.stdout.write(command.style.ERROR('Rejected request with an invalid signature'))
+                    return self._reply(401)
+                if options['fail_status']:
+                    return self._reply(options['fail_status'])
+
+                events = json.loads(body or b'{}').get('events', [])
+                for event in events:
+                    data = event.get('data', {})
+                    command.stdout.write(
+                        f"{event.get('type')} #{data.get('translation_id')}: "
+                        f"{data.get('previous_status')} -> {data.get('status')} (attempt {event.get('attempt')})"
+                    )
+                self._reply(200)
+
+            def _reply(self, status):
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', options['port']), Handler)
+        self.stdout.write(f"Listening on http://127.0.0.1:{options['port']}/ (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
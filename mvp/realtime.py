@@ -0,0 +1,209 @@
+# realtime.py
+"""
+In-process pub/sub hub feeding the server-sent events endpoint.
+
+Events are addressed to a user id. Without configuration the hub is local to
+the process, which is enough for a single ASGI server. When
+REALTIME_REDIS_URL is set, events go through Redis pub/sub so that every
+process (web workers, Celery, scheduler) reaches every connected browser.
+"""
+from contextlib import asynccontextmanager
+from django.conf import settings
+from django.db import transaction
+import asyncio
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = 'realtime:user:'
+
+
+class LocalBackend:
+    """Subscribers live in this process; publish() is safe from any thread"""
+
+    def __init__(self, queue_size):
+        self.queue_size = queue_size
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def publish(self, user_id, payload):
+        with self._lock:
+            subscribers = list(self._subscribers.get(user_id, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._put, queue, payload)
+            except RuntimeError:
+                # Event loop already closed; the subscriber is going away
+                pass
+
+    @asynccontextmanager
+    async def subscribe(self, user_id):
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        entry = (asyncio.get_running_loop(), queue)
+        self.add(user_id, entry)
+        try:
+            yield queue
+        finally:
+            self.discard(user_id, entry)
+
+    def add(self, user_id, entry):
+        """Register a (loop, queue) subscriber"""
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(entry)
+
+    def discard(self, user_id, entry):
+        with self._lock:
+            subscribers = self._subscribers.get(user_id)
+            if subscribers is not None:
+                subscribers.discard(entry)
+                if not subscribers:
+                    del self._subscribers[user_id]
+
+    def subscriber_count(self):
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    @staticmethod
+    def _put(queue, payload):
+        # Slow consumers lose their oldest events rather than growing without bound
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(payload)
+
+
+class RedisBackend:
+    """
+    Fan-out through Redis pub/sub, with local delivery when Redis is unreachable
+
+    Streams of this process whose Redis subscription failed (or dropped) are
+    kept in `degraded` and receive this process's events directly, so they
+    still see everything published locally.
+    """
+
+    def __init__(self, url, queue_size):
+        import redis
+
+        self.url = url
+        self.queue_size = queue_size
+        self.client = redis.Redis.from_url(url)
+        self.local = LocalBackend(queue_size)
+        self.degraded = LocalBackend(queue_size)
+
+    def publish(self, user_id, payload):
+        try:
+            self.client.publish(f'{CHANNEL_PREFIX}{user_id}', payload)
+        except Exception as e:
+            logger.error(f"Redis publish failed, delivering locally: {e}")
+            self.local.publish(user_id, payload)
+        else:
+            self.degraded.publish(user_id, payload)
+
+    @asynccontextmanager
+    async def subscribe(self, user_id):
+        import redis.asyncio as aioredis
+
+        async with self.local.subscribe(user_id) as queue:
+            entry = (asyncio.get_running_loop(), queue)
+            client = aioredis.Redis.from_url(self.url)
+            pubsub = client.pubsub()
+            reader = None
+            try:
+                await pubsub.subscribe(f'{CHANNEL_PREFIX}{user_id}')
+                reader = asyncio.create_task(self._read(pubsub, queue, user_id, entry))
+            except Exception as e:
+                logger.error(f"Redis subscribe failed, using local events only: {e}")
+                self.degraded.add(user_id, entry)
+            try:
+                yield queue
+            finally:
+                self.degraded.discard(user_id, entry)
+                if reader is not None:
+                    reader.cancel()
+                try:
+                    await pubsub.aclose()
+                    await client.aclose()
+                except Exception:
+                    pass
+
+    async def _read(self, pubsub, queue, user_id, entry):
+        try:
+            async for message in pubsub.listen():
+                if message.get('type') != 'message':
+                    continue
+                data = message['data']
+                LocalBackend._put(queue, data.decode('utf-8') if isinstance(data, bytes) else data)
+        except Exception as e:
+            logger.error(f"Redis subscription lost, using local events only: {e}")
+        self.degraded.add(user_id, entry)
+
+    def subscriber_count(self):
+        return self.local.subscriber_count()
+
+
+class EventHub:
+    """Entry point used by signals (publish) and by the SSE view (subscribe)"""
+
+    def __init__(self):
+        self._backend = None
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = self._create_backend()
+        return self._backend
+
+    def publish(self, user_ids, event, data):
+        """Send an event to every open stream of the given users"""
+        if isinstance(user_ids, int):
+            user_ids = [user_ids]
+        payload = json.dumps({'event': event, 'data': data}, default=str)
+        for user_id in set(user_ids):
+            if user_id is not None:
+                self.backend.publish(user_id, payload)
+
+    def publish_on_commit(self, user_ids, event, data):
+        """Publish once the current transaction commits (immediately outside one)"""
+        transaction.on_commit(lambda: self.publish(user_ids, event, data))
+
+    def subscribe(self, user_id):
+        """Async context manager yielding an asyncio.Queue of JSON payloads"""
+        return self.backend.subscribe(user_id)
+
+    def _create_backend(self):
+        queue_size = getattr(settings, 'REALTIME_QUEUE_SIZE', 100)
+        redis_url = getattr(settings, 'REALTIME_REDIS_URL', None)
+        if redis_url:
+            try:
+                return RedisBackend(redis_url, queue_size)
+            except ImportError:
+                logger.warning("redis is not installed, falling back to the local event hub")
+        return LocalBackend(queue_size)
+
+
+hub = EventHub()
+
+
+def notification_payload(notification):
+    """Serialized form of a Notification pushed to the browser"""
+    payload = {
+        'type': notification.type,
+        'title': notification.title,
+        'message': notification.message,
+        'link': notification.link,
+        'created_at': notification.created_at.strftime('%Y-%m-%d %H:%M') if notification.created_at else None
+    }
+    # bulk_create leaves the primary key unset on backends without RETURNING
+    if notification.id is not None:
+        payload['id'] = notification.id
+    return payload
+
+
+def publish_notifications(notifications):
+    """Push freshly created notifications (single or bulk) to their owners"""
+    for notification in notifications:
+        hub.publish_on_commit(notification.user_id, 'notification', notification_payload(notification))
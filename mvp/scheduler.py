@@ -1,16 +1,69 @@
 # scheduler.py
+from apscheduler.events import (
+    EVENT_JOB_ERROR, EVENT_JOB_EXECUTED, EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED, EVENT_JOB_SUBMITTED
+)
 from apscheduler.schedulers.background import BackgroundScheduler
-from django_apscheduler.jobstores import DjangoJobStore
 from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
+from .leader import LeaderElection
+import copy
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
 
+_scheduler = None
+
+
+class JobStats:
+    """Job event counters of this process, for run_scheduler's health probe and periodic log"""
+
+    EVENTS = EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {'submitted': 0, 'executed': 0, 'errors': 0, 'missed': 0, 'skipped': 0}
+
+    def listener(self, event):
+        key = {
+            EVENT_JOB_SUBMITTED: 'submitted',
+            EVENT_JOB_EXECUTED: 'executed',
+            EVENT_JOB_ERROR: 'errors',
+            EVENT_JOB_MISSED: 'missed',
+            EVENT_JOB_MAX_INSTANCES: 'skipped'
+        }.get(event.code)
+        if key:
+            with self._lock:
+                self.counts[key] += 1
+
+    def snapshot(self):
+        """Counters plus the jobs of the running scheduler, if this process is the leader"""
+        from .services.reminder_dispatcher import reminder_dispatcher
+
+        with self._lock:
+            stats = dict(self.counts)
+        stats['in_flight'] = max(stats['submitted'] - stats['executed'] - stats['errors'], 0)
+        stats['leader'] = _scheduler is not None
+        stats['jobs'] = 0
+        stats['next_run'] = None
+        if _scheduler is not None and _scheduler.running:
+            jobs = [job for job in _scheduler.get_jobs() if job.next_run_time]
+            stats['jobs'] = len(jobs)
+            if jobs:
+                job = min(jobs, key=lambda job: job.next_run_time)
+                stats['next_run'] = f"{job.id} at {job.next_run_time.isoformat()}"
+        stats['queued_reminders'] = reminder_dispatcher.queued
+        return stats
+
+
+job_stats = JobStats()
+
 def start_scheduler():
-    scheduler = BackgroundScheduler(settings.SCHEDULER_CONFIG)
-    scheduler.add_jobstore(DjangoJobStore(), "default")
+    # SCHEDULER_CONFIG already declares the DjangoJobStore as "default".
+    # APScheduler consumes the dict it is given, copy it so a re-elected process can start again
+    scheduler = BackgroundScheduler(copy.deepcopy(settings.SCHEDULER_CONFIG))
+    scheduler.add_listener(job_stats.listener, JobStats.EVENTS)
     
     if settings.DEBUG:
         # Log scheduler events
@@ -28,73 +81,174 @@ def start_scheduler():
         replace_existing=True
     )
     
+    # Deliver queued emails
+    from .tasks import deliver_email_outbox
+    scheduler.add_job(
+        deliver_email_outbox,
+        trigger='interval',
+        seconds=settings.EMAIL_OUTBOX_INTERVAL_SECONDS,
+        id='deliver_email_outbox',
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
+    
+    # Flush notification digests
+    from .tasks import flush_notification_digests
+    scheduler.add_job(
+        flush_notification_digests,
+        trigger='interval',
+        minutes=settings.NOTIFICATION_DIGEST_INTERVAL_MINUTES,
+        id='flush_notification_digests',
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
+    
+    # Deliver client webhooks
+    from .tasks import deliver_webhooks
+    scheduler.add_job(
+        deliver_webhooks,
+        trigger='interval',
+        seconds=settings.WEBHOOK_INTERVAL_SECONDS,
+        id='deliver_webhooks',
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
+    
+    # Windowed reminder check; the ledger keeps it from repeating the dispatcher's reminders
+    from .tasks import check_upcoming_translations
+    scheduler.add_job(
+        check_upcoming_translations,
+        trigger='interval',
+        minutes=settings.REMINDER_CHECK_INTERVAL_MINUTES,
+        id='check_reminders',
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
+    
+    # Overdue sweep
+    from .tasks import sweep_overdue_translations
+    scheduler.add_job(
+        sweep_overdue_translations,
+        trigger='interval',
+        minutes=settings.OVERDUE_SWEEP_INTERVAL_MINUTES,
+        id='sweep_overdue_translations',
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
+    
+    # Deadline reminders, once a day
+    from .tasks import schedule_deadline_checks
+    scheduler.add_job(
+        schedule_deadline_checks,
+        trigger='cron',
+        hour=settings.DEADLINE_CHECK_HOUR,
+        minute=0,
+        id='schedule_deadline_checks',
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
+    
+    # Daily admin report
+    from .tasks import generate_periodic_reports
+    scheduler.add_job(
+        generate_periodic_reports,
+        trigger='cron',
+        hour=settings.DAILY_REPORT_HOUR,
+        minute=0,
+        id='generate_periodic_reports',
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
+    
+    # Notification retention, off-peak
+    from .tasks import archive_notifications
+    scheduler.add_job(
+        archive_notifications,
+        trigger='cron',
+        hour=3,
+        minute=30,
+        id='archive_notifications',
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
+    
     try:
         logger.info("Starting scheduler...")
         scheduler.start()
     except Exception as e:
         logger.error(f"Error starting scheduler: {e}")
+
+    # Reminders run on their own thread, woken at each due time
+    from .services.reminder_dispatcher import reminder_dispatcher
+    reminder_dispatcher.start()
         
     return scheduler
 
+def stop_scheduler(wait=True):
+    """Stop the jobs and the reminder dispatcher started by this process"""
+    global _scheduler
+    from .services.reminder_dispatcher import reminder_dispatcher
+
+    scheduler, _scheduler = _scheduler, None
+    reminder_dispatcher.stop()
+    if scheduler is not None:
+        if scheduler.running:
+            scheduler.shutdown(wait=wait)
+        logger.info("Scheduler stopped")
+
+def _on_elected():
+    global _scheduler
+    _scheduler = start_scheduler()
+
+def _on_demoted():
+    # Do not wait for running jobs: another process may already be leader
+    stop_scheduler(wait=False)
+
+# Only the process holding the lease runs the periodic jobs (see mvp.leader)
+leader = LeaderElection('scheduler', on_elected=_on_elected, on_demoted=_on_demoted)
+
+def get_running_scheduler():
+    """Scheduler of this process, None unless it is the leader"""
+    return _scheduler
+
 def delete_old_job_executions(max_age=604_800):  # 7 days
-    """Delete job execution entries older than `max_age` seconds."""
+    """Delete job execution entries older than `max_age` seconds, chunk by chunk (see JobExecutionRetention)."""
     try:
-        from django_apscheduler.models import DjangoJobExecution
-        DjangoJobExecution.objects.delete_old_job_executions(max_age)
+        from .services.job_retention import JobExecutionRetention
+        JobExecutionRetention().purge(max_age)
         logger.info("Deleted old job executions")
     except Exception as e:
         logger.error(f"Error deleting old job executions: {e}")
 
-def get_scheduler():
-    """Get or create the scheduler instance"""
-    from django_apscheduler.jobstores import register_job, register_events
-    
-    scheduler = BackgroundScheduler(settings.SCHEDULER_CONFIG)
-    register_events(scheduler)
-    register_job(scheduler)
-    
-    return scheduler
-
 def schedule_translation_reminders(translation):
-    """Schedule reminders for a translation based on its type"""
-    scheduler = get_scheduler()
-    job_prefix = f"translation_{translation.id}"
-    
+    """
+    Schedule reminders for a translation based on its type
+
+    Reminders are Reminder rows holding only the translation id, kind and
+    offset; the reminder dispatcher loads the translations due in a tick
+    with one query when they fire.
+    """
+    from .services.document_reminder import DocumentReminderService
+    from .services.meeting_reminder import MeetingReminderService
+
     try:
-        # Remove any existing reminders for this translation
-        existing_jobs = scheduler.get_jobs()
-        for job in existing_jobs:
-            if job.id.startswith(job_prefix):
-                scheduler.remove_job(job.id)
-        
-        # Schedule new reminders based on translation type
+        # Pending reminders of the translation are replaced
         if translation.translation_type == 'DOCUMENT':
-            for days in [7, 3, 1]:
-                reminder_time = translation.deadline - timedelta(days=days)
-                if reminder_time > timezone.now():
-                    scheduler.add_job(
-                        'translation.services.DocumentReminderService.send_document_reminder',
-                        'date',
-                        run_date=reminder_time,
-                        args=[translation.id, days],
-                        id=f"{job_prefix}_doc_{days}days",
-                        replace_existing=True
-                    )
+            count = DocumentReminderService.schedule_document_reminders(translation)
         else:  # Live interpretations
-            for hours in [24, 3, 1]:
-                reminder_time = translation.start_date - timedelta(hours=hours)
-                if reminder_time > timezone.now():
-                    scheduler.add_job(
-                        'translation.services.MeetingReminderService.send_meeting_reminder',
-                        'date',
-                        run_date=reminder_time,
-                        args=[translation.id, hours],
-                        id=f"{job_prefix}_meeting_{hours}hrs",
-                        replace_existing=True
-                    )
+            count = MeetingReminderService.schedule_meeting_reminders(translation)
                     
-        logger.info(f"Successfully scheduled reminders for translation {translation.id}")
+        logger.info(f"Successfully scheduled {count} reminders for translation {translation.id}")
+        return count
         
     except Exception as e:
         logger.error(f"Error scheduling reminders for translation {translation.id}: {e}")
-        raise
\ No newline at end of file
+        raise
@@ -156,4 +156,6 @@ class CalendarService:
 
         email.attach('event_cancellation.ics', 
                     cal.to_ical(), 
-                    'text/calendar; method=CANCEL; charset=UTF-8')
\ No newline at end of file
+                    'text/calendar; method=CANCEL; charset=UTF-8')
+
+        return email.send()
@@ -1,9 +1,8 @@
 from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
 from django.conf import settings
-from django.utils import timezone
-from datetime import timedelta
+from .email_rendering import render_email
+from .reminder_dispatcher import reminder_dispatcher
+from .suppression import suppression_list
 
 class DocumentReminderService:
     @staticmethod
@@ -23,6 +22,10 @@ class DocumentReminderService:
         
         if days_remaining not in template_map:
             return False
+
+        # Do not render for an address that is known to bounce
+        if suppression_list.is_suppressed(translation.translator.email):
+            return 0
             
         context = {
             'translation': translation,
@@ -33,9 +36,8 @@ class DocumentReminderService:
         template_name = template_map[days_remaining]
         subject = subject_map[days_remaining]
         
-        # Render email content
-        html_content = render_to_string(template_name, context)
-        text_content = strip_tags(html_content)
+        # Render email content (compiled templates and plain text are cached)
+        html_content, text_content = render_email(template_name, context)
         
         # Create email
         email = EmailMultiAlternatives(
@@ -50,41 +52,10 @@ class DocumentReminderService:
 
     @staticmethod
     def schedule_document_reminders(translation):
-        """Schedule all reminders for a document translation"""
-        from django_apscheduler.jobstores import DjangoJobStore
-        from apscheduler.schedulers.background import BackgroundScheduler
-        
-        scheduler = BackgroundScheduler()
-        scheduler.add_jobstore(DjangoJobStore(), "default")
-        
-        # Schedule reminders for 7, 3, and 1 day before deadline
-        for days in [7, 3, 1]:
-            reminder_date = translation.deadline - timedelta(days=days)
-            
-            # Only schedule if reminder date is in the future
-            if reminder_date > timezone.now():
-                job_id = f'doc_reminder_{translation.id}_{days}days'
-                
-                scheduler.add_job(
-                    DocumentReminderService.send_document_reminder,
-                    trigger='date',
-                    run_date=reminder_date,
-                    id=job_id,
-                    replace_existing=True,
-                    args=[translation, days]
-                )
+        """Schedule all reminders for a document translation (7, 3 and 1 day before the deadline)"""
+        return reminder_dispatcher.enqueue(translation, 'DOCUMENT', [7, 3, 1], translation.deadline)
 
     @staticmethod
     def cancel_reminders(translation):
         """Cancel all scheduled reminders for a translation"""
-        from apscheduler.schedulers.background import BackgroundScheduler
-        
-        scheduler = BackgroundScheduler()
-        
-        # Remove all jobs related to this translation
-        for days in [7, 3, 1]:
-            job_id = f'doc_reminder_{translation.id}_{days}days'
-            try:
-                scheduler.remove_job(job_id)
-            except:
-                pass
\ No newline at end of file
+        return reminder_dispatcher.cancel([translation.id], 'DOCUMENT')
@@ -0,0 +1,249 @@
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from datetime import timedelta
+from email.mime.base import MIMEBase
+import base64
+import logging
+
+from translations.models import EmailOutbox
+from ..email_backends.circuit_breaker import breaker, is_transport_error
+from .suppression import suppression_list
+import smtplib
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutboxService:
+    """
+    Durable outbox for outgoing mail.
+
+    Request handlers write messages to the EmailOutbox table and return
+    immediately; the delivery worker drains the table in batches over a single
+    SMTP connection.
+    """
+
+    @staticmethod
+    def queue(subject, message, recipient_list, from_email=None, html_message=None, attachments=None):
+        """Queue a message using the same arguments as django.core.mail.send_mail"""
+        email = EmailMultiAlternatives(
+            subject=subject,
+            body=message,
+            from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+            to=recipient_list
+        )
+        if html_message:
+            email.attach_alternative(html_message, "text/html")
+        for attachment in attachments or []:
+            email.attach(*attachment)
+        return EmailOutboxService.queue_message(email)
+
+    @staticmethod
+    def request_delivery():
+        """
+        Ask an email worker to drain the outbox now, for latency-sensitive
+        messages (OTP). Sent once the transaction commits, at the highest
+        priority of the email queue. Without a broker, or if it cannot be
+        reached, the message goes out with the scheduler's next poll.
+        """
+        if not settings.CELERY_BROKER_URL:
+            return
+
+        def dispatch():
+            from celery_tasks.email import deliver_outbox
+            try:
+                # No publish retries: never hold the request on a broker outage
+                deliver_outbox.apply_async(priority=0, retry=False)
+            except Exception as e:
+                logger.warning(f"Could not request outbox delivery, the scheduler will send it: {e}")
+
+        transaction.on_commit(dispatch)
+
+    @staticmethod
+    def queue_message(email):
+        """Queue an already built EmailMessage / EmailMultiAlternatives"""
+        return EmailOutboxService.queue_messages([email])
+
+    @staticmethod
+    def queue_messages(emails):
+        """Queue several messages with a single INSERT; returns the number queued"""
+        rows = [EmailOutboxService._to_row(email) for email in suppression_list.filter_messages(emails)]
+        EmailOutbox.objects.bulk_create(rows)
+        return len(rows)
+
+    @staticmethod
+    def deliver_pending(batch_size=None, connection=None):
+        """
+        Send one batch of due messages over a single reused connection.
+
+        Returns a (sent, failed) tuple.
+        """
+        batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+
+        # Claim the batch so concurrent workers never send the same row twice.
+        # A claim is a lease: rows left in SENDING by a crashed worker become
+        # due again once next_attempt_at has passed.
+        now = timezone.now()
+        with transaction.atomic():
+            ids = list(
+                EmailOutbox.objects.select_for_update(skip_locked=True)
+                .filter(status__in=['PENDING', 'SENDING'], next_attempt_at__lte=now)
+                .order_by('id')
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                return 0, 0
+            EmailOutbox.objects.filter(id__in=ids).update(
+                status='SENDING',
+                next_attempt_at=now + timedelta(minutes=10)
+            )
+
+        # Leave the provider alone while the circuit breaker is open
+        if not breaker.allow_request():
+            EmailOutbox.objects.filter(id__in=ids).update(status='PENDING', next_attempt_at=now)
+            return 0, 0
+
+        rows = list(EmailOutbox.objects.filter(id__in=ids).order_by('id'))
+        connection = connection or get_connection(
+            settings.EMAIL_OUTBOX_BACKEND,
+            timeout=settings.EMAIL_SEND_TIMEOUT
+        )
+
+        sent, failed, dropped, transport_error = [], [], [], None
+        try:
+            connection.open()
+            for row in rows:
+                # Addresses suppressed since the row was queued
+                message = EmailOutboxService._to_message(row, connection)
+                if not suppression_list.filter_message(message):
+                    dropped.append(row.id)
+                    continue
+                try:
+                    # One message per call keeps failures per row while the
+                    # connection stays open for the whole batch
+                    connection.send_messages([message])
+                    sent.append(row.id)
+                except Exception as e:
+                    logger.error(f"Error sending outbox message {row.id}: {e}")
+                    if isinstance(e, smtplib.SMTPRecipientsRefused) and suppression_list.record_refusal(e):
+                        # Permanent refusal: retrying cannot succeed
+                        dropped.append(row.id)
+                        continue
+                    failed.append((row, str(e)))
+                    if is_transport_error(e):
+                        transport_error = e
+                        break
+        except Exception as e:
+            logger.error(f"Error opening mail connection: {e}")
+            transport_error = e
+        finally:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+        if transport_error is not None:
+            breaker.record_failure(transport_error)
+        else:
+            breaker.record_success()
+
+        now = timezone.now()
+        # Rows never attempted because the transport failed go straight back to the queue
+        attempted = set(sent) | set(dropped) | {row.id for row, error in failed}
+        untouched = [row.id for row in rows if row.id not in attempted]
+        if untouched:
+            EmailOutbox.objects.filter(id__in=untouched).update(status='PENDING', next_attempt_at=now)
+        if sent:
+            EmailOutbox.objects.filter(id__in=sent).update(status='SENT', sent_at=now, last_error='')
+        if dropped:
+            EmailOutbox.objects.filter(id__in=dropped).update(
+                status='FAILED', last_error='All recipients are suppressed'
+            )
+        for row, error in failed:
+            row.attempts += 1
+            row.last_error = error
+            if row.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                row.status = 'FAILED'
+            else:
+                row.status = 'PENDING'
+                # Exponential backoff: 1, 2, 4, 8... minutes
+                row.next_attempt_at = now + timedelta(minutes=2 ** (row.attempts - 1))
+            row.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
+
+        logger.info(f"Outbox batch delivered: {len(sent)} sent, {len(failed)} failed, {len(dropped)} suppressed")
+        return len(sent), len(failed) + len(dropped)
+
+    @staticmethod
+    def deliver_all(batch_size=None):
+        """Drain every due message; used by the periodic delivery job"""
+        total_sent = total_failed = 0
+        while True:
+            sent, failed = EmailOutboxService.deliver_pending(batch_size)
+            total_sent += sent
+            total_failed += failed
+            if not sent and not failed:
+                break
+            # Stop when the provider rejects a full batch, retries are backed off
+            if not sent:
+                break
+        return total_sent, total_failed
+
+    @staticmethod
+    def _to_row(email):
+        """Serialize an EmailMessage into an outbox row"""
+        html_body = ''
+        for content, mimetype in getattr(email, 'alternatives', []):
+            if mimetype == 'text/html':
+                html_body = content
+
+        attachments = []
+        for attachment in email.attachments:
+            if isinstance(attachment, MIMEBase):
+                filename = attachment.get_filename()
+                content = attachment.get_payload(decode=True)
+                mimetype = attachment.get_content_type()
+            else:
+                filename, content, mimetype = attachment
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+            attachments.append({
+                'filename': filename,
+                'content': base64.b64encode(content).decode('ascii'),
+                'mimetype': mimetype
+            })
+
+        return EmailOutbox(
+            subject=email.subject,
+            body=email.body,
+            html_body=html_body,
+            from_email=email.from_email or '',
+            recipients=list(email.to),
+            cc=list(email.cc),
+            bcc=list(email.bcc),
+            reply_to=list(email.reply_to),
+            attachments=attachments
+        )
+
+    @staticmethod
+    def _to_message(row, connection=None):
+        """Rebuild the EmailMultiAlternatives stored in an outbox row"""
+        email = EmailMultiAlternatives(
+            subject=row.subject,
+            body=row.body,
+            from_email=row.from_email or None,
+            to=row.recipients,
+            cc=row.cc,
+            bcc=row.bcc,
+            reply_to=row.reply_to,
+            connection=connection
+        )
+        if row.html_body:
+            email.attach_alternative(row.html_body, "text/html")
+        for attachment in row.attachments:
+            email.attach(
+                attachment['filename'],
+                base64.b64decode(attachment['content']),
+                attachment['mimetype']
+            )
+        return email
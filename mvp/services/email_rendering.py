@@ -0,0 +1,70 @@
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+from django.utils.html import strip_tags
+from functools import lru_cache
+
+
+class EmailRenderer:
+    """
+    Process-wide cache for email templates.
+
+    Each template is loaded and compiled once. The existence of a plain-text
+    variant (same name with a .txt extension) is looked up once, and the
+    plain text derived from the HTML with strip_tags is memoized.
+    """
+
+    @staticmethod
+    def render(template_name, context):
+        """Render an email template; returns (html_content, text_content)"""
+        html_content = EmailRenderer.get_template(template_name).render(context)
+
+        text_template = EmailRenderer.get_text_template(template_name)
+        if text_template is not None:
+            text_content = text_template.render(context)
+        else:
+            text_content = ''
+        if not text_content.strip():
+            text_content = EmailRenderer.plain_text(template_name, html_content)
+
+        return html_content, text_content
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_template(template_name):
+        """Compiled template, loaded once per process"""
+        return get_template(template_name)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_text_template(template_name):
+        """Compiled .txt variant of an HTML template, or None when it does not exist"""
+        if not template_name.endswith('.html'):
+            return None
+        try:
+            return get_template(template_name[:-len('.html')] + '.txt')
+        except TemplateDoesNotExist:
+            return None
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def plain_text(template_name, html_content):
+        """
+        Memoized strip_tags.
+
+        The key is the rendered HTML rather than the raw context: contexts hold
+        model instances whose repr does not reflect every rendered field, so
+        the output is the only reliable fingerprint of the context.
+        """
+        return strip_tags(html_content)
+
+    @staticmethod
+    def clear():
+        """Drop every cached template and plain-text rendering"""
+        EmailRenderer.get_template.cache_clear()
+        EmailRenderer.get_text_template.cache_clear()
+        EmailRenderer.plain_text.cache_clear()
+
+
+def render_email(template_name, context):
+    """Shortcut for EmailRenderer.render"""
+    return EmailRenderer.render(template_name, context)
@@ -1,15 +1,15 @@
 from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
 from django.conf import settings
+from .email_outbox import EmailOutboxService
+from .email_rendering import render_email
+from .mail_merge import MailMerge
 
 class EmailService:
     @staticmethod
     def send_html_email(subject, template_name, context, recipient_list):
-        """Base method to send HTML emails"""
-        # Render HTML content
-        html_content = render_to_string(template_name, context)
-        text_content = strip_tags(html_content)
+        """Base method to send HTML emails (queued through the email outbox)"""
+        # Render HTML content and its plain-text version
+        html_content, text_content = render_email(template_name, context)
         
         # Create email
         email = EmailMultiAlternatives(
@@ -21,4 +21,13 @@ class EmailService:
         
         # Attach HTML content
         email.attach_alternative(html_content, "text/html")
-        return email.send()
\ No newline at end of file
+        return EmailOutboxService.queue_message(email)
+
+    @staticmethod
+    def send_merged_email(subject, template_name, context, recipients, merge_fields=()):
+        """
+        Render a template once and queue one personalized message per recipient.
+        recipients is an iterable of (email, {merge_field: value}) pairs.
+        """
+        merge = MailMerge(subject, template_name, context, merge_fields)
+        return EmailOutboxService.queue_messages(merge.messages(recipients))
\ No newline at end of file
@@ -0,0 +1,105 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Max, Min, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from datetime import timedelta
+from django_apscheduler.models import DjangoJobExecution
+import time
+import logging
+
+from translations.models import JobExecutionSummary
+
+logger = logging.getLogger(__name__)
+
+FAILED_STATUSES = [DjangoJobExecution.ERROR, DjangoJobExecution.MISSED, DjangoJobExecution.MAX_INSTANCES]
+
+
+class JobExecutionRetention:
+    """
+    Purges DjangoJobExecution rows older than max_age in primary-key ranges
+
+    Each range of at most JOB_EXECUTION_PURGE_CHUNK_SIZE ids is summarised
+    into JobExecutionSummary (runs, failures and duration per job and day)
+    then deleted in its own short transaction, with a pause between ranges
+    so the scheduler's own writes are never blocked for long.
+    """
+
+    def __init__(self, chunk_size=None, pause=None):
+        self.chunk_size = chunk_size or settings.JOB_EXECUTION_PURGE_CHUNK_SIZE
+        self.pause = settings.JOB_EXECUTION_PURGE_PAUSE_SECONDS if pause is None else pause
+
+    def purge(self, max_age, progress=None):
+        """
+        Args:
+            max_age (int): Age in seconds above which executions are purged
+            progress (callable): Called after each range with
+                (last_id_done, last_id_to_do, deleted_so_far)
+
+        Returns:
+            dict: {'deleted': int, 'chunks': int}
+        """
+        cutoff = timezone.now() - timedelta(seconds=max_age)
+        old = DjangoJobExecution.objects.filter(run_time__lte=cutoff)
+        bounds = old.aggregate(first=Min('id'), last=Max('id'))
+        if bounds['first'] is None:
+            return {'deleted': 0, 'chunks': 0}
+
+        deleted = chunks = 0
+        for start in range(bounds['first'], bounds['last'] + 1, self.chunk_size):
+            end = min(start + self.chunk_size - 1, bounds['last'])
+            deleted += self._purge_range(cutoff, start, end)
+            chunks += 1
+            if progress:
+                progress(end, bounds['last'], deleted)
+            if self.pause and end < bounds['last']:
+                time.sleep(self.pause)
+
+        logger.info(f"Purged {deleted} job executions older than {cutoff:%Y-%m-%d %H:%M} in {chunks} chunks")
+        return {'deleted': deleted, 'chunks': chunks}
+
+    def _purge_range(self, cutoff, start, end):
+        rows = DjangoJobExecution.objects.filter(id__gte=start, id__lte=end, run_time__lte=cutoff)
+        with transaction.atomic():
+            totals = list(
+                rows.annotate(day=TruncDate('run_time'))
+                .values('job_id', 'day')
+                .annotate(
+                    runs=Count('id'),
+                    failures=Count('id', filter=Q(status__in=FAILED_STATUSES)),
+                    timed_runs=Count('duration'),
+                    total_duration=Sum('duration')
+                )
+            )
+            if not totals:
+                return 0
+            self._add_to_summaries(totals)
+            deleted, _ = rows.delete()
+        return deleted
+
+    @staticmethod
+    def _add_to_summaries(totals):
+        keys = {(total['job_id'], total['day']) for total in totals}
+        existing = {
+            (summary.job_id, summary.day): summary
+            for summary in JobExecutionSummary.objects.select_for_update().filter(
+                job_id__in={job_id for job_id, day in keys}, day__in={day for job_id, day in keys}
+            )
+        }
+        created = []
+        for total in totals:
+            duration = float(total['total_duration'] or 0)
+            summary = existing.get((total['job_id'], total['day']))
+            if summary is None:
+                created.append(JobExecutionSummary(
+                    job_id=total['job_id'], day=total['day'], runs=total['runs'], failures=total['failures'],
+                    timed_runs=total['timed_runs'], total_duration=duration
+                ))
+            else:
+                JobExecutionSummary.objects.filter(id=summary.id).update(
+                    runs=F('runs') + total['runs'],
+                    failures=F('failures') + total['failures'],
+                    timed_runs=F('timed_runs') + total['timed_runs'],
+                    total_duration=F('total_duration') + duration
+                )
+        JobExecutionSummary.objects.bulk_create(created)
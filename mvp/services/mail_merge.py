@@ -0,0 +1,59 @@
+from django.core.mail import EmailMultiAlternatives
+from django.conf import settings
+from django.utils.html import escape
+from .email_rendering import render_email
+
+
+class MailMerge:
+    """
+    Render once, personalize per recipient.
+
+    The template is rendered a single time with every merge field replaced by
+    a placeholder token; each recipient's message is then produced by plain
+    string substitution. Merge fields must be output as-is in the template
+    ({{ admin_name }}), not passed through filters or used in conditions.
+    """
+
+    TOKEN = '[[merge:{}]]'
+
+    def __init__(self, subject, template_name, context, merge_fields=(), from_email=None):
+        self.merge_fields = tuple(merge_fields)
+        self.from_email = from_email or settings.DEFAULT_FROM_EMAIL
+
+        shared_context = dict(context)
+        for field in self.merge_fields:
+            shared_context[field] = self.TOKEN.format(field)
+
+        self.subject = subject
+        self.html_content, self.text_content = render_email(template_name, shared_context)
+
+    def message_for(self, email, values=None):
+        """Build the personalized message for one recipient"""
+        values = values or {}
+        subject = self.subject
+        html_content = self.html_content
+        text_content = self.text_content
+        for field in self.merge_fields:
+            token = self.TOKEN.format(field)
+            value = str(values.get(field) or '')
+            subject = subject.replace(token, value)
+            html_content = html_content.replace(token, escape(value))
+            text_content = text_content.replace(token, value)
+
+        message = EmailMultiAlternatives(
+            subject=subject,
+            body=text_content,
+            from_email=self.from_email,
+            to=[email]
+        )
+        message.attach_alternative(html_content, "text/html")
+        return message
+
+    def messages(self, recipients):
+        """
+        One message per recipient, ready for batch delivery
+
+        Args:
+            recipients: iterable of (email, {merge_field: value}) pairs
+        """
+        return [self.message_for(email, values) for email, values in recipients if email]
@@ -1,9 +1,8 @@
 from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
 from django.conf import settings
-from django.utils import timezone
-from datetime import timedelta
+from .email_rendering import render_email
+from .reminder_dispatcher import reminder_dispatcher
+from .suppression import suppression_list
 
 class MeetingReminderService:
     @staticmethod
@@ -23,6 +22,10 @@ class MeetingReminderService:
         
         if hours_remaining not in template_map:
             return False
+
+        # Do not render for an address that is known to bounce
+        if suppression_list.is_suppressed(translation.translator.email):
+            return 0
             
         context = {
             'translation': translation,
@@ -33,9 +36,8 @@ class MeetingReminderService:
         template_name = template_map[hours_remaining]
         subject = subject_map[hours_remaining]
         
-        # Render email content
-        html_content = render_to_string(template_name, context)
-        text_content = strip_tags(html_content)
+        # Render email content (compiled templates and plain text are cached)
+        html_content, text_content = render_email(template_name, context)
         
         # Create email
         email = EmailMultiAlternatives(
@@ -50,45 +52,13 @@ class MeetingReminderService:
 
     @staticmethod
     def schedule_meeting_reminders(translation):
-        """Schedule all reminders for an interpretation session"""
-        from django_apscheduler.jobstores import DjangoJobStore
-        from apscheduler.schedulers.background import BackgroundScheduler
-        
-        scheduler = BackgroundScheduler()
-        scheduler.add_jobstore(DjangoJobStore(), "default")
-        
+        """Schedule all reminders for an interpretation session (24, 3 and 1 hour before it starts)"""
         # Only schedule if start_date is set
         if not translation.start_date:
-            return
-        
-        # Schedule reminders for 24, 3, and 1 hour before session
-        for hours in [24, 3, 1]:
-            reminder_time = translation.start_date - timedelta(hours=hours)
-            
-            # Only schedule if reminder time is in the future
-            if reminder_time > timezone.now():
-                job_id = f'meeting_reminder_{translation.id}_{hours}h'
-                
-                scheduler.add_job(
-                    MeetingReminderService.send_meeting_reminder,
-                    trigger='date',
-                    run_date=reminder_time,
-                    id=job_id,
-                    replace_existing=True,
-                    args=[translation, hours]
-                )
+            return 0
+        return reminder_dispatcher.enqueue(translation, 'MEETING', [24, 3, 1], translation.start_date)
 
     @staticmethod
     def cancel_reminders(translation):
         """Cancel all scheduled reminders for a session"""
-        from apscheduler.schedulers.background import BackgroundScheduler
-        
-        scheduler = BackgroundScheduler()
-        
-        # Remove all jobs related to this translation
-        for hours in [24, 3, 1]:
-            job_id = f'meeting_reminder_{translation.id}_{hours}h'
-            try:
-                scheduler.remove_job(job_id)
-            except:
-                pass
\ No newline at end of file
+        return reminder_dispatcher.cancel([translation.id], 'MEETING')
@@ -1,10 +1,16 @@
 from django.contrib.auth import get_user_model
 from django.conf import settings
-from .email_service import EmailService
+from translations.services.channels import ChannelRouter
 
 User = get_user_model()
 
 class AcceptanceNotificationService:
+    """
+    Acceptance notifications, routed by ChannelRouter so each recipient's
+    NotificationPreference decides between an immediate email, their next
+    digest, an SMS or nothing
+    """
+
     @staticmethod
     def send_all_notifications(translation):
         """Send notifications to all relevant parties"""
@@ -21,20 +27,24 @@ class AcceptanceNotificationService:
     @staticmethod
     def _notify_admin(translation):
         """Send notification to admin"""
-        # Get all admin users
-        admin_users = User.objects.filter(is_staff=True)
-        
+        translator_name = translation.translator.get_full_name() or translation.translator.username
         context = {
             'translation': translation,
-            'translator_name': translation.translator.get_full_name() or translation.translator.username,
+            'translator_name': translator_name,
             'client_name': translation.client.get_full_name() or translation.client.username if translation.client else 'No client'
         }
         
-        EmailService.send_html_email(
-            subject=f'Translation Request Accepted: {translation.title}',
-            template_name='emails/admin_translation_accepted.html',
-            context=context,
-            recipient_list=[user.email for user in admin_users]
+        # Every staff member in one batch: rendered once, preferences loaded in one query
+        ChannelRouter().send(
+            User.objects.filter(is_staff=True),
+            'SYSTEM',
+            title=f'Translation Request Accepted: {translation.title}',
+            message=f'{translator_name} accepted "{translation.title}".',
+            link=f'/admin/translations/{translation.id}/',
+            channels=(ChannelRouter.EMAIL,),
+            email_template='emails/admin_translation_accepted.html',
+            email_context=context,
+            translation=translation
         )
     
     @staticmethod
@@ -45,11 +55,16 @@ class AcceptanceNotificationService:
             'translator_name': translation.translator.get_full_name() or translation.translator.username
         }
         
-        EmailService.send_html_email(
-            subject=f'Translation Assignment Confirmation: {translation.title}',
-            template_name='emails/translator_confirmation.html',
-            context=context,
-            recipient_list=[translation.translator.email]
+        ChannelRouter().send(
+            [translation.translator],
+            'PROGRESS',
+            title=f'Translation Assignment Confirmation: {translation.title}',
+            message=f'You are assigned to "{translation.title}".',
+            link=f'/translator/translations/{translation.id}/',
+            channels=(ChannelRouter.EMAIL, ChannelRouter.SMS),
+            email_template='emails/translator_confirmation.html',
+            email_context=context,
+            translation=translation
         )
     
     @staticmethod
@@ -61,9 +76,14 @@ class AcceptanceNotificationService:
             'translator_name': translation.translator.get_full_name() or translation.translator.username
         }
         
-        EmailService.send_html_email(
-            subject=f'Your Translation Request Has Been Accepted: {translation.title}',
-            template_name='emails/client_translation_accepted.html',
-            context=context,
-            recipient_list=[translation.client.email]
-        )
\ No newline at end of file
+        ChannelRouter().send(
+            [translation.client],
+            'PROGRESS',
+            title=f'Your Translation Request Has Been Accepted: {translation.title}',
+            message=f'A translator accepted "{translation.title}".',
+            link=f'/client/translations/{translation.id}/',
+            channels=(ChannelRouter.EMAIL, ChannelRouter.SMS),
+            email_template='emails/client_translation_accepted.html',
+            email_context=context,
+            translation=translation
+        )
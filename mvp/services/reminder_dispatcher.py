@@ -0,0 +1,260 @@
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+from datetime import timedelta
+import heapq
+import threading
+import logging
+
+from translations.models import Reminder, ReminderLedger, TranslationRequest
+
+logger = logging.getLogger(__name__)
+
+
+class ReminderDispatcher:
+    """
+    Single long-lived thread that sends Reminder rows when they fall due
+
+    Due times of the reminders firing before the next refresh are kept in a
+    heap, so the thread sleeps exactly until the earliest one; reminders
+    enqueued in this process are pushed onto the heap (and wake the thread)
+    when their transaction commits. Rows written by other processes are
+    picked up by the refresh query every REMINDER_REFRESH_SECONDS, which
+    only reads the (fire_at, status) index.
+
+    A reminder is claimed with a conditional UPDATE before it is sent, so
+    several dispatchers never send the same row twice. Rows left in SENDING
+    by a crashed process are claimed again after REMINDER_CLAIM_TIMEOUT_SECONDS.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._queued = set()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopping = False
+        self._next_refresh = None
+
+    # Scheduling
+
+    def enqueue(self, translation, kind, offsets, anchor):
+        """
+        Replace the pending reminders of one kind for a translation
+
+        Args:
+            translation (TranslationRequest): Translation the reminders are about
+            kind (str): 'DOCUMENT' or 'MEETING'
+            offsets (list): Days (documents) or hours (meetings) before `anchor`
+            anchor (datetime): Deadline or session start
+
+        Returns:
+            int: Number of reminders created (past due times are skipped)
+        """
+        now = timezone.now()
+        unit = 'days' if kind == 'DOCUMENT' else 'hours'
+        reminders = [
+            Reminder(translation=translation, kind=kind, offset=offset,
+                     fire_at=anchor - timedelta(**{unit: offset}))
+            for offset in offsets
+        ]
+        reminders = [reminder for reminder in reminders if reminder.fire_at > now]
+
+        with transaction.atomic():
+            self.cancel([translation.id], kind)
+            Reminder.objects.bulk_create(reminders)
+
+        # bulk_create does not return ids on every backend, read them back
+        created = list(
+            Reminder.objects.filter(translation=translation, kind=kind, status='PENDING')
+            .values_list('fire_at', 'id')
+        )
+        transaction.on_commit(lambda: self.push(created))
+        return len(reminders)
+
+    def cancel(self, translation_ids, kind=None):
+        """
+        Cancel the pending reminders of several translations with one UPDATE.
+        Heap entries of cancelled rows are dropped when they come up.
+
+        Returns:
+            int: Number of reminders cancelled
+        """
+        reminders = Reminder.objects.filter(translation_id__in=translation_ids, status='PENDING')
+        if kind:
+            reminders = reminders.filter(kind=kind)
+        return reminders.update(status='CANCELLED')
+
+    def push(self, entries):
+        """Add (fire_at, id) pairs to the heap if they fall before the next refresh"""
+        if self._thread is None:
+            return
+        with self._condition:
+            head = self._heap[0][0] if self._heap else None
+            for fire_at, reminder_id in entries:
+                if reminder_id in self._queued:
+                    continue
+                if self._next_refresh is not None and fire_at > self._next_refresh:
+                    continue
+                heapq.heappush(self._heap, (fire_at, reminder_id))
+                self._queued.add(reminder_id)
+            if self._heap and (head is None or self._heap[0][0] < head):
+                self._condition.notify()
+
+    # Thread
+
+    def start(self):
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name='reminder-dispatcher', daemon=True)
+            self._thread.start()
+        logger.info("Reminder dispatcher started")
+
+    def stop(self, timeout=None):
+        with self._condition:
+            thread, self._thread = self._thread, None
+            self._stopping = True
+            self._condition.notify()
+        if thread is not None:
+            thread.join(timeout)
+        self._heap, self._queued, self._next_refresh = [], set(), None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def queued(self):
+        """Reminders waiting in the heap"""
+        return len(self._heap)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if self._stopping:
+                    return
+                now = timezone.now()
+                if self._next_refresh is None or now >= self._next_refresh:
+                    wait = 0
+                else:
+                    due = self._heap[0][0] if self._heap else self._next_refresh
+                    wait = (min(due, self._next_refresh) - now).total_seconds()
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+
+            try:
+                if self._next_refresh is None or timezone.now() >= self._next_refresh:
+                    self.refresh()
+                self.dispatch_due()
+            except Exception as e:
+                logger.error(f"Reminder dispatcher error: {e}", exc_info=True)
+                with self._condition:
+                    self._condition.wait(settings.REMINDER_REFRESH_SECONDS)
+            finally:
+                close_old_connections()
+
+    def refresh(self):
+        """Load the reminders falling due before the next refresh onto the heap"""
+        now = timezone.now()
+        next_refresh = now + timedelta(seconds=settings.REMINDER_REFRESH_SECONDS)
+        stale = now - timedelta(seconds=settings.REMINDER_CLAIM_TIMEOUT_SECONDS)
+        due = list(
+            Reminder.objects.filter(fire_at__lte=next_refresh, status='PENDING')
+            .values_list('fire_at', 'id')
+        )
+        due += Reminder.objects.filter(status='SENDING', claimed_at__lt=stale).values_list('fire_at', 'id')
+        with self._condition:
+            self._next_refresh = next_refresh
+        self.push(due)
+
+    def dispatch_due(self):
+        """
+        Send every heap entry whose time has come, one batch per query
+
+        Returns:
+            int: Number of reminders sent
+        """
+        now = timezone.now()
+        ids = []
+        with self._condition:
+            while self._heap and self._heap[0][0] <= now and len(ids) < settings.REMINDER_BATCH_SIZE:
+                fire_at, reminder_id = heapq.heappop(self._heap)
+                self._queued.discard(reminder_id)
+                ids.append(reminder_id)
+        if not ids:
+            return 0
+        return self.send(ids)
+
+    def send(self, ids):
+        """Claim and send reminders by id; rows cancelled or claimed elsewhere are skipped"""
+        now = timezone.now()
+        stale = now - timedelta(seconds=settings.REMINDER_CLAIM_TIMEOUT_SECONDS)
+        with transaction.atomic():
+            claimable = (
+                Reminder.objects.select_for_update(skip_locked=True)
+                .filter(id__in=ids, fire_at__lte=now)
+                .filter(Q(status='PENDING') | Q(status='SENDING', claimed_at__lt=stale))
+            )
+            claimed = list(claimable.values_list('id', flat=True))
+            Reminder.objects.filter(id__in=claimed).update(status='SENDING', claimed_at=now)
+
+        reminders = Reminder.objects.filter(id__in=claimed).select_related(
+            'translation', 'translation__translator', 'translation__source_language', 'translation__target_language'
+        )
+        sent = 0
+        for reminder in reminders:
+            if self._send_one(reminder):
+                sent += 1
+        if claimed:
+            logger.info(f"Reminder dispatcher: {sent}/{len(claimed)} reminders sent")
+        return sent
+
+    def _send_one(self, reminder):
+        from .document_reminder import DocumentReminderService
+        from .meeting_reminder import MeetingReminderService
+
+        translation = reminder.translation
+        anchor = translation.deadline if reminder.kind == 'DOCUMENT' else translation.start_date
+        if (
+            translation.status not in TranslationRequest.ACTIVE_STATUSES
+            or anchor is None
+            or not ReminderLedger.claim(translation.id, reminder.kind, reminder.offset, anchor)
+        ):
+            # Work finished or cancelled, nothing to remind of, or already sent by the periodic check (mvp.tasks)
+            reminder.status = 'CANCELLED'
+            reminder.save(update_fields=['status'])
+            return False
+
+        try:
+            if translation.translator_id is None:
+                raise ValueError("Translation has no translator")
+            if reminder.kind == 'DOCUMENT':
+                DocumentReminderService.send_document_reminder(translation, reminder.offset)
+            else:
+                MeetingReminderService.send_meeting_reminder(translation, reminder.offset)
+        except Exception as e:
+            ReminderLedger.release(translation.id, reminder.kind, reminder.offset, anchor)
+            reminder.attempts += 1
+            reminder.last_error = str(e)
+            if reminder.attempts >= settings.REMINDER_MAX_ATTEMPTS:
+                reminder.status = 'FAILED'
+            else:
+                reminder.status = 'PENDING'
+                reminder.fire_at = timezone.now() + timedelta(minutes=2 ** reminder.attempts)
+            reminder.save(update_fields=['attempts', 'last_error', 'status', 'fire_at'])
+            logger.error(f"Error sending reminder {reminder.id} for translation {translation.id}: {e}")
+            if reminder.status == 'PENDING':
+                self.push([(reminder.fire_at, reminder.id)])
+            return False
+
+        reminder.status = 'SENT'
+        reminder.sent_at = timezone.now()
+        reminder.attempts += 1
+        reminder.save(update_fields=['status', 'sent_at', 'attempts'])
+        return True
+
+
+reminder_dispatcher = ReminderDispatcher()
@@ -0,0 +1,142 @@
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from email.utils import parseaddr
+import threading
+import time
+import logging
+
+from translations.models import SuppressedRecipient
+
+logger = logging.getLogger(__name__)
+
+
+def normalize(address):
+    """Bare lowercased address from 'Name <user@host>' or 'user@host'"""
+    return parseaddr(address or '')[1].strip().lower()
+
+
+class SuppressionList:
+    """
+    In-process copy of the SuppressedRecipient table.
+
+    The whole set of addresses is loaded with one query and reloaded once it
+    is older than EMAIL_SUPPRESSION_CACHE_SECONDS, so checking recipients on
+    every send costs a set lookup. Writes made through this process
+    invalidate it immediately (see mvp.signals); other processes pick them up
+    on their next refresh.
+    """
+
+    def __init__(self):
+        self._addresses = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def addresses(self):
+        ttl = getattr(settings, 'EMAIL_SUPPRESSION_CACHE_SECONDS', 300)
+        addresses = self._addresses
+        if addresses is None or time.monotonic() - self._loaded_at > ttl:
+            addresses = self.refresh()
+        return addresses
+
+    def refresh(self):
+        with self._lock:
+            try:
+                addresses = frozenset(SuppressedRecipient.objects.values_list('email', flat=True))
+            except Exception as e:
+                # Never block mail because the table cannot be read
+                logger.error(f"Could not load the suppression list: {e}")
+                addresses = self._addresses or frozenset()
+            self._addresses = addresses
+            self._loaded_at = time.monotonic()
+        return addresses
+
+    def invalidate(self):
+        self._addresses = None
+
+    def is_suppressed(self, address):
+        return normalize(address) in self.addresses
+
+    def filter(self, addresses):
+        """Addresses of the list that may still be mailed, order preserved"""
+        suppressed = self.addresses
+        if not suppressed:
+            return list(addresses)
+        return [address for address in addresses if normalize(address) not in suppressed]
+
+    def filter_message(self, message):
+        """
+        Drop suppressed addresses from to/cc/bcc of an EmailMessage in place.
+
+        Returns:
+            bool: False when no recipient is left and the message must not be sent
+        """
+        suppressed = self.addresses
+        if suppressed:
+            removed = [address for address in message.recipients() if normalize(address) in suppressed]
+            if removed:
+                message.to = self.filter(message.to)
+                message.cc = self.filter(message.cc)
+                message.bcc = self.filter(message.bcc)
+                logger.info(f"Skipped suppressed recipient(s) {', '.join(removed)} for '{message.subject}'")
+        return bool(message.recipients())
+
+    def filter_messages(self, messages):
+        """Messages that still have at least one recipient"""
+        return [message for message in messages if self.filter_message(message)]
+
+    def suppress(self, addresses, reason='HARD_BOUNCE', detail='', source=''):
+        """
+        Add addresses to the table, or bump bounce_count when already present
+
+        Returns:
+            int: Number of newly suppressed addresses
+        """
+        addresses = {normalize(address) for address in addresses} - {''}
+        if not addresses:
+            return 0
+        now = timezone.now()
+        existing = set(
+            SuppressedRecipient.objects.filter(email__in=addresses).values_list('email', flat=True)
+        )
+        if existing:
+            SuppressedRecipient.objects.filter(email__in=existing).update(
+                bounce_count=F('bounce_count') + 1,
+                last_seen_at=now
+            )
+        SuppressedRecipient.objects.bulk_create(
+            [SuppressedRecipient(email=address, reason=reason, detail=detail[:2000],
+                                 source=source, last_seen_at=now)
+             for address in addresses - existing],
+            ignore_conflicts=True
+        )
+        # bulk_create and update() send no signals
+        self.invalidate()
+        created = len(addresses - existing)
+        if created:
+            logger.warning(f"Suppressed {created} address(es) ({reason}): {', '.join(sorted(addresses - existing))}")
+        return created
+
+    def record_refusal(self, error, source='smtp'):
+        """
+        Suppress the recipients of an SMTPRecipientsRefused that were refused
+        permanently (5xx); temporary (4xx) refusals are left to the retries
+
+        Returns:
+            bool: True when every refused recipient was refused permanently
+        """
+        refused = getattr(error, 'recipients', None) or {}
+        permanent = {}
+        for address, response in refused.items():
+            code, message = response if isinstance(response, tuple) else (0, response)
+            if 500 <= int(code) < 600:
+                if isinstance(message, bytes):
+                    message = message.decode('utf-8', 'replace')
+                permanent[address] = f"{code} {message}"
+        for address, detail in permanent.items():
+            self.suppress([address], reason='REJECTED', detail=detail, source=source)
+        return bool(refused) and len(permanent) == len(refused)
+
+
+suppression_list = SuppressionList()
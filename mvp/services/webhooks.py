@@ -0,0 +1,295 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
+from datetime import timedelta
+from urllib import error as urllib_error, parse as urllib_parse, request as urllib_request
+import hashlib
+import hmac
+import ipaddress
+import json
+import socket
+import time
+import logging
+
+from translations.models import ClientWebhook, WebhookDelivery
+
+logger = logging.getLogger(__name__)
+
+STATUS_CHANGED = 'translation.status_changed'
+SIGNATURE_HEADER = 'X-Webhook-Signature'
+
+
+def sign(secret, timestamp, body):
+    """HMAC-SHA256 of "<timestamp>.<body>" with the endpoint secret"""
+    message = f'{timestamp}.'.encode('utf-8') + body
+    return hmac.new(secret.encode('utf-8'), message, hashlib.sha256).hexdigest()
+
+
+def verify_signature(secret, header, body, tolerance=300):
+    """
+    Check a "t=<timestamp>,v1=<signature>" header; what a receiver should do.
+    Requests older than `tolerance` seconds are rejected to prevent replays.
+    """
+    try:
+        parts = dict(part.split('=', 1) for part in header.split(','))
+        timestamp = int(parts['t'])
+        signature = parts['v1']
+    except (KeyError, ValueError, AttributeError):
+        return False
+    if tolerance and abs(time.time() - timestamp) > tolerance:
+        return False
+    return hmac.compare_digest(sign(secret, timestamp, body), signature)
+
+
+def check_destination(url):
+    """
+    Refuse URLs whose host resolves to a loopback, private, link-local,
+    reserved or multicast address, so clients cannot make the server call
+    its own network (metadata endpoints, internal services).
+
+    Raises:
+        ValidationError: Unresolvable host or non-public address
+    """
+    if settings.WEBHOOK_ALLOW_PRIVATE_ADDRESSES:
+        return
+    parsed = urllib_parse.urlsplit(url)
+    if not parsed.hostname:
+        raise ValidationError("Webhook URL has no host")
+    try:
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        addresses = {info[4][0] for info in socket.getaddrinfo(parsed.hostname, port, proto=socket.IPPROTO_TCP)}
+    except (OSError, ValueError) as e:
+        raise ValidationError(f"Cannot resolve webhook host {parsed.hostname}: {e}")
+    for address in addresses:
+        ip = ipaddress.ip_address(address.split('%', 1)[0])
+        if getattr(ip, 'ipv4_mapped', None):
+            ip = ip.ipv4_mapped
+        if not ip.is_global or ip.is_multicast:
+            raise ValidationError(f"Webhook host {parsed.hostname} resolves to a non-public address")
+
+
+def _build_opener():
+    """urllib opener without HTTPRedirectHandler (or proxies): a 3xx is an HTTPError"""
+    opener = urllib_request.OpenerDirector()
+    for handler in (urllib_request.HTTPHandler, urllib_request.HTTPSHandler,
+                    urllib_request.HTTPDefaultErrorHandler, urllib_request.HTTPErrorProcessor):
+        opener.add_handler(handler())
+    return opener
+
+
+opener = _build_opener()
+
+
+class WebhookService:
+    """
+    Persistent, batched delivery of status changes to client webhooks.
+
+    Status changes are written to WebhookDelivery in the same transaction as
+    the change itself. The delivery worker claims due rows, groups them per
+    endpoint and POSTs up to WEBHOOK_BATCH_SIZE events in one signed request.
+    Failed batches are retried with exponential backoff until
+    WEBHOOK_MAX_ATTEMPTS, and every request updates the endpoint's metrics.
+    """
+
+    @staticmethod
+    def enqueue_status_change(translation, previous_status):
+        """Queue a status_changed event for each interested endpoint of the client"""
+        return WebhookService.enqueue_status_changes([translation], previous_status)
+
+    @staticmethod
+    def enqueue_status_changes(translations, previous_status):
+        """
+        Same for several translations that left the same status, e.g. after a
+        bulk UPDATE: one query for the endpoints, one INSERT for the events
+        """
+        client_ids = {translation.client_id for translation in translations if translation.client_id}
+        if not client_ids:
+            return 0
+        webhooks_by_client = {}
+        for webhook in ClientWebhook.objects.filter(client_id__in=client_ids, is_active=True):
+            webhooks_by_client.setdefault(webhook.client_id, []).append(webhook)
+        if not webhooks_by_client:
+            return 0
+
+        deliveries = []
+        for translation in translations:
+            payload = {
+                'translation_id': translation.id,
+                'title': translation.title,
+                'status': translation.status,
+                'previous_status': previous_status,
+                'occurred_at': (translation.updated_at or timezone.now()).isoformat()
+            }
+            deliveries.extend(
+                WebhookDelivery(webhook=webhook, event=STATUS_CHANGED, payload=payload)
+                for webhook in webhooks_by_client.get(translation.client_id, ())
+                if webhook.wants(translation.status)
+            )
+        WebhookDelivery.objects.bulk_create(deliveries)
+        return len(deliveries)
+
+    @staticmethod
+    def deliver_pending(limit=None):
+        """
+        Claim due events and send them, one request per endpoint batch.
+
+        Returns a (delivered, failed) tuple counted in events.
+        """
+        limit = limit or settings.WEBHOOK_CLAIM_SIZE
+        now = timezone.now()
+        with transaction.atomic():
+            # Same lease as the email outbox: rows left in SENDING by a
+            # crashed worker are due again once next_attempt_at has passed.
+            # An event waits while an older one for its endpoint is still
+            # undelivered (backing off, or claimed by another worker), so
+            # each endpoint receives its events in order across retries.
+            waiting = WebhookDelivery.objects.filter(
+                webhook=OuterRef('webhook'), id__lt=OuterRef('id'),
+                status__in=['PENDING', 'SENDING'], next_attempt_at__gt=now
+            )
+            due = WebhookDelivery.objects.filter(
+                status__in=['PENDING', 'SENDING'], next_attempt_at__lte=now
+            ).filter(~Exists(waiting))
+            # Endpoints are claimed whole: one worker at a time per endpoint
+            webhook_ids = list(
+                ClientWebhook.objects.select_for_update(skip_locked=True)
+                .filter(id__in=due.values('webhook_id'))
+                .values_list('id', flat=True)
+            )
+            ids = list(
+                due.select_for_update(skip_locked=True)
+                .filter(webhook_id__in=webhook_ids)
+                .order_by('id')
+                .values_list('id', flat=True)[:limit]
+            )
+            if not ids:
+                return 0, 0
+            WebhookDelivery.objects.filter(id__in=ids).update(
+                status='SENDING',
+                next_attempt_at=now + timedelta(minutes=10)
+            )
+
+        by_webhook = {}
+        for delivery in WebhookDelivery.objects.filter(id__in=ids).select_related('webhook').order_by('id'):
+            by_webhook.setdefault(delivery.webhook_id, []).append(delivery)
+
+        delivered = failed = 0
+        batch_size = settings.WEBHOOK_BATCH_SIZE
+        for deliveries in by_webhook.values():
+            webhook = deliveries[0].webhook
+            for start in range(0, len(deliveries), batch_size):
+                batch = deliveries[start:start + batch_size]
+                if WebhookService._send_batch(webhook, batch):
+                    delivered += len(batch)
+                else:
+                    failed += len(batch)
+                    # Keep the endpoint's events in order: retry the rest with this batch
+                    rest = deliveries[start + batch_size:]
+                    if rest:
+                        WebhookDelivery.objects.filter(id__in=[d.id for d in rest]).update(
+                            status='PENDING',
+                            next_attempt_at=batch[0].next_attempt_at
+                        )
+                    break
+
+        logger.info(f"Webhook deliveries: {delivered} delivered, {failed} failed")
+        return delivered, failed
+
+    @staticmethod
+    def deliver_all():
+        """Drain every due event; used by the periodic delivery job"""
+        total_delivered = total_failed = 0
+        while True:
+            delivered, failed = WebhookService.deliver_pending()
+            total_delivered += delivered
+            total_failed += failed
+            if not delivered:
+                break
+        return total_delivered, total_failed
+
+    @staticmethod
+    def build_request(webhook, deliveries, timestamp=None):
+        """Body and headers of one signed batch request"""
+        timestamp = timestamp or int(time.time())
+        body = json.dumps({
+            'events': [
+                {
+                    'id': str(delivery.event_id),
+                    'type': delivery.event,
+                    'attempt': delivery.attempts + 1,
+                    'data': delivery.payload
+                }
+                for delivery in deliveries
+            ]
+        }, separators=(',', ':')).encode('utf-8')
+        headers = {
+            'Content-Type': 'application/json',
+            'User-Agent': 'TranslationPlatform-Webhooks/1.0',
+            SIGNATURE_HEADER: f't={timestamp},v1={sign(webhook.secret, timestamp, body)}'
+        }
+        return body, headers
+
+    @staticmethod
+    def _send_batch(webhook, deliveries):
+        body, headers = WebhookService.build_request(webhook, deliveries)
+        status_code, error = None, ''
+        started = time.monotonic()
+        try:
+            # Checked again before every request: DNS may have changed since registration
+            check_destination(webhook.url)
+            http_request = urllib_request.Request(webhook.url, data=body, headers=headers, method='POST')
+            with opener.open(http_request, timeout=settings.WEBHOOK_TIMEOUT_SECONDS) as response:
+                status_code = response.status
+        except urllib_error.HTTPError as e:
+            status_code = e.code
+            error = f'HTTP {e.code}'
+        except ValidationError as e:
+            error = e.messages[0]
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+        latency_ms = int((time.monotonic() - started) * 1000)
+
+        now = timezone.now()
+        ok = status_code is not None and 200 <= status_code < 300
+        ids = [delivery.id for delivery in deliveries]
+        if ok:
+            WebhookDelivery.objects.filter(id__in=ids).update(
+                status='SENT', delivered_at=now, response_status=status_code,
+                attempts=F('attempts') + 1, last_error=''
+            )
+            ClientWebhook.objects.filter(id=webhook.id).update(
+                total_requests=F('total_requests') + 1,
+                total_events=F('total_events') + len(deliveries),
+                total_latency_ms=F('total_latency_ms') + latency_ms,
+                consecutive_failures=0,
+                last_status_code=status_code,
+                last_success_at=now
+            )
+            return True
+
+        logger.warning(f"Webhook {webhook.id} delivery failed ({len(deliveries)} events): {error}")
+        for delivery in deliveries:
+            delivery.attempts += 1
+            delivery.last_error = error
+            delivery.response_status = status_code
+            if delivery.attempts >= settings.WEBHOOK_MAX_ATTEMPTS:
+                delivery.status = 'FAILED'
+            else:
+                delivery.status = 'PENDING'
+                # Exponential backoff: 1, 2, 4, 8... minutes
+                delivery.next_attempt_at = now + timedelta(minutes=2 ** (delivery.attempts - 1))
+        WebhookDelivery.objects.bulk_update(
+            deliveries, ['attempts', 'last_error', 'response_status', 'status', 'next_attempt_at']
+        )
+        ClientWebhook.objects.filter(id=webhook.id).update(
+            total_requests=F('total_requests') + 1,
+            total_failures=F('total_failures') + 1,
+            total_latency_ms=F('total_latency_ms') + latency_ms,
+            consecutive_failures=F('consecutive_failures') + 1,
+            last_status_code=status_code,
+            last_failure_at=now,
+            last_error=error[:1000]
+        )
+        return False
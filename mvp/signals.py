@@ -0,0 +1,75 @@
+# signals.py
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+from translations.models import Notification, NotificationPreference, SuppressedRecipient, TranslationRequest
+from translations.services.channels import preference_cache
+from .realtime import hub, publish_notifications
+from .services.reminder_dispatcher import reminder_dispatcher
+from .services.suppression import suppression_list
+from .services.webhooks import WebhookService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=Notification)
+def push_notification(sender, instance, created, **kwargs):
+    """Push new in-app notifications to the user's open event streams"""
+    if created:
+        publish_notifications([instance])
+
+
+@receiver(post_init, sender=TranslationRequest)
+def remember_translation_status(sender, instance, **kwargs):
+    # __dict__ so that a deferred status never triggers a query
+    instance._loaded_status = instance.__dict__.get('status')
+
+
+@receiver(post_save, sender=TranslationRequest)
+def cancel_finished_reminders(sender, instance, created, **kwargs):
+    """Pending reminders are dropped once the translation is completed, rejected or cancelled"""
+    active = TranslationRequest.ACTIVE_STATUSES
+    if not created and instance._loaded_status in active and instance.status not in active:
+        reminder_dispatcher.cancel([instance.id])
+
+
+@receiver(post_save, sender=TranslationRequest)
+def push_status_change(sender, instance, created, **kwargs):
+    """Push TranslationRequest status changes to the client and the translator"""
+    previous_status = None if created else instance._loaded_status
+    transition = not created and previous_status is not None and previous_status != instance.status
+    if transition:
+        # Written in the same transaction as the change, delivered by the webhook worker
+        WebhookService.enqueue_status_change(instance, previous_status)
+    if created or transition:
+        publish_status_change(instance, previous_status)
+    instance._loaded_status = instance.status
+
+
+def publish_status_change(translation, previous_status):
+    """Status event for the open streams of the client and the translator, sent on commit"""
+    hub.publish_on_commit(
+        [translation.client_id, translation.translator_id],
+        'status',
+        {
+            'id': translation.id,
+            'title': translation.title,
+            'status': translation.status,
+            'status_display': translation.get_status_display(),
+            'previous_status': previous_status,
+            'updated_at': translation.updated_at.isoformat() if translation.updated_at else None
+        }
+    )
+
+
+@receiver(post_save, sender=SuppressedRecipient)
+@receiver(post_delete, sender=SuppressedRecipient)
+def invalidate_suppression_list(sender, **kwargs):
+    """Admin edits take effect in this process without waiting for the refresh"""
+    suppression_list.invalidate()
+
+
+@receiver(post_save, sender=NotificationPreference)
+@receiver(post_delete, sender=NotificationPreference)
+def invalidate_notification_preference(sender, instance, **kwargs):
+    preference_cache.invalidate(instance.user_id)
@@ -0,0 +1,8 @@
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+def get_sms_backend(backend=None, **kwargs):
+    """Instantiate the SMS backend named by SMS_BACKEND (same idea as mail's get_connection)"""
+    klass = import_string(backend or getattr(settings, 'SMS_BACKEND', 'mvp.sms_backends.console.SMSBackend'))
+    return klass(**kwargs)
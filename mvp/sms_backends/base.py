@@ -0,0 +1,13 @@
+class BaseSMSBackend:
+    """
+    Base class for SMS backends.
+
+    Subclasses implement send_messages(messages), where messages is a list of
+    (phone_number, text) tuples, and return the number of messages sent.
+    """
+
+    def __init__(self, fail_silently=False, **kwargs):
+        self.fail_silently = fail_silently
+
+    def send_messages(self, messages):
+        raise NotImplementedError('subclasses of BaseSMSBackend must override send_messages()')
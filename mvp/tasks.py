@@ -1,149 +1,171 @@
 # tasks.py
-from django.core.mail import send_mail
 from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
-from django_apscheduler.models import DjangoJobExecution
-from apscheduler.schedulers.background import BackgroundScheduler
-from translations.models import TranslationRequest
+from django.db.models import Q
+from translations.models import ReminderLedger, TranslationRequest
 import logging
 
 logger = logging.getLogger(__name__)
 
-def clean_old_jobs(max_age=7):
+def clean_old_jobs(max_age=7, progress=None, chunk_size=None, pause=None):
     """
-    Delete job executions and job records older than `max_age` days.
+    Delete job executions older than `max_age` days, in bounded primary-key
+    ranges, after rolling them up into daily JobExecutionSummary rows.
     """
+    from .services.job_retention import JobExecutionRetention
+
     try:
-        # Delete old job executions
-        DjangoJobExecution.objects.delete_old_job_executions(max_age * 86400)  # max_age in days to seconds
+        # max_age in days to seconds
+        result = JobExecutionRetention(chunk_size, pause).purge(max_age * 86400, progress=progress)
         logger.info(f"Cleaned job executions older than {max_age} days")
+        return result
     except Exception as e:
         logger.error(f"Error cleaning old jobs: {e}")
 
-def check_upcoming_translations():
+def deliver_email_outbox():
     """
-    Check for upcoming translations and send reminders
+    Drain the email outbox over pooled SMTP connections
     """
+    from .services.email_outbox import EmailOutboxService
+
     try:
-        # Get all active translations
-        active_translations = TranslationRequest.objects.filter(
-            status__in=['ASSIGNED', 'IN_PROGRESS']
-        )
+        sent, failed = EmailOutboxService.deliver_all()
+        if sent or failed:
+            logger.info(f"Email outbox delivery: {sent} sent, {failed} failed")
+    except Exception as e:
+        logger.error(f"Error delivering email outbox: {e}")
 
-        for translation in active_translations:
-            check_and_send_reminders(translation)
+def flush_notification_digests():
+    """
+    Send the notification digests whose reminder_frequency window has elapsed
+    """
+    from translations.services.digest import DigestService
 
+    try:
+        DigestService().flush_due()
     except Exception as e:
-        logger.error(f"Error checking upcoming translations: {e}")
+        logger.error(f"Error flushing notification digests: {e}")
 
-def check_and_send_reminders(translation):
+def deliver_webhooks():
     """
-    Check if reminders need to be sent for a specific translation
+    Push queued TranslationRequest status changes to client webhooks
     """
-    try:
-        now = timezone.now()
-        
-        if translation.translation_type == 'DOCUMENT':
-            days_left = (translation.deadline - now).days
-            
-            if days_left in [7, 3, 1]:
-                send_document_reminder(translation, days_left)
-                
-        else:  # For live interpretations
-            if translation.start_date:
-                hours_until_start = (translation.start_date - now).total_seconds() / 3600
-                
-                if hours_until_start in [24, 3, 1]:
-                    send_meeting_reminder(translation, int(hours_until_start))
+    from .services.webhooks import WebhookService
 
+    try:
+        WebhookService.deliver_all()
     except Exception as e:
-        logger.error(f"Error checking reminders for translation {translation.id}: {e}")
+        logger.error(f"Error delivering webhooks: {e}")
 
-def send_document_reminder(translation, days_left):
+def archive_notifications():
     """
-    Send reminder email for document translation
+    Move old read notifications to the monthly archive and purge expired archive months
     """
+    from translations.services.retention import RetentionService
+
     try:
-        subject = f'Reminder: Translation due in {days_left} days'
-        template = 'emails/document_reminder.html'
-        context = {
-            'translation': translation,
-            'days_left': days_left,
-            'translator_name': translation.translator.get_full_name()
-        }
-        
-        send_mail(
-            subject=subject,
-            message=_get_email_content(template, context),
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[translation.translator.email]
-        )
-        
-        logger.info(f"Sent document reminder to translator {translation.translator.id} for translation {translation.id}")
+        RetentionService().run()
+    except Exception as e:
+        logger.error(f"Error archiving notifications: {e}")
 
+def sweep_overdue_translations():
+    """
+    Flag IN_PROGRESS translations past their deadline as OVERDUE, in one set-based sweep
+    """
+    from translations.tasks.batch import sweep_overdue_translations as sweep
+
+    try:
+        return sweep()
     except Exception as e:
-        logger.error(f"Error sending document reminder: {e}")
+        logger.error(f"Error sweeping overdue translations: {e}")
 
-def send_meeting_reminder(translation, hours_left):
+def schedule_deadline_checks():
     """
-    Send reminder email for live interpretation
+    Queue the daily deadline reminders, in batches
     """
+    from translations.tasks.batch import schedule_deadline_checks as schedule
+
     try:
-        subject = f'Reminder: Interpretation session in {hours_left} hours'
-        template = 'emails/meeting_reminder.html'
-        context = {
-            'translation': translation,
-            'hours_left': hours_left,
-            'translator_name': translation.translator.get_full_name()
-        }
-        
-        send_mail(
-            subject=subject,
-            message=_get_email_content(template, context),
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[translation.translator.email]
-        )
-        
-        logger.info(f"Sent meeting reminder to translator {translation.translator.id} for translation {translation.id}")
+        result = schedule()
+        logger.info(result)
+        return result
+    except Exception as e:
+        logger.error(f"Error scheduling deadline checks: {e}")
+
+def generate_periodic_reports():
+    """
+    Send the daily platform report to the admins
+    """
+    from translations.tasks.reports import generate_periodic_reports as generate
 
+    try:
+        result = generate()
+        logger.info(result)
+        return result
     except Exception as e:
-        logger.error(f"Error sending meeting reminder: {e}")
+        logger.error(f"Error generating periodic reports: {e}")
 
-def setup_scheduled_tasks(scheduler):
+# Days before the deadline / hours before the session
+DOCUMENT_REMINDER_DAYS = (7, 3, 1)
+MEETING_REMINDER_HOURS = (24, 3, 1)
+
+def check_upcoming_translations(now=None):
     """
-    Setup all scheduled tasks
+    Send the reminders whose threshold (deadline or start minus offset) fell
+    within the last REMINDER_CHECK_WINDOW_MINUTES
+
+    Only translations with such a threshold are fetched, in one query. The
+    window overlaps the previous tick on purpose; ReminderLedger makes each
+    reminder fire once.
     """
+    from .services.document_reminder import DocumentReminderService
+    from .services.meeting_reminder import MeetingReminderService
+
     try:
-        # Clean old jobs every Monday at 1 AM
-        scheduler.add_job(
-            clean_old_jobs,
-            'cron',
-            day_of_week='mon',
-            hour=1,
-            minute=0,
-            id='clean_old_jobs',
-            replace_existing=True
-        )
-        
-        # Check for reminders every 15 minutes
-        scheduler.add_job(
-            check_upcoming_translations,
-            'interval',
-            minutes=15,
-            id='check_reminders',
-            replace_existing=True
-        )
-        
-        logger.info("Successfully set up scheduled tasks")
-        
+        now = now or timezone.now()
+        window = timedelta(minutes=settings.REMINDER_CHECK_WINDOW_MINUTES)
+
+        # threshold in (now - window, now]  <=>  anchor in (now + offset - window, now + offset]
+        document_windows = Q()
+        for days in DOCUMENT_REMINDER_DAYS:
+            edge = now + timedelta(days=days)
+            document_windows |= Q(deadline__gt=edge - window, deadline__lte=edge)
+        meeting_windows = Q()
+        for hours in MEETING_REMINDER_HOURS:
+            edge = now + timedelta(hours=hours)
+            meeting_windows |= Q(start_date__gt=edge - window, start_date__lte=edge)
+
+        due_translations = TranslationRequest.objects.filter(
+            Q(document_windows, translation_type='DOCUMENT') | (meeting_windows & ~Q(translation_type='DOCUMENT')),
+            status__in=['ASSIGNED', 'IN_PROGRESS'],
+            translator__isnull=False
+        ).select_related('translator')
+
+        sent = 0
+        for translation in due_translations:
+            if translation.translation_type == 'DOCUMENT':
+                kind, anchor, unit, offsets = 'DOCUMENT', translation.deadline, 'days', DOCUMENT_REMINDER_DAYS
+                send = DocumentReminderService.send_document_reminder
+            else:
+                kind, anchor, unit, offsets = 'MEETING', translation.start_date, 'hours', MEETING_REMINDER_HOURS
+                send = MeetingReminderService.send_meeting_reminder
+            for offset in offsets:
+                threshold = anchor - timedelta(**{unit: offset})
+                if not now - window < threshold <= now:
+                    continue
+                if not ReminderLedger.claim(translation.id, kind, offset, anchor):
+                    continue
+                try:
+                    send(translation, offset)
+                    sent += 1
+                except Exception as e:
+                    ReminderLedger.release(translation.id, kind, offset, anchor)
+                    logger.error(f"Error sending {kind} reminder for translation {translation.id}: {e}")
+
+        if sent:
+            logger.info(f"Sent {sent} translation reminders")
+        return sent
+
     except Exception as e:
-        logger.error(f"Error setting up scheduled tasks: {e}")
-
-def _get_email_content(template, context):
-    """Helper function to render email content"""
-    from django.template.loader import render_to_string
-    from django.utils.html import strip_tags
-    
-    html_message = render_to_string(template, context)
-    return strip_tags(html_message)
\ No newline at end of file
+        logger.error(f"Error checking upcoming translations: {e}")
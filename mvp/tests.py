@@ -1,3 +1,585 @@
-from django.test import TestCase
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.mail import EmailMessage, get_connection
+from django.core.exceptions import ValidationError
+from django.core.mail.backends.base import BaseEmailBackend
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from datetime import timedelta
+from unittest import mock
+import json
+import smtplib
 
-# Create your tests here.
+from celery_tasks.email import deliver_outbox
+from mvp.leader import LeaderElection
+from mvp.scheduler import leader
+from mvp.email_backends.circuit_breaker import CircuitBreaker, CircuitBreakerEmailBackend, breaker
+from mvp.services.email_outbox import EmailOutboxService
+from mvp.services.notification_service import AcceptanceNotificationService
+from mvp.sms_backends import locmem
+from mvp.services.reminder_dispatcher import reminder_dispatcher
+from mvp.services.webhooks import STATUS_CHANGED, WebhookService, check_destination
+from translations.models import (
+    ClientWebhook, EmailOutbox, Language, Notification, NotificationDigestEntry, NotificationPreference,
+    Reminder, ReminderLedger, SchedulerLease, TranslationHistory, TranslationRequest, UserProfile,
+    WebhookDelivery
+)
+from translations.services.channels import preference_cache
+from translations.services.digest import DigestService
+from translations.tasks.batch import mark_overdue, sweep_overdue_translations
+from translations.tasks.reports import generate_periodic_reports
+
+
+def create_user(username, role=''):
+    user = User.objects.create_user(username, f'{username}@example.com', 'password')
+    if role:
+        # Saved through the cached profile, which every later user.save() writes back
+        user.profile.role = role
+        user.profile.save()
+    return user
+
+
+def create_translation(client, translator=None, **fields):
+    """DOCUMENT translation between two languages, due in 3 days unless overridden"""
+    source, _ = Language.objects.get_or_create(name='English', code='en')
+    target, _ = Language.objects.get_or_create(name='French', code='fr')
+    fields.setdefault('deadline', timezone.now() + timedelta(days=3))
+    fields.setdefault('translation_type', 'DOCUMENT')
+    return TranslationRequest.objects.create(
+        title='Contract', description='...', source_language=source, target_language=target,
+        client=client, translator=translator, **fields
+    )
+
+
+class NotificationListTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('inbox', 'inbox@example.com', 'password')
+        Notification.objects.bulk_create(
+            Notification(user=self.user, type='SYSTEM', title=f'Notification {i}', message='...')
+            for i in range(3)
+        )
+        self.client.force_login(self.user)
+
+    def test_limit_is_clamped_to_at_least_one(self):
+        for limit in ('0', '-5'):
+            response = self.client.get(reverse('notification_list'), {'limit': limit})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.json()['notifications']), 1)
+            self.assertIsNotNone(response.json()['next_cursor'])
+
+    def test_non_integer_limit_is_rejected(self):
+        response = self.client.get(reverse('notification_list'), {'limit': 'ten'})
+        self.assertEqual(response.status_code, 400)
+
+
+class RejectingTransport(BaseEmailBackend):
+    """Transport whose provider answers but rejects every message"""
+
+    def send_messages(self, email_messages):
+        raise smtplib.SMTPDataError(554, b'Message rejected')
+
+
+@override_settings(EMAIL_TRANSPORT_BACKEND='mvp.tests.RejectingTransport')
+class CircuitBreakerTrialTests(TestCase):
+    def setUp(self):
+        breaker.state = CircuitBreaker.OPEN
+        breaker.opened_at = -breaker.reset_timeout
+        breaker.trial_in_flight = False
+
+    def tearDown(self):
+        breaker.record_success()
+
+    def test_rejected_trial_message_closes_the_breaker(self):
+        message = EmailMessage('Subject', 'Body', 'from@example.com', ['to@example.com'])
+        with self.assertRaises(smtplib.SMTPDataError):
+            CircuitBreakerEmailBackend().send_messages([message])
+
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertFalse(breaker.trial_in_flight)
+        self.assertTrue(breaker.allow_request())
+
+
+class CircuitBreakerStateTests(TestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    def open(self):
+        self.breaker.record_failure(OSError('Connection refused'))
+        self.breaker.record_failure(OSError('Connection refused'))
+
+    def expire(self):
+        self.breaker.opened_at -= self.breaker.reset_timeout
+
+    def test_opens_after_consecutive_failures_only(self):
+        self.breaker.record_failure(OSError('Connection refused'))
+        self.breaker.record_success()
+        self.breaker.record_failure(OSError('Connection refused'))
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+        self.breaker.record_failure(OSError('Connection refused'))
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+    def test_one_trial_after_the_timeout_closes_it(self):
+        self.open()
+        self.expire()
+        self.assertTrue(self.breaker.allow_request())
+        self.assertEqual(self.breaker.state, CircuitBreaker.HALF_OPEN)
+        # A single trial at a time
+        self.assertFalse(self.breaker.allow_request())
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(self.breaker.allow_request())
+
+    def test_failed_trial_reopens_it(self):
+        self.open()
+        self.expire()
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.record_failure(OSError('Connection refused'))
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+
+class FailingConnection(BaseEmailBackend):
+    """Connection whose every send raises `error`"""
+    error = smtplib.SMTPDataError(554, b'Message rejected')
+
+    def send_messages(self, email_messages):
+        raise self.error
+
+
+class OutboxDeliveryTests(TestCase):
+    def setUp(self):
+        breaker.record_success()
+
+    def tearDown(self):
+        breaker.record_success()
+
+    def queue(self, count=1):
+        EmailOutboxService.queue_messages(
+            EmailMessage(f'Subject {i}', 'Body', 'from@example.com', [f'to{i}@example.com'])
+            for i in range(count)
+        )
+        return list(EmailOutbox.objects.order_by('id'))
+
+    def deliver(self, connection=None):
+        return EmailOutboxService.deliver_pending(
+            connection=connection or get_connection('django.core.mail.backends.locmem.EmailBackend')
+        )
+
+    def test_due_rows_are_sent_once(self):
+        self.queue(2)
+        self.assertEqual(self.deliver(), (2, 0))
+        self.assertEqual(self.deliver(), (0, 0))
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(set(EmailOutbox.objects.values_list('status', flat=True)), {'SENT'})
+
+    def test_claim_is_a_lease(self):
+        held, expired = self.queue(2)
+        EmailOutbox.objects.filter(id=held.id).update(
+            status='SENDING', next_attempt_at=timezone.now() + timedelta(minutes=5)
+        )
+        # Left in SENDING by a crashed worker
+        EmailOutbox.objects.filter(id=expired.id).update(
+            status='SENDING', next_attempt_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        self.assertEqual(self.deliver(), (1, 0))
+        self.assertEqual(mail.outbox[0].to, expired.recipients)
+        held.refresh_from_db()
+        self.assertEqual(held.status, 'SENDING')
+
+    @override_settings(EMAIL_OUTBOX_MAX_ATTEMPTS=2)
+    def test_rejected_message_is_backed_off_then_failed(self):
+        row, = self.queue()
+        self.assertEqual(self.deliver(FailingConnection()), (0, 1))
+        row.refresh_from_db()
+        self.assertEqual((row.status, row.attempts), ('PENDING', 1))
+        self.assertGreater(row.next_attempt_at, timezone.now() + timedelta(seconds=50))
+        # A rejected message says nothing about the provider
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+        EmailOutbox.objects.filter(id=row.id).update(next_attempt_at=timezone.now())
+        self.deliver(FailingConnection())
+        row.refresh_from_db()
+        self.assertEqual((row.status, row.attempts), ('FAILED', 2))
+
+    def test_open_breaker_leaves_the_rows_queued(self):
+        row, = self.queue()
+        for attempt in range(breaker.failure_threshold):
+            breaker.record_failure(OSError('Connection refused'))
+
+        self.assertEqual(self.deliver(), (0, 0))
+        row.refresh_from_db()
+        self.assertEqual((row.status, row.attempts), ('PENDING', 0))
+        self.assertEqual(len(mail.outbox), 0)
+
+
+class WebhookDestinationTests(TestCase):
+    def test_internal_addresses_are_refused(self):
+        for url in ('http://127.0.0.1/hook', 'http://169.254.169.254/latest/meta-data/',
+                    'https://10.0.0.5/hook', 'https://[::1]/hook', 'https://[::ffff:192.168.1.1]/hook'):
+            with self.assertRaises(ValidationError, msg=url):
+                check_destination(url)
+
+    def test_public_address_is_accepted(self):
+        check_destination('https://93.184.216.34/hook')
+
+    def test_user_without_profile_is_denied(self):
+        user = User.objects.create_user('noprofile', 'noprofile@example.com', 'password')
+        UserProfile.objects.filter(user=user).delete()
+        self.client.force_login(user)
+        response = self.client.get(reverse('client_webhooks'))
+        self.assertEqual(response.status_code, 403)
+
+
+class WebhookOrderingTests(TestCase):
+    def setUp(self):
+        self.webhook = ClientWebhook.objects.create(
+            client=create_user('client', role='CLIENT'), url='https://93.184.216.34/hook'
+        )
+
+    def add_event(self, status):
+        return WebhookDelivery.objects.create(
+            webhook=self.webhook, event=STATUS_CHANGED, payload={'status': status}
+        )
+
+    def deliver(self, ok=True):
+        """deliver_pending() against a stub endpoint; returns its result and the statuses sent"""
+        sent = []
+
+        def open_(http_request, timeout):
+            sent.append([event['data']['status'] for event in json.loads(http_request.data)['events']])
+            if not ok:
+                raise OSError('Connection refused')
+            return mock.MagicMock(**{'__enter__.return_value.status': 200})
+
+        with mock.patch('mvp.services.webhooks.opener') as opener:
+            opener.open.side_effect = open_
+            return WebhookService.deliver_pending(), sent
+
+    def test_newer_event_waits_for_an_older_retry(self):
+        first = self.add_event('IN_PROGRESS')
+        self.assertEqual(self.deliver(ok=False), ((0, 1), [['IN_PROGRESS']]))
+
+        # Due now, but the endpoint's older event is backing off
+        self.add_event('COMPLETED')
+        self.assertEqual(self.deliver(), ((0, 0), []))
+
+        WebhookDelivery.objects.filter(id=first.id).update(next_attempt_at=timezone.now())
+        self.assertEqual(self.deliver(), ((2, 0), [['IN_PROGRESS', 'COMPLETED']]))
+
+    def test_other_endpoints_are_not_held_back(self):
+        self.add_event('IN_PROGRESS')
+        self.deliver(ok=False)
+
+        other = ClientWebhook.objects.create(client=self.webhook.client, url='https://93.184.216.35/hook')
+        WebhookDelivery.objects.create(webhook=other, event=STATUS_CHANGED, payload={'status': 'COMPLETED'})
+        self.assertEqual(self.deliver(), ((1, 0), [['COMPLETED']]))
+
+
+class QuoteDetailAccessTests(TestCase):
+    def test_anonymous_request_is_redirected_to_login(self):
+        response = self.client.get(reverse('quote_detail', args=[1]))
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response['Location'].startswith(f"{reverse('login')}?next="))
+
+    def test_other_users_quote_is_not_found(self):
+        user = User.objects.create_user('stranger', 'stranger@example.com', 'password')
+        self.client.force_login(user)
+        self.assertEqual(self.client.get(reverse('quote_detail', args=[1])).status_code, 404)
+        self.assertEqual(self.client.post(reverse('quote_detail', args=[1])).status_code, 404)
+
+
+class OverdueTranslationTests(TestCase):
+    def setUp(self):
+        self.translator = create_user('translator', role='TRANSLATOR')
+        self.translation = create_translation(
+            create_user('client', role='CLIENT'), self.translator,
+            status='IN_PROGRESS', deadline=timezone.now() - timedelta(hours=1)
+        )
+        mark_overdue(timezone.now())
+        self.translation.refresh_from_db()
+        self.client.force_login(self.translator)
+
+    def test_overdue_translation_can_be_completed(self):
+        self.assertEqual(self.translation.status, 'OVERDUE')
+        response = self.client.post(
+            reverse('complete_translation', args=[self.translation.id]),
+            data='{"notes": "Late but done"}', content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.translation.refresh_from_db()
+        self.assertEqual(self.translation.status, 'COMPLETED')
+
+    def test_overdue_translation_stays_on_the_calendar(self):
+        response = self.client.get(reverse('calendar_events'))
+        events = response.json()['events']
+        self.assertEqual([event['extendedProps']['status'] for event in events], ['OVERDUE'])
+
+
+class OverdueSweepTests(TestCase):
+    def test_only_late_work_in_progress_is_flagged_once(self):
+        admin = create_user('admin', role='ADMIN')
+        translator = create_user('translator', role='TRANSLATOR')
+        client = create_user('client', role='CLIENT')
+        late = create_translation(client, translator, status='IN_PROGRESS',
+                                  deadline=timezone.now() - timedelta(hours=1))
+        on_time = create_translation(client, translator, status='IN_PROGRESS')
+        not_started = create_translation(client, translator, status='ASSIGNED',
+                                         deadline=timezone.now() - timedelta(hours=1))
+
+        sweep_overdue_translations()
+        self.assertEqual(sweep_overdue_translations(), 'No overdue translation')
+
+        statuses = dict(TranslationRequest.objects.values_list('id', 'status'))
+        self.assertEqual(statuses, {late.id: 'OVERDUE', on_time.id: 'IN_PROGRESS', not_started.id: 'ASSIGNED'})
+        self.assertEqual(list(TranslationHistory.objects.values_list('translation_id', 'status')),
+                         [(late.id, 'OVERDUE')])
+        self.assertEqual(
+            sorted(Notification.objects.filter(title='Translation Overdue').values_list('user_id', flat=True)),
+            sorted([admin.id, translator.id])
+        )
+
+
+class ReminderDispatcherTests(TestCase):
+    def setUp(self):
+        self.translation = create_translation(
+            create_user('client', role='CLIENT'), create_user('translator', role='TRANSLATOR'),
+            status='IN_PROGRESS', deadline=timezone.now() + timedelta(days=3, minutes=-1)
+        )
+
+    def add_due_reminder(self):
+        return Reminder.objects.create(
+            translation=self.translation, kind='DOCUMENT', offset=3,
+            fire_at=self.translation.deadline - timedelta(days=3)
+        )
+
+    def test_due_reminder_is_sent_once(self):
+        reminder = self.add_due_reminder()
+        self.assertEqual(reminder_dispatcher.send([reminder.id]), 1)
+        self.assertEqual(reminder_dispatcher.send([reminder.id]), 0)
+
+        reminder.refresh_from_db()
+        self.assertEqual(reminder.status, 'SENT')
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertTrue(ReminderLedger.objects.filter(translation=self.translation, offset=3).exists())
+
+    def test_duplicate_reminders_claim_the_ledger_once(self):
+        reminders = [self.add_due_reminder(), self.add_due_reminder()]
+        self.assertEqual(reminder_dispatcher.send([reminder.id for reminder in reminders]), 1)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(sorted(Reminder.objects.values_list('status', flat=True)), ['CANCELLED', 'SENT'])
+
+    def test_reminder_already_in_the_ledger_is_cancelled(self):
+        ReminderLedger.claim(self.translation.id, 'DOCUMENT', 3, self.translation.deadline)
+        reminder = self.add_due_reminder()
+        self.assertEqual(reminder_dispatcher.send([reminder.id]), 0)
+
+        reminder.refresh_from_db()
+        self.assertEqual(reminder.status, 'CANCELLED')
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_reminder_of_finished_translation_is_cancelled(self):
+        reminder = self.add_due_reminder()
+        # Bulk UPDATE: no signal, the dispatcher itself has to notice
+        TranslationRequest.objects.filter(id=self.translation.id).update(status='COMPLETED')
+        self.assertEqual(reminder_dispatcher.send([reminder.id]), 0)
+
+        reminder.refresh_from_db()
+        self.assertEqual(reminder.status, 'CANCELLED')
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_completing_a_translation_cancels_its_pending_reminders(self):
+        reminder = self.add_due_reminder()
+        self.translation.status = 'COMPLETED'
+        self.translation.save()
+
+        reminder.refresh_from_db()
+        self.assertEqual(reminder.status, 'CANCELLED')
+
+
+class OutboxDeliveryRequestTests(TestCase):
+    @override_settings(CELERY_BROKER_URL='redis://broker:6379/0')
+    def test_delivery_is_requested_at_top_priority_after_commit(self):
+        with mock.patch.object(deliver_outbox, 'apply_async') as apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                EmailOutboxService.request_delivery()
+                apply_async.assert_not_called()
+        apply_async.assert_called_once_with(priority=0, retry=False)
+
+    @override_settings(CELERY_BROKER_URL=None)
+    def test_without_broker_the_scheduler_poll_sends_it(self):
+        with mock.patch.object(deliver_outbox, 'apply_async') as apply_async:
+            with self.captureOnCommitCallbacks(execute=True):
+                EmailOutboxService.request_delivery()
+        apply_async.assert_not_called()
+
+
+class PeriodicReportTests(TestCase):
+    def test_admins_get_the_daily_report(self):
+        admin = create_user('admin', role='ADMIN')
+        admin.first_name, admin.last_name = 'Ada', 'Admin'
+        admin.save()
+        create_translation(create_user('client', role='CLIENT'), status='OVERDUE')
+
+        generate_periodic_reports()
+
+        self.assertEqual(Notification.objects.get(user=admin).title, 'Daily Platform Report')
+        email = EmailOutbox.objects.get()
+        self.assertEqual(email.recipients, [admin.email])
+        self.assertIn('Hello Ada Admin', email.html_body)
+        self.assertIn('1 overdue', email.html_body)
+
+
+class SchedulerAutostartTests(TestCase):
+    def ready(self, argv):
+        with mock.patch('sys.argv', argv), mock.patch.object(leader, 'start') as start, \
+                mock.patch('atexit.register'):
+            apps.get_app_config('mvp').ready()
+        return start.called
+
+    @override_settings(SCHEDULER_AUTOSTART=False)
+    def test_processes_do_not_campaign_unless_enabled(self):
+        for argv in (['celery', '-A', 'translation_platform', 'worker'], ['gunicorn'], ['script.py']):
+            self.assertFalse(self.ready(argv), argv)
+
+    @override_settings(SCHEDULER_AUTOSTART=True)
+    def test_enabled_server_campaigns_but_not_management_commands(self):
+        self.assertTrue(self.ready(['gunicorn']))
+        self.assertFalse(self.ready(['manage.py', 'migrate']))
+
+
+class DigestBufferTests(TestCase):
+    def setUp(self):
+        self.translation = create_translation(create_user('client', role='CLIENT'))
+
+    def test_event_for_many_users_is_merged_and_inserted_in_bulk(self):
+        users = [create_user(f'admin{i}', role='ADMIN') for i in range(6)]
+        DigestService().add_event(users[0], 'Old title', 'Old message', translation=self.translation)
+
+        # SELECT, UPDATE, INSERT and the INSERT's savepoint, whatever the number of users
+        with self.assertNumQueries(5):
+            DigestService().add_events(users, 'Accepted', 'A translator accepted it', translation=self.translation)
+
+        entries = NotificationDigestEntry.objects.filter(translation=self.translation)
+        self.assertEqual(entries.count(), 6)
+        merged = entries.get(user=users[0])
+        self.assertEqual((merged.title, merged.event_count), ('Accepted', 2))
+        self.assertEqual(set(entries.exclude(user=users[0]).values_list('event_count', flat=True)), {1})
+
+
+@override_settings(SMS_BACKEND='mvp.sms_backends.locmem.SMSBackend')
+class AcceptanceRoutingTests(TestCase):
+    def setUp(self):
+        preference_cache.invalidate()
+        locmem.outbox.clear()
+        self.translator = create_user('translator', role='TRANSLATOR')
+        self.translator.profile.phone_primary = '+33612345678'
+        self.translator.profile.save()
+        self.translation = create_translation(create_user('client', role='CLIENT'), self.translator)
+
+    def add_staff(self, username, **preference):
+        user = create_user(username)
+        user.is_staff = True
+        user.save()
+        if preference:
+            NotificationPreference.objects.create(user=user, **preference)
+        return user
+
+    def test_each_recipient_gets_the_channels_they_chose(self):
+        immediate = self.add_staff('immediate', reminder_frequency=0)
+        digest = self.add_staff('digest')
+        self.add_staff('muted', email_notifications=False)
+        NotificationPreference.objects.create(user=self.translator, sms_notifications=True, reminder_frequency=0)
+
+        AcceptanceNotificationService.send_all_notifications(self.translation)
+
+        emailed = sorted(address for email in EmailOutbox.objects.all() for address in email.recipients)
+        self.assertEqual(emailed, sorted([immediate.email, self.translator.email]))
+        # The client has no preference row: model defaults, a 24 hour digest
+        self.assertEqual(
+            set(NotificationDigestEntry.objects.values_list('user_id', flat=True)),
+            {digest.id, self.translation.client_id}
+        )
+        self.assertEqual([phone for phone, text in locmem.outbox], ['+33612345678'])
+
+
+class DigestFlushTests(TestCase):
+    def setUp(self):
+        preference_cache.invalidate()
+
+    def add_entry(self, user):
+        DigestService().add_event(user, 'Quote Processed', 'Your quote has been processed.')
+
+    def test_due_digest_is_sent_and_emptied(self):
+        user = create_user('client', role='CLIENT')
+        self.add_entry(user)
+        self.add_entry(user)
+
+        self.assertEqual(DigestService().flush_due(), 1)
+        email = EmailOutbox.objects.get()
+        self.assertEqual((email.recipients, email.subject), ([user.email], '2 updates on your translations'))
+        self.assertFalse(NotificationDigestEntry.objects.exists())
+        self.assertIsNotNone(NotificationPreference.objects.get(user=user).last_digest_sent_at)
+
+    def test_digest_waits_for_the_users_frequency(self):
+        user = create_user('client', role='CLIENT')
+        NotificationPreference.objects.create(
+            user=user, reminder_frequency=24, last_digest_sent_at=timezone.now() - timedelta(hours=2)
+        )
+        self.add_entry(user)
+
+        self.assertEqual(DigestService().flush_due(), 0)
+        self.assertEqual(DigestService().flush_due(now=timezone.now() + timedelta(hours=23)), 1)
+
+    def test_entries_of_users_without_email_are_dropped(self):
+        user = create_user('client', role='CLIENT')
+        NotificationPreference.objects.create(user=user, email_notifications=False)
+        self.add_entry(user)
+
+        self.assertEqual(DigestService().flush_due(), 0)
+        self.assertFalse(NotificationDigestEntry.objects.exists())
+        self.assertFalse(EmailOutbox.objects.exists())
+
+
+@override_settings(SCHEDULER_LEASE_SECONDS=30)
+class LeaderFailoverTests(TestCase):
+    def candidate(self):
+        events = []
+        election = LeaderElection('test', lambda: events.append('elected'), lambda: events.append('demoted'))
+        return election, events
+
+    def expire_lease(self):
+        SchedulerLease.objects.filter(name='test').update(expires_at=timezone.now() - timedelta(seconds=1))
+
+    def test_standby_takes_over_an_expired_lease(self):
+        first, first_events = self.candidate()
+        second, second_events = self.candidate()
+        self.assertTrue(first.heartbeat())
+        self.assertFalse(second.heartbeat())
+
+        # The leader stops renewing, e.g. its process hangs
+        self.expire_lease()
+        self.assertTrue(second.heartbeat())
+        self.assertEqual(SchedulerLease.objects.get(name='test').holder, second.identity)
+
+        # Back again, the old leader finds the lease taken and steps down
+        self.assertFalse(first.heartbeat())
+        self.assertEqual(first_events, ['elected', 'demoted'])
+        self.assertEqual(second_events, ['elected'])
+
+    def test_stopping_leader_hands_over_at_once(self):
+        first, first_events = self.candidate()
+        second, second_events = self.candidate()
+        first.heartbeat()
+        first.stop()
+
+        self.assertEqual(first_events, ['elected', 'demoted'])
+        self.assertTrue(second.heartbeat())
@@ -19,6 +19,7 @@ urlpatterns = [
 
     # URL pour les détails d'un devis
     path('quotes/<int:id>/', views.QuoteDetailView.as_view(), name='quote_detail'),
+    path('quotes/<int:id>/status/', views.translation_status, name='translation_status'),
 
     # URL pour le paiement d'un devis
     #path('quotes/<int:id>/pay/', views.PaymentView, name='payment'),
@@ -62,4 +63,14 @@ urlpatterns = [
         name='upcoming_meetings'),
     path('translations/<int:translation_id>/cancel/', views.cancel_translation, name='cancel_translation'),
     path('translations/<int:translation_id>/update-schedule/', views.update_translation_schedule, name='update_schedule'),
+    # Notifications inbox
+    path('notifications/', views.notification_list, name='notification_list'),
+    path('notifications/read/', views.mark_notifications_read, name='mark_notifications_read'),
+    path('notifications/read-all/', views.mark_all_notifications_read, name='mark_all_notifications_read'),
+    path('events/', views.event_stream, name='event_stream'),
+    # Webhooks
+    path('webhooks/', views.client_webhooks, name='client_webhooks'),
+    path('webhooks/<int:webhook_id>/delete/', views.delete_client_webhook, name='delete_client_webhook'),
+    # Monitoring
+    path('health/email/', views.email_health, name='email_health'),
 ]
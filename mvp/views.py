@@ -61,13 +61,20 @@ from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_http_methods
 from django.http import JsonResponse
 from django.utils import timezone
-from .models import TranslationRequest
 from .decorators import translator_required
-from .services.notification_service import AcceptanceNotificationService
-from .services.document_reminder import DocumentReminderService
-from .services.meeting_reminder import MeetingReminderService
-from .services.calendar_service import CalendarService
+from .services.email_outbox import EmailOutboxService
+from translations.services.inbox import InboxService
 from django.utils.dateparse import parse_datetime
+from django.http import StreamingHttpResponse
+from .realtime import hub
+from .events import bus, ScheduleChanged, TranslationAccepted, TranslationCancelled
+from django.db import transaction
+from .email_backends.circuit_breaker import breaker
+from django.contrib.admin.views.decorators import staff_member_required
+from django.db.models import Count, Q
+from django.core.exceptions import ValidationError
+from django.core.validators import URLValidator
+import asyncio
 
 
 logger = logging.getLogger(__name__)
@@ -85,13 +92,14 @@ def register_view(request):
                 expires_at=expiration_time
             )
             
-            # Envoyer l'email avec le code OTP
-            send_mail(
+            # Envoyer l'email avec le code OTP (via l'outbox)
+            EmailOutboxService.queue(
                 'Your OTP Code',
                 f'Your OTP code is {otp_code}',
-                settings.DEFAULT_FROM_EMAIL,
                 [user.email],
+                from_email=settings.DEFAULT_FROM_EMAIL,
             )
+            EmailOutboxService.request_delivery()
             
             request.session['user_id'] = user.id
             messages.success(request, 'Registration successful. Please check your email for the OTP code.')
@@ -485,7 +493,7 @@ def send_quote_confirmation_email(quote_request):
 """
 
     try:
-        send_mail(
+        EmailOutboxService.queue(
             subject=f'Quote Request Received: {quote_request.title}',
             message=message,
             from_email=settings.DEFAULT_FROM_EMAIL,
@@ -532,9 +540,9 @@ class CreateClientQuoteRequestView(LoginRequiredMixin, CreateView):
             
             try:
                 # Send confirmation email to client
-                logger.info(f"Sending confirmation email to client: {self.request.user.email}")
+                logger.info(f"Queueing confirmation email to client: {self.request.user.email}")
                 send_quote_confirmation_email(self.object)
-                logger.info("Client confirmation email sent successfully")
+                logger.info("Client confirmation email queued successfully")
             except Exception as e:
                 logger.error(f"Failed to send client confirmation email: {str(e)}")
             
@@ -544,8 +552,8 @@ class CreateClientQuoteRequestView(LoginRequiredMixin, CreateView):
                 admin_emails = list(admins.values_list('email', flat=True))
                 
                 if admin_emails:
-                    logger.info(f"Sending email notifications to admins: {', '.join(admin_emails)}")
-                    send_mail(
+                    logger.info(f"Queueing email notifications to admins: {', '.join(admin_emails)}")
+                    EmailOutboxService.queue(
                         subject='New Translation Quote Request',
                         message=f'''
                         New translation request received:
@@ -554,10 +562,9 @@ class CreateClientQuoteRequestView(LoginRequiredMixin, CreateView):
                         From: {form.instance.client.email}
                         ''',
                         from_email=settings.DEFAULT_FROM_EMAIL,
-                        recipient_list=admin_emails,
-                        fail_silently=False
+                        recipient_list=admin_emails
                     )
-                    logger.info("Admin notification emails sent successfully")
+                    logger.info("Admin notification emails queued successfully")
                 else:
                     logger.warning("No admin emails found for notification")
             
@@ -645,12 +652,47 @@ class QuoteListView(ListView):
             annotated_status=F('status')
         )
         
-class QuoteDetailView(DetailView):
+def status_version(updated_at):
+    """Version stamp of a TranslationRequest: updated_at in microseconds since the epoch"""
+    return int(updated_at.timestamp() * 1_000_000) if updated_at else 0
+
+def _client_version(request):
+    """Last version seen by the client, from ?version= or If-None-Match"""
+    value = request.GET.get('version') or request.headers.get('If-None-Match', '')
+    value = value.split(',')[0].strip().removeprefix('W/').strip('"')
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+def _not_modified(version):
+    response = HttpResponse(status=304)
+    response['ETag'] = f'"{version}"'
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+class QuoteDetailView(LoginRequiredMixin, DetailView):
     model = TranslationRequest
     pk_url_kwarg = 'id'
 
+    def get_queryset(self):
+        # Same access rule for reading and editing: the client who asked for the quote
+        return TranslationRequest.objects.filter(client=self.request.user)
+
     def get(self, request, *args, **kwargs):
-        quote = self.get_object()
+        # Conditional GET: compare the version stamp before loading the full row
+        seen = _client_version(request)
+        if seen is not None:
+            updated_at = self.get_queryset().filter(
+                id=self.kwargs['id']
+            ).values_list('updated_at', flat=True).first()
+            if updated_at is not None and status_version(updated_at) == seen:
+                return _not_modified(seen)
+
+        quote = get_object_or_404(
+            self.get_queryset().select_related('source_language', 'target_language'),
+            id=self.kwargs['id']
+        )
         
         # Créer un dictionnaire avec les données sérialisables
         data = {
@@ -683,7 +725,11 @@ class QuoteDetailView(DetailView):
             elif quote.translation_type == 'REMOTE_MEETING':
                 data['meeting_link'] = quote.meeting_link
 
-        return JsonResponse(data)
+        data['version'] = status_version(quote.updated_at)
+        response = JsonResponse(data)
+        response['ETag'] = f'"{data["version"]}"'
+        response['Cache-Control'] = 'private, no-cache'
+        return response
 
     def post(self, request, *args, **kwargs):
         quote = self.get_object()
@@ -695,7 +741,7 @@ class QuoteDetailView(DetailView):
         return JsonResponse({'success': True})
 
     def get_object(self):
-        return get_object_or_404(self.model, id=self.kwargs['id'], client=self.request.user)
+        return get_object_or_404(self.get_queryset(), id=self.kwargs['id'])
     #make the payment and invoice later
     
     
@@ -779,7 +825,7 @@ def generate_and_send_invoice(request, id):
             [client_email],
         )
         email.attach(pdf_filename, pdf.read(), 'application/pdf')
-        email.send(fail_silently=False)
+        EmailOutboxService.queue_message(email)
 
     # Retourner le PDF pour le téléchargement
     with open(pdf_path, 'rb') as pdf:
@@ -829,7 +875,7 @@ def translation_list(request):
     # Assigned translations
     assigned_translations = TranslationRequest.objects.filter(
         translator=request.user,
-        status__in=['ASSIGNED', 'IN_PROGRESS']
+        status__in=TranslationRequest.ACTIVE_STATUSES
     ).select_related(
         'client',
         'source_language',
@@ -860,49 +906,29 @@ def translation_list(request):
 def accept_translation(request, translation_id):
     """AJAX endpoint for accepting a translation"""
     try:
-        translation = get_object_or_404(
-            TranslationRequest,
-            id=translation_id,
-            status='PAID',
-            translator__isnull=True
-        )
-        
         data = json.loads(request.body)
         notes = data.get('notes', '')
         
-        # Update translation
-        translation.translator = request.user
-        translation.status = 'ASSIGNED'
-        translation.start_date = timezone.now()
-        if notes:
-            translation.notes = notes
-        translation.save()
-        
-        # Send notifications to all parties (admin, translator, and client)
-        try:
-            # Send acceptance notifications
-            AcceptanceNotificationService.send_all_notifications(translation)
+        with transaction.atomic():
+            # Row lock: two translators cannot accept the same request
+            translation = get_object_or_404(
+                TranslationRequest.objects.select_for_update(),
+                id=translation_id,
+                status='PAID',
+                translator__isnull=True
+            )
             
-            # Schedule reminders based on translation type
-            if translation.translation_type == 'DOCUMENT':
-                DocumentReminderService.schedule_document_reminders(translation)
-            else:
-                # For all other types (LIVE_ON_SITE, REMOTE_PHONE, REMOTE_MEETING)
-                MeetingReminderService.schedule_meeting_reminders(translation)
-                
-                # Send calendar invitation for live interpretations
-                try:
-                    CalendarService.send_calendar_invitation(translation)
-                    logger.info(f"Calendar invitation sent for translation {translation.id}")
-                except Exception as calendar_error:
-                    logger.error(f"Error sending calendar invitation: {calendar_error}")
-                
-            # Log successful reminder scheduling
-            logger.info(f"Reminders scheduled for translation {translation.id}")
+            # Update translation
+            translation.translator = request.user
+            translation.status = 'ASSIGNED'
+            translation.start_date = timezone.now()
+            if notes:
+                translation.notes = notes
+            translation.save()
             
-        except Exception as notification_error:
-            # Log the error but don't stop the process
-            logger.error(f"Error in notification/reminder setup: {notification_error}")
+            # Notifications, reminders and calendar invitation run after commit
+            # in the event bus workers (mvp/handlers.py)
+            bus.publish(TranslationAccepted(translation_id=translation.id, translator_id=request.user.id))
         
         # Prepare calendar details for live interpretations
         calendar_info = None
@@ -1012,7 +1038,7 @@ def complete_translation(request, translation_id):
             TranslationRequest,
             id=translation_id,
             translator=request.user,
-            status='IN_PROGRESS'
+            status__in=['IN_PROGRESS', 'OVERDUE']
         )
         
         # Handle file upload if provided
@@ -1061,12 +1087,16 @@ def update_translation_schedule(request, translation_id):
         new_start_date = parse_datetime(data.get('start_date'))
         
         if new_start_date:
-            translation.start_date = new_start_date
-            translation.save()
-            
-            if translation.is_live_interpretation():
-                # Send calendar update
-                CalendarService.update_calendar_event(translation)
+            previous_start_date = translation.start_date
+            with transaction.atomic():
+                translation.start_date = new_start_date
+                translation.save()
+                # Calendar update is sent after commit (mvp/handlers.py)
+                bus.publish(ScheduleChanged(
+                    translation_id=translation.id,
+                    previous_start_date=previous_start_date,
+                    start_date=new_start_date
+                ))
                 
             return JsonResponse({
                 'status': 'success',
@@ -1096,12 +1126,12 @@ def cancel_translation(request, translation_id):
             translator=request.user
         )
         
-        translation.status = 'CANCELLED'
-        translation.save()
-        
-        if translation.is_live_interpretation():
-            # Send calendar cancellation
-            CalendarService.cancel_calendar_event(translation)
+        previous_status = translation.status
+        with transaction.atomic():
+            translation.status = 'CANCELLED'
+            translation.save()
+            # Calendar cancellation is sent after commit (mvp/handlers.py)
+            bus.publish(TranslationCancelled(translation_id=translation.id, previous_status=previous_status))
         
         return JsonResponse({
             'status': 'success',
@@ -1143,7 +1173,7 @@ def get_calendar_events(request):
             translator=request.user,
             deadline__gte=start_date,
             deadline__lte=end_date,
-            status__in=['ASSIGNED', 'IN_PROGRESS']
+            status__in=TranslationRequest.ACTIVE_STATUSES
         ).select_related(
             'source_language',
             'target_language'
@@ -1242,6 +1272,8 @@ def get_meeting_color(meeting):
 
 def get_translation_color(translation):
     """Define colors for different translation states"""
+    if translation.status == 'OVERDUE':
+        return '#FF4444'  # Red
     if translation.status == 'IN_PROGRESS':
         return '#4CAF50'  # Green
     return '#9E9E9E'  # Grey for assigned
@@ -1255,7 +1287,7 @@ def get_upcoming_meetings(request):
         upcoming_meetings = TranslationRequest.objects.filter(
             translator=request.user,
             translation_type__in=['LIVE_ON_SITE', 'REMOTE_PHONE', 'REMOTE_MEETING'],
-            status__in=['ASSIGNED', 'IN_PROGRESS'],
+            status__in=TranslationRequest.ACTIVE_STATUSES,
             start_date__gte=today,
             start_date__lte=today + timedelta(days=7)
         ).order_by('start_date')
@@ -1283,4 +1315,280 @@ def get_upcoming_meetings(request):
             'status': 'error',
             'message': str(e)
         }, status=500)
-        
\ No newline at end of file
+
+
+########notifications####################################################################
+
+@login_required
+def notification_list(request):
+    """AJAX endpoint returning one keyset-paginated page of the user's inbox"""
+    inbox = InboxService()
+    try:
+        limit = int(request.GET.get('limit', 20))
+    except ValueError:
+        return JsonResponse({
+            'status': 'error',
+            'message': 'Invalid limit'
+        }, status=400)
+    limit = max(1, min(limit, 100))
+
+    try:
+        notifications, next_cursor = inbox.list_notifications(
+            request.user,
+            cursor=request.GET.get('cursor'),
+            limit=limit,
+            unread_only=request.GET.get('unread') == '1'
+        )
+    except ValueError as e:
+        return JsonResponse({
+            'status': 'error',
+            'message': str(e)
+        }, status=400)
+
+    return JsonResponse({
+        'status': 'success',
+        'notifications': [{
+            'id': notification.id,
+            'type': notification.type,
+            'title': notification.title,
+            'message': notification.message,
+            'link': notification.link,
+            'is_read': notification.is_read,
+            'created_at': notification.created_at.strftime('%Y-%m-%d %H:%M')
+        } for notification in notifications],
+        'next_cursor': next_cursor,
+        'unread_count': inbox.unread_count(request.user)
+    })
+
+@login_required
+@require_http_methods(["POST"])
+def mark_notifications_read(request):
+    """AJAX endpoint marking the given notification ids as read"""
+    try:
+        data = json.loads(request.body)
+        ids = [int(notification_id) for notification_id in data.get('ids', [])]
+    except (ValueError, TypeError):
+        return JsonResponse({
+            'status': 'error',
+            'message': 'Invalid notification ids'
+        }, status=400)
+
+    inbox = InboxService()
+    updated = inbox.mark_read(request.user, ids)
+    return JsonResponse({
+        'status': 'success',
+        'updated': updated,
+        'unread_count': inbox.unread_count(request.user)
+    })
+
+@login_required
+@require_http_methods(["POST"])
+def mark_all_notifications_read(request):
+    """AJAX endpoint marking the whole inbox as read in one UPDATE"""
+    updated = InboxService().mark_all_read(request.user)
+    return JsonResponse({
+        'status': 'success',
+        'updated': updated,
+        'unread_count': 0
+    })
+
+async def event_stream(request):
+    """
+    Server-sent events stream of the user's notifications and status changes.
+    Served by the ASGI application; replaces dashboard polling.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse({
+            'status': 'error',
+            'message': 'Authentication required.'
+        }, status=401)
+
+    keepalive = settings.REALTIME_KEEPALIVE_SECONDS
+
+    async def stream():
+        # Ask the browser to reconnect after 5 seconds if the stream drops
+        yield 'retry: 5000\n\n'
+        async with hub.subscribe(user.id) as events:
+            while True:
+                try:
+                    payload = await asyncio.wait_for(events.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle connection
+                    yield ': keepalive\n\n'
+                    continue
+                event = json.loads(payload)
+                yield f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+async def translation_status(request, id):
+    """
+    Conditional, optionally long-polling status of a quote or translation.
+
+    The client sends the last version it saw (?version= or If-None-Match) and
+    gets 304 while nothing has changed. With ?wait=N the request is held up to
+    N seconds (TRANSLATION_STATUS_MAX_WAIT at most) and answered as soon as
+    the status changes. Only status and updated_at are read, never the full row.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse({
+            'status': 'error',
+            'message': 'Authentication required.'
+        }, status=401)
+
+    try:
+        wait = min(max(float(request.GET.get('wait', 0)), 0), settings.TRANSLATION_STATUS_MAX_WAIT)
+    except ValueError:
+        wait = 0
+    seen = _client_version(request)
+    rows = TranslationRequest.objects.filter(Q(client=user) | Q(translator=user), id=id)
+
+    async def current():
+        return await rows.values_list('status', 'updated_at').afirst()
+
+    # Subscribe before the first read so that a change in between is not missed
+    async with hub.subscribe(user.id) as events:
+        row = await current()
+        if row is None:
+            return JsonResponse({
+                'status': 'error',
+                'message': 'Not found.'
+            }, status=404)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait
+        while status_version(row[1]) == seen:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return _not_modified(seen)
+            try:
+                # Periodic re-read covers writers that do not publish to the hub
+                payload = await asyncio.wait_for(
+                    events.get(), timeout=min(remaining, settings.TRANSLATION_STATUS_RECHECK_SECONDS)
+                )
+                event = json.loads(payload)
+                if event['event'] != 'status' or event['data'].get('id') != id:
+                    continue
+            except asyncio.TimeoutError:
+                pass
+            row = await current()
+            if row is None:
+                return JsonResponse({
+                    'status': 'error',
+                    'message': 'Not found.'
+                }, status=404)
+
+    status, updated_at = row
+    version = status_version(updated_at)
+    response = JsonResponse({
+        'id': id,
+        'status': status,
+        'status_display': dict(TranslationRequest.STATUS_CHOICES).get(status, status),
+        'version': version
+    })
+    response['ETag'] = f'"{version}"'
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+########webhooks####################################################################
+
+def _webhook_data(webhook, include_secret=False):
+    data = {
+        'id': webhook.id,
+        'url': webhook.url,
+        'statuses': webhook.statuses,
+        'is_active': webhook.is_active,
+        'created_at': webhook.created_at.strftime('%Y-%m-%d %H:%M'),
+        'metrics': {
+            'requests': webhook.total_requests,
+            'events': webhook.total_events,
+            'failures': webhook.total_failures,
+            'consecutive_failures': webhook.consecutive_failures,
+            'average_latency_ms': webhook.average_latency_ms,
+            'last_status_code': webhook.last_status_code,
+            'last_success_at': webhook.last_success_at.isoformat() if webhook.last_success_at else None,
+            'last_failure_at': webhook.last_failure_at.isoformat() if webhook.last_failure_at else None,
+            'last_error': webhook.last_error
+        }
+    }
+    if include_secret:
+        data['secret'] = webhook.secret
+    return data
+
+@login_required
+@require_http_methods(["GET", "POST"])
+def client_webhooks(request):
+    """List the client's webhook endpoints with their metrics (GET) or register one (POST)"""
+    from translations.models import ClientWebhook
+    from .services.webhooks import check_destination
+
+    profile = getattr(request.user, 'profile', None)
+    if profile is None or profile.role != 'CLIENT':
+        return JsonResponse({
+            'status': 'error',
+            'message': 'Access denied. Client account required.'
+        }, status=403)
+
+    if request.method == 'GET':
+        return JsonResponse({
+            'status': 'success',
+            'webhooks': [_webhook_data(webhook) for webhook in request.user.webhooks.all()]
+        })
+
+    try:
+        data = json.loads(request.body)
+        url = data.get('url', '').strip()
+        URLValidator(schemes=['http', 'https'] if settings.WEBHOOK_ALLOW_HTTP else ['https'])(url)
+        check_destination(url)
+        statuses = list(data.get('statuses') or [])
+        valid_statuses = {code for code, label in TranslationRequest.STATUS_CHOICES}
+        if not set(statuses) <= valid_statuses:
+            raise ValidationError(f"Unknown status in {statuses}")
+    except (ValueError, TypeError, AttributeError, ValidationError) as e:
+        return JsonResponse({
+            'status': 'error',
+            'message': f'Invalid webhook: {e}'
+        }, status=400)
+
+    webhook = ClientWebhook.objects.create(client=request.user, url=url, statuses=statuses)
+    # The secret is only returned once, at creation
+    return JsonResponse({
+        'status': 'success',
+        'webhook': _webhook_data(webhook, include_secret=True)
+    }, status=201)
+
+@login_required
+@require_http_methods(["POST"])
+def delete_client_webhook(request, webhook_id):
+    """Remove one of the client's webhook endpoints and its pending deliveries"""
+    webhook = get_object_or_404(request.user.webhooks, id=webhook_id)
+    webhook.delete()
+    return JsonResponse({'status': 'success'})
+
+
+########monitoring####################################################################
+
+@staff_member_required
+def email_health(request):
+    """Circuit breaker state of this worker process and outbox backlog"""
+    from translations.models import EmailOutbox
+
+    outbox = dict(
+        EmailOutbox.objects.exclude(status='SENT')
+        .values('status')
+        .annotate(total=Count('id'))
+        .values_list('status', 'total')
+    )
+    return JsonResponse({
+        'status': 'success',
+        'breaker': breaker.snapshot(),
+        'outbox': outbox
+    })
+
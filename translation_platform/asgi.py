@@ -2,6 +2,8 @@
 ASGI config for translation_platform project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+The server-sent events endpoint (``/events/``, see mvp.realtime) needs this
+application, e.g. ``gunicorn -k uvicorn.workers.UvicornWorker translation_platform.asgi:application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
@@ -0,0 +1,19 @@
+# celery.py
+"""
+Celery application
+
+Tasks are routed to one queue per workload (see CELERY_TASK_ROUTES) and each
+queue gets its own worker pool (see the procfile), so a long sweep or
+reminder batch never sits ahead of an OTP email.
+"""
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'translation_platform.settings')
+
+app = Celery('translation_platform')
+
+# CELERY_* settings from Django settings
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
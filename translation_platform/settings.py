@@ -8,6 +8,7 @@ from pathlib import Path
 import os
 from dotenv import load_dotenv
 from datetime import timedelta
+from kombu import Queue
 import dj_database_url
 
 # Charger les variables d'environnement
@@ -108,6 +109,7 @@ TEMPLATES = [
                 "django.contrib.messages.context_processors.messages",
                 'social_django.context_processors.backends',
                 'social_django.context_processors.login_redirect',
+                'mvp.context_processors.notifications',
             ],
         },
     },
@@ -183,7 +185,9 @@ CORS_ALLOW_CREDENTIALS = os.getenv('CORS_ALLOW_CREDENTIALS', 'True') == 'True'
 CSRF_TRUSTED_ORIGINS = os.getenv('CSRF_TRUSTED_ORIGINS', '').split(',') if os.getenv('CSRF_TRUSTED_ORIGINS') else []
 
 # Email Configuration
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+# Inline sends go through the circuit breaker, which wraps EMAIL_TRANSPORT_BACKEND
+EMAIL_BACKEND = os.getenv('EMAIL_BACKEND', 'mvp.email_backends.circuit_breaker.CircuitBreakerEmailBackend')
+EMAIL_TRANSPORT_BACKEND = os.getenv('EMAIL_TRANSPORT_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
 EMAIL_HOST = os.getenv('EMAIL_HOST')
 EMAIL_PORT = int(os.getenv('EMAIL_PORT', 587))
 EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER')
@@ -191,14 +195,132 @@ EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD')
 EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS', 'True') == 'True'
 EMAIL_USE_SSL = os.getenv('EMAIL_USE_SSL', 'False') == 'True'
 DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL')
-
-# Celery Configuration
+EMAIL_CONNECT_TIMEOUT = int(os.getenv('EMAIL_CONNECT_TIMEOUT', 5))
+EMAIL_SEND_TIMEOUT = int(os.getenv('EMAIL_SEND_TIMEOUT', 10))
+EMAIL_TIMEOUT = EMAIL_SEND_TIMEOUT
+EMAIL_BREAKER_FAILURE_THRESHOLD = int(os.getenv('EMAIL_BREAKER_FAILURE_THRESHOLD', 3))
+EMAIL_BREAKER_RESET_SECONDS = int(os.getenv('EMAIL_BREAKER_RESET_SECONDS', 60))
+
+# Email outbox (mvp.services.email_outbox)
+EMAIL_OUTBOX_BACKEND = os.getenv('EMAIL_OUTBOX_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv('EMAIL_OUTBOX_BATCH_SIZE', 100))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv('EMAIL_OUTBOX_MAX_ATTEMPTS', 5))
+EMAIL_OUTBOX_INTERVAL_SECONDS = int(os.getenv('EMAIL_OUTBOX_INTERVAL_SECONDS', 30))
+
+# Recipient suppression list (mvp.services.suppression), reloaded by each process after this many seconds
+EMAIL_SUPPRESSION_CACHE_SECONDS = int(os.getenv('EMAIL_SUPPRESSION_CACHE_SECONDS', 300))
+
+# Domain event bus (mvp.events); EVENT_BUS_SYNC runs handlers inline after commit
+EVENT_BUS_WORKERS = int(os.getenv('EVENT_BUS_WORKERS', 4))
+EVENT_BUS_SYNC = os.getenv('EVENT_BUS_SYNC', 'False') == 'True'
+
+# Client webhooks (mvp.services.webhooks)
+WEBHOOK_BATCH_SIZE = int(os.getenv('WEBHOOK_BATCH_SIZE', 50))
+WEBHOOK_CLAIM_SIZE = int(os.getenv('WEBHOOK_CLAIM_SIZE', 500))
+WEBHOOK_MAX_ATTEMPTS = int(os.getenv('WEBHOOK_MAX_ATTEMPTS', 8))
+WEBHOOK_TIMEOUT_SECONDS = int(os.getenv('WEBHOOK_TIMEOUT_SECONDS', 5))
+WEBHOOK_INTERVAL_SECONDS = int(os.getenv('WEBHOOK_INTERVAL_SECONDS', 15))
+WEBHOOK_ALLOW_HTTP = os.getenv('WEBHOOK_ALLOW_HTTP', str(DEBUG)) == 'True'
+# Loopback, private, link-local and reserved destinations are refused unless set (local testing only)
+WEBHOOK_ALLOW_PRIVATE_ADDRESSES = os.getenv('WEBHOOK_ALLOW_PRIVATE_ADDRESSES', 'False') == 'True'
+
+# Reminder dispatcher (mvp.services.reminder_dispatcher): reminders written by other
+# processes are picked up every REMINDER_REFRESH_SECONDS
+REMINDER_REFRESH_SECONDS = int(os.getenv('REMINDER_REFRESH_SECONDS', 60))
+REMINDER_BATCH_SIZE = int(os.getenv('REMINDER_BATCH_SIZE', 100))
+REMINDER_MAX_ATTEMPTS = int(os.getenv('REMINDER_MAX_ATTEMPTS', 3))
+REMINDER_CLAIM_TIMEOUT_SECONDS = int(os.getenv('REMINDER_CLAIM_TIMEOUT_SECONDS', 600))
+# Periodic reminder check (mvp.tasks) and its lookback; overlapping ticks are deduplicated by ReminderLedger
+REMINDER_CHECK_INTERVAL_MINUTES = int(os.getenv('REMINDER_CHECK_INTERVAL_MINUTES', 15))
+REMINDER_CHECK_WINDOW_MINUTES = int(os.getenv('REMINDER_CHECK_WINDOW_MINUTES', 30))
+
+# Notification digests (translations.services.digest)
+NOTIFICATION_DIGEST_INTERVAL_MINUTES = int(os.getenv('NOTIFICATION_DIGEST_INTERVAL_MINUTES', 15))
+
+# Channel routing (translations.services.channels)
+NOTIFICATION_PREFERENCE_CACHE_SECONDS = int(os.getenv('NOTIFICATION_PREFERENCE_CACHE_SECONDS', 300))
+SMS_BACKEND = os.getenv('SMS_BACKEND', 'mvp.sms_backends.console.SMSBackend')
+
+# Notification retention (translations.services.retention): read notifications move to
+# the monthly archive after NOTIFICATION_RETENTION_DAYS, archive months are purged
+# after NOTIFICATION_ARCHIVE_RETENTION_DAYS
+NOTIFICATION_RETENTION_DAYS = int(os.getenv('NOTIFICATION_RETENTION_DAYS', 90))
+NOTIFICATION_ARCHIVE_RETENTION_DAYS = int(os.getenv('NOTIFICATION_ARCHIVE_RETENTION_DAYS', 365))
+NOTIFICATION_RETENTION_CHUNK_SIZE = int(os.getenv('NOTIFICATION_RETENTION_CHUNK_SIZE', 1000))
+
+# Server-sent events (mvp.realtime). Without a Redis URL the hub is local to the process.
+REALTIME_REDIS_URL = os.getenv('REALTIME_REDIS_URL')
+REALTIME_QUEUE_SIZE = int(os.getenv('REALTIME_QUEUE_SIZE', 100))
+REALTIME_KEEPALIVE_SECONDS = int(os.getenv('REALTIME_KEEPALIVE_SECONDS', 20))
+# Long-poll status endpoint: longest hold, and how often the row is re-read while holding
+TRANSLATION_STATUS_MAX_WAIT = int(os.getenv('TRANSLATION_STATUS_MAX_WAIT', 25))
+TRANSLATION_STATUS_RECHECK_SECONDS = int(os.getenv('TRANSLATION_STATUS_RECHECK_SECONDS', 5))
+
+# Period of the overdue sweep (translations.tasks.batch.sweep_overdue_translations)
+OVERDUE_SWEEP_INTERVAL_MINUTES = int(os.getenv('OVERDUE_SWEEP_INTERVAL_MINUTES', 60))
+
+# Daily deadline check (translations.tasks.batch.schedule_deadline_checks): hour it runs
+# at and translations per send_translation_reminders task it queues
+DEADLINE_CHECK_HOUR = int(os.getenv('DEADLINE_CHECK_HOUR', 8))
+DEADLINE_CHECK_BATCH_SIZE = int(os.getenv('DEADLINE_CHECK_BATCH_SIZE', 200))
+
+# Hour of the daily admin report (translations.tasks.reports.generate_periodic_reports)
+DAILY_REPORT_HOUR = int(os.getenv('DAILY_REPORT_HOUR', 7))
+
+# Celery Configuration (translation_platform/celery.py)
 CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND')
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_IMPORTS = (
+    'translations.tasks.batch',
+    'translations.tasks.reports',
+    'celery_tasks.email',
+)
+
+# One queue per workload, each consumed by its own worker (see the procfile):
+#   email      outbox drains for OTPs (priority 0), quote and payment notifications: lowest latency
+#   reminders  deadline reminder batches
+#   reports    overdue sweeps, status batches and the daily admin report
+# Periodic jobs (outbox poll, webhooks, digests, retention) run in the scheduler process
+CELERY_TASK_DEFAULT_QUEUE = 'default'
+CELERY_TASK_QUEUES = (
+    Queue('default'),
+    Queue('email'),
+    Queue('reminders'),
+    Queue('reports'),
+)
+CELERY_TASK_ROUTES = {
+    'celery_tasks.email.*': {'queue': 'email', 'priority': 0},
+    'translations.tasks.batch.send_quote_notifications': {'queue': 'email', 'priority': 3},
+    'translations.tasks.batch.process_payment_notifications': {'queue': 'email', 'priority': 3},
+    'translations.tasks.batch.schedule_deadline_checks': {'queue': 'reminders'},
+    'translations.tasks.batch.send_translation_reminders': {'queue': 'reminders'},
+    'translations.tasks.batch.update_translation_statuses': {'queue': 'reports'},
+    'translations.tasks.batch.sweep_overdue_translations': {'queue': 'reports'},
+    'translations.tasks.reports.*': {'queue': 'reports'},
+}
+# Redis honours message priorities (0 = highest) within a queue
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    'queue_order_strategy': 'priority',
+    'priority_steps': list(range(10)),
+    'sep': ':',
+}
+CELERY_TASK_DEFAULT_PRIORITY = 5
+# Workers reserve one message per process: long tasks don't hold messages another
+# worker could run, and acks_late tasks don't sit unacked behind a running one
+CELERY_WORKER_PREFETCH_MULTIPLIER = int(os.getenv('CELERY_WORKER_PREFETCH_MULTIPLIER', 1))
+# Messages are acknowledged before running, so a redelivery never sends the same
+# notifications twice; idempotent tasks (outbox drain, overdue sweeps) opt in to
+# acks_late on their decorator and are then requeued if their worker dies
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+# Per-worker rate limits and time limits
+CELERY_TASK_ANNOTATIONS = {
+    'celery_tasks.email.deliver_outbox': {'rate_limit': os.getenv('CELERY_EMAIL_RATE_LIMIT', '120/m')},
+    'translations.tasks.batch.send_translation_reminders': {'rate_limit': os.getenv('CELERY_REMINDER_RATE_LIMIT', '30/m')},
+}
 
 # Social Auth Configuration
 AUTHENTICATION_BACKENDS = (
@@ -261,5 +383,19 @@ SCHEDULER_CONFIG = {
 
 
 # Scheduler Config Variables
-SCHEDULER_AUTOSTART = True
-SCHEDULER_REMOVE_EXISTING_JOBS = True
\ No newline at end of file
+# Opt-in: only the processes that set it (the web process, see the procfile, or a
+# development runserver) campaign for the scheduler lease; run_scheduler always does.
+# Celery workers, tests and scripts leave it off.
+SCHEDULER_AUTOSTART = os.getenv('SCHEDULER_AUTOSTART', 'False') == 'True'
+SCHEDULER_REMOVE_EXISTING_JOBS = True
+# Leader election (mvp.leader): the lease holder renews every SCHEDULER_HEARTBEAT_SECONDS,
+# the others take over once it has not been renewed for SCHEDULER_LEASE_SECONDS
+SCHEDULER_LEASE_SECONDS = int(os.getenv('SCHEDULER_LEASE_SECONDS', 30))
+SCHEDULER_HEARTBEAT_SECONDS = int(os.getenv('SCHEDULER_HEARTBEAT_SECONDS', 10))
+# run_scheduler daemon: liveness file and/or local HTTP probe (0 disables it), stats log period
+SCHEDULER_HEARTBEAT_FILE = os.getenv('SCHEDULER_HEARTBEAT_FILE', '')
+SCHEDULER_HEALTH_PORT = int(os.getenv('SCHEDULER_HEALTH_PORT', 0))
+SCHEDULER_STATS_INTERVAL_SECONDS = int(os.getenv('SCHEDULER_STATS_INTERVAL_SECONDS', 300))
+# Job execution purge (mvp.services.job_retention): ids per DELETE and pause between chunks
+JOB_EXECUTION_PURGE_CHUNK_SIZE = int(os.getenv('JOB_EXECUTION_PURGE_CHUNK_SIZE', 5000))
+JOB_EXECUTION_PURGE_PAUSE_SECONDS = float(os.getenv('JOB_EXECUTION_PURGE_PAUSE_SECONDS', 0.2))
\ No newline at end of file
@@ -7,6 +7,7 @@ from django.utils.safestring import mark_safe
 from django import forms
 from django.utils import timezone
 from . import models
+from .services.inbox import InboxService
 
 # Admin interface configuration
 admin.site.site_header = 'Translation Platform - Administration'
@@ -234,15 +235,40 @@ class NotificationAdmin(admin.ModelAdmin):
     readonly_fields = ('created_at',)
 
     def mark_as_read(self, request, queryset):
-        count = queryset.update(is_read=True)
+        count = InboxService().set_read_state(queryset, True)
         self.message_user(request, f"{count} notification(s) marked as read")
     mark_as_read.short_description = "Mark as read"
 
     def mark_as_unread(self, request, queryset):
-        count = queryset.update(is_read=False)
+        count = InboxService().set_read_state(queryset, False)
         self.message_user(request, f"{count} notification(s) marked as unread")
     mark_as_unread.short_description = "Mark as unread"
 
+@admin.register(models.SuppressedRecipient)
+class SuppressedRecipientAdmin(admin.ModelAdmin):
+    list_display = ('email', 'reason', 'bounce_count', 'source', 'last_seen_at')
+    list_filter = ('reason', 'source')
+    search_fields = ('email', 'detail')
+    readonly_fields = ('created_at',)
+
+@admin.register(models.ClientWebhook)
+class ClientWebhookAdmin(admin.ModelAdmin):
+    list_display = ('client', 'url', 'is_active', 'total_events', 'total_failures',
+                    'consecutive_failures', 'last_status_code', 'last_success_at')
+    list_filter = ('is_active',)
+    search_fields = ('client__username', 'client__email', 'url')
+    readonly_fields = ('created_at', 'total_requests', 'total_events', 'total_failures',
+                       'consecutive_failures', 'total_latency_ms', 'last_status_code',
+                       'last_success_at', 'last_failure_at', 'last_error')
+
+@admin.register(models.Reminder)
+class ReminderAdmin(admin.ModelAdmin):
+    list_display = ('translation', 'kind', 'offset', 'fire_at', 'status', 'attempts', 'sent_at')
+    list_filter = ('kind', 'status')
+    search_fields = ('translation__title',)
+    raw_id_fields = ('translation',)
+    readonly_fields = ('created_at', 'claimed_at', 'sent_at')
+
 # Re-register User with our custom admin
 admin.site.unregister(User)
 admin.site.register(User, CustomUserAdmin)
\ No newline at end of file
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:14
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("translations", "0009_notification_inbox"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notificationpreference",
+            name="last_digest_sent_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name="NotificationDigestEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("title", models.CharField(max_length=200)),
+                ("message", models.TextField()),
+                ("link", models.CharField(blank=True, max_length=200)),
+                ("event_count", models.PositiveIntegerField(default=1)),
+                ("first_event_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "last_event_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "translation",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="translations.translationrequest",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="digest_entries",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["first_event_at"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "translation"),
+                        name="unique_digest_entry_per_translation",
+                    )
+                ],
+            },
+        ),
+    ]
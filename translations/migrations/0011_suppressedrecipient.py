@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:19
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("translations", "0010_notification_digest"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SuppressedRecipient",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("email", models.EmailField(max_length=254, unique=True)),
+                (
+                    "reason",
+                    models.CharField(
+                        choices=[
+                            ("HARD_BOUNCE", "Hard bounce"),
+                            ("REJECTED", "Rejected by the provider"),
+                            ("COMPLAINT", "Spam complaint"),
+                            ("MANUAL", "Manually suppressed"),
+                        ],
+                        default="HARD_BOUNCE",
+                        max_length=20,
+                    ),
+                ),
+                ("detail", models.TextField(blank=True)),
+                ("source", models.CharField(blank=True, max_length=100)),
+                ("bounce_count", models.PositiveIntegerField(default=1)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "last_seen_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+            ],
+            options={
+                "ordering": ["-last_seen_at"],
+            },
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:21
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("translations", "0011_suppressedrecipient"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationArchive",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("month", models.DateField()),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("QUOTE", "Quote Received"),
+                            ("PROGRESS", "Translation Progress"),
+                            ("COMPLETED", "Translation Completed"),
+                            ("PAYMENT", "Payment Required"),
+                            ("SYSTEM", "System Notification"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("title", models.CharField(max_length=200)),
+                ("message", models.TextField()),
+                ("link", models.CharField(blank=True, max_length=200)),
+                ("created_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_notifications",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(fields=["month"], name="translation_month_27fc39_idx"),
+                    models.Index(
+                        fields=["user", "created_at"],
+                        name="translation_user_id_a337bd_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
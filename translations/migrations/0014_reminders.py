@@ -0,0 +1,76 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("translations", "0013_client_webhooks"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Reminder",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("DOCUMENT", "Document deadline"),
+                            ("MEETING", "Interpretation session"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("offset", models.PositiveIntegerField()),
+                ("fire_at", models.DateTimeField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "Pending"),
+                            ("SENDING", "Sending"),
+                            ("SENT", "Sent"),
+                            ("CANCELLED", "Cancelled"),
+                            ("FAILED", "Failed"),
+                        ],
+                        default="PENDING",
+                        max_length=20,
+                    ),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("last_error", models.TextField(blank=True)),
+                ("claimed_at", models.DateTimeField(blank=True, null=True)),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "translation",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reminders",
+                        to="translations.translationrequest",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["fire_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["fire_at", "status"],
+                        name="translation_fire_at_a8962d_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("translations", "0014_reminders"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReminderLedger",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("DOCUMENT", "Document deadline"),
+                            ("MEETING", "Interpretation session"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("offset", models.PositiveIntegerField()),
+                ("anchor", models.DateTimeField()),
+                ("sent_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["-sent_at"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="translationrequest",
+            index=models.Index(
+                fields=["status", "deadline"], name="translation_status_817064_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="translationrequest",
+            index=models.Index(
+                fields=["status", "start_date"], name="translation_status_2c469a_idx"
+            ),
+        ),
+        migrations.AddField(
+            model_name="reminderledger",
+            name="translation",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="sent_reminders",
+                to="translations.translationrequest",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="reminderledger",
+            constraint=models.UniqueConstraint(
+                fields=("translation", "kind", "offset", "anchor"),
+                name="unique_reminder_per_anchor",
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:32
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("translations", "0015_reminder_ledger"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SchedulerLease",
+            fields=[
+                (
+                    "name",
+                    models.CharField(max_length=100, primary_key=True, serialize=False),
+                ),
+                ("holder", models.CharField(blank=True, max_length=255)),
+                ("acquired_at", models.DateTimeField(blank=True, null=True)),
+                ("renewed_at", models.DateTimeField(blank=True, null=True)),
+                ("expires_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
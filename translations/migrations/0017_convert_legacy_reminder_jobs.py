@@ -0,0 +1,61 @@
+import re
+
+from django.db import migrations
+from django.utils import timezone
+
+# Ids of the reminder jobs written to DjangoJobStore by the former
+# schedule_*_reminders helpers, whose pickled state held a whole TranslationRequest
+LEGACY_JOB_IDS = [
+    (re.compile(r'^doc_reminder_(\d+)_(\d+)days$'), 'DOCUMENT'),
+    (re.compile(r'^meeting_reminder_(\d+)_(\d+)h$'), 'MEETING'),
+    (re.compile(r'^translation_(\d+)_doc_(\d+)days$'), 'DOCUMENT'),
+    (re.compile(r'^translation_(\d+)_meeting_(\d+)hrs$'), 'MEETING'),
+]
+
+
+def convert_legacy_reminder_jobs(apps, schema_editor):
+    """Replace legacy reminder jobs by Reminder rows, without unpickling job_state"""
+    DjangoJob = apps.get_model('django_apscheduler', 'DjangoJob')
+    Reminder = apps.get_model('translations', 'Reminder')
+    TranslationRequest = apps.get_model('translations', 'TranslationRequest')
+
+    now = timezone.now()
+    legacy_ids, reminders = [], {}
+    jobs = DjangoJob.objects.filter(id__regex=r'^(doc_reminder_|meeting_reminder_|translation_)').only('id', 'next_run_time')
+    for job in jobs.iterator():
+        for pattern, kind in LEGACY_JOB_IDS:
+            match = pattern.match(job.id)
+            if match:
+                legacy_ids.append(job.id)
+                if job.next_run_time and job.next_run_time > now:
+                    translation_id, offset = int(match.group(1)), int(match.group(2))
+                    reminders[(translation_id, kind, offset)] = job.next_run_time
+                break
+
+    existing_translations = set(
+        TranslationRequest.objects.filter(id__in={key[0] for key in reminders}).values_list('id', flat=True)
+    )
+    already_pending = set(
+        Reminder.objects.filter(status='PENDING', translation_id__in=existing_translations)
+        .values_list('translation_id', 'kind', 'offset')
+    )
+    Reminder.objects.bulk_create([
+        Reminder(translation_id=translation_id, kind=kind, offset=offset, fire_at=fire_at)
+        for (translation_id, kind, offset), fire_at in reminders.items()
+        if translation_id in existing_translations and (translation_id, kind, offset) not in already_pending
+    ])
+
+    for start in range(0, len(legacy_ids), 500):
+        DjangoJob.objects.filter(id__in=legacy_ids[start:start + 500]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("translations", "0016_scheduler_lease"),
+        ("django_apscheduler", "0009_djangojobexecution_unique_job_executions"),
+    ]
+
+    operations = [
+        migrations.RunPython(convert_legacy_reminder_jobs, migrations.RunPython.noop),
+    ]
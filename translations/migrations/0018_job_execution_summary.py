@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("translations", "0017_convert_legacy_reminder_jobs"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobExecutionSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("job_id", models.CharField(max_length=255)),
+                ("day", models.DateField()),
+                ("runs", models.PositiveIntegerField(default=0)),
+                ("failures", models.PositiveIntegerField(default=0)),
+                ("timed_runs", models.PositiveIntegerField(default=0)),
+                ("total_duration", models.FloatField(default=0)),
+            ],
+            options={
+                "ordering": ["-day", "job_id"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("job_id", "day"),
+                        name="unique_job_execution_summary_per_day",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("translations", "0018_job_execution_summary"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="translationrequest",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("QUOTE", "Quote Pending"),
+                    ("QUOTED", "Quote Sent"),
+                    ("PAID", "Quote Paid"),
+                    ("ASSIGNED", "Assigned"),
+                    ("IN_PROGRESS", "In Progress"),
+                    ("OVERDUE", "Overdue"),
+                    ("COMPLETED", "Completed"),
+                    ("REJECTED", "Rejected"),
+                    ("CANCELLED", "Cancelled"),
+                ],
+                default="QUOTE",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -1,7 +1,10 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_save, post_init, post_delete
 from django.dispatch import receiver
+import secrets
 import uuid
 from django.utils import timezone
 from django_countries.fields import CountryField
@@ -160,10 +163,13 @@ class TranslationRequest(models.Model):
         ('PAID', 'Quote Paid'),
         ('ASSIGNED', 'Assigned'),
         ('IN_PROGRESS', 'In Progress'),
+        ('OVERDUE', 'Overdue'),
         ('COMPLETED', 'Completed'),
         ('REJECTED', 'Rejected'),
         ('CANCELLED', 'Cancelled')
     ]
+    # Work the translator still has to deliver; OVERDUE is set by the overdue sweep
+    ACTIVE_STATUSES = ['ASSIGNED', 'IN_PROGRESS', 'OVERDUE']
 
     TYPE_CHOICES = [
         ('DOCUMENT', 'Document'),
@@ -224,6 +230,13 @@ class TranslationRequest(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='QUOTE')
     notes = models.TextField(blank=True)
 
+    class Meta:
+        indexes = [
+            # Fenêtres de rappel (mvp.tasks.check_upcoming_translations)
+            models.Index(fields=['status', 'deadline']),
+            models.Index(fields=['status', 'start_date']),
+        ]
+
     def __str__(self):
         return f"{self.title} ({self.source_language} to {self.target_language})"
 
@@ -279,6 +292,7 @@ class NotificationPreference(models.Model):
     email_notifications = models.BooleanField(default=True)
     sms_notifications = models.BooleanField(default=False)
     reminder_frequency = models.IntegerField(default=24)  # en heures
+    last_digest_sent_at = models.DateTimeField(null=True, blank=True)
 
 class TranslationHistory(models.Model):
     translation = models.ForeignKey(TranslationRequest, on_delete=models.CASCADE)
@@ -307,8 +321,412 @@ class Notification(models.Model):
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'is_read', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_type_display()} - {self.title}"
+
+
+class NotificationCounter(models.Model):
+    """Denormalized unread notification count, one row per user"""
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True,
+                                related_name='notification_counter')
+    unread_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user_id}: {self.unread_count} unread"
+
+    @classmethod
+    def adjust(cls, user_ids, delta, seed_missing=True):
+        """Add delta (may be negative) to the counters of the given users"""
+        user_ids = set(user_ids)
+        if not user_ids or not delta:
+            return
+        existing = set(cls.objects.filter(user_id__in=user_ids).values_list('user_id', flat=True))
+        if existing:
+            cls.objects.filter(user_id__in=existing).update(
+                unread_count=Greatest(F('unread_count') + delta, 0),
+                updated_at=timezone.now()
+            )
+        missing = user_ids - existing
+        if missing and seed_missing:
+            # Missing rows are seeded from the table, which already includes this change
+            cls.resync(missing)
+
+    @classmethod
+    def resync(cls, user_ids):
+        """Recompute counters from the Notification table for the given users"""
+        user_ids = set(user_ids)
+        if not user_ids:
+            return
+        counts = dict(
+            Notification.objects.filter(user_id__in=user_ids, is_read=False)
+            .values('user_id')
+            .annotate(unread=Count('id'))
+            .values_list('user_id', 'unread')
+        )
+        existing = set(cls.objects.filter(user_id__in=user_ids).values_list('user_id', flat=True))
+        for user_id in existing:
+            cls.objects.filter(user_id=user_id).update(
+                unread_count=counts.get(user_id, 0),
+                updated_at=timezone.now()
+            )
+        cls.objects.bulk_create(
+            [cls(user_id=user_id, unread_count=counts.get(user_id, 0)) for user_id in user_ids - existing],
+            ignore_conflicts=True
+        )
+
+    @classmethod
+    def get_unread_count(cls, user_id):
+        """O(1) unread count; the row is created on first access"""
+        count = cls.objects.filter(user_id=user_id).values_list('unread_count', flat=True).first()
+        if count is None:
+            cls.resync([user_id])
+            count = cls.objects.filter(user_id=user_id).values_list('unread_count', flat=True).first() or 0
+        return count
+
+
+# Signaux pour maintenir NotificationCounter sur les écritures unitaires.
+# bulk_create / update() ne déclenchent pas de signaux : passer par InboxService.
+@receiver(post_init, sender=Notification)
+def remember_notification_read_state(sender, instance, **kwargs):
+    # __dict__ so that a deferred is_read never triggers a query
+    instance._loaded_is_read = instance.__dict__.get('is_read')
+
+@receiver(post_save, sender=Notification)
+def update_counter_on_notification_save(sender, instance, created, **kwargs):
+    if created:
+        if not instance.is_read:
+            NotificationCounter.adjust([instance.user_id], 1)
+    elif instance._loaded_is_read is not None and instance.is_read != instance._loaded_is_read:
+        NotificationCounter.adjust([instance.user_id], -1 if instance.is_read else 1)
+    instance._loaded_is_read = instance.is_read
+
+@receiver(post_delete, sender=Notification)
+def update_counter_on_notification_delete(sender, instance, **kwargs):
+    if instance._loaded_is_read is False:
+        # No seeding: the user itself may be in the middle of a cascade delete
+        NotificationCounter.adjust([instance.user_id], -1, seed_missing=False)
+
+class NotificationArchive(models.Model):
+    """
+    Read notifications moved out of the live table by the retention job
+    (translations.services.retention). Rows are bucketed by calendar month
+    so the archive can be purged one month at a time.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_notifications')
+    month = models.DateField()  # 1er jour du mois de created_at
+    type = models.CharField(max_length=20, choices=Notification.NOTIFICATION_TYPES)
+    title = models.CharField(max_length=200)
+    message = models.TextField()
+    link = models.CharField(max_length=200, blank=True)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['month']),
+            models.Index(fields=['user', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} - {self.title}"
+
+class NotificationDigestEntry(models.Model):
+    """
+    Buffered email event waiting for the user's next digest.
+    Events about the same TranslationRequest are merged into one entry.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='digest_entries')
+    translation = models.ForeignKey(TranslationRequest, on_delete=models.CASCADE, null=True, blank=True)
+    title = models.CharField(max_length=200)
+    message = models.TextField()
+    link = models.CharField(max_length=200, blank=True)
+    event_count = models.PositiveIntegerField(default=1)
+    first_event_at = models.DateTimeField(auto_now_add=True)
+    last_event_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['first_event_at']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'translation'], name='unique_digest_entry_per_translation'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.title} (x{self.event_count})"
+
+
+class EmailOutbox(models.Model):
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('SENDING', 'Sending'),
+        ('SENT', 'Sent'),
+        ('FAILED', 'Failed')
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+    html_body = models.TextField(blank=True)
+    from_email = models.CharField(max_length=254, blank=True)
+    recipients = models.JSONField(default=list)
+    cc = models.JSONField(default=list, blank=True)
+    bcc = models.JSONField(default=list, blank=True)
+    reply_to = models.JSONField(default=list, blank=True)
+    # Liste de {"filename", "content" (base64), "mimetype"}
+    attachments = models.JSONField(default=list, blank=True)
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.recipients)} ({self.status})"
+
+
+class SuppressedRecipient(models.Model):
+    """
+    Address that must not be mailed again (hard bounce, complaint, refusal).
+    Emails are stored lowercased; see mvp.services.suppression.
+    """
+    REASON_CHOICES = [
+        ('HARD_BOUNCE', 'Hard bounce'),
+        ('REJECTED', 'Rejected by the provider'),
+        ('COMPLAINT', 'Spam complaint'),
+        ('MANUAL', 'Manually suppressed')
+    ]
+
+    email = models.EmailField(unique=True)
+    reason = models.CharField(max_length=20, choices=REASON_CHOICES, default='HARD_BOUNCE')
+    detail = models.TextField(blank=True)
+    source = models.CharField(max_length=100, blank=True)
+    bounce_count = models.PositiveIntegerField(default=1)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_seen_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-last_seen_at']
+
+    def save(self, *args, **kwargs):
+        self.email = self.email.strip().lower()
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.email} ({self.get_reason_display()})"
+
+
+def generate_webhook_secret():
+    return secrets.token_hex(32)
+
+
+class ClientWebhook(models.Model):
+    """
+    Endpoint registered by a client to receive TranslationRequest status
+    changes (mvp.services.webhooks). Delivery metrics are kept on the row.
+    """
+    client = models.ForeignKey(User, on_delete=models.CASCADE, related_name='webhooks')
+    url = models.URLField(max_length=500)
+    secret = models.CharField(max_length=64, default=generate_webhook_secret)
+    # Statuts notifiés ; vide = tous
+    statuses = models.JSONField(default=list, blank=True)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    # Metrics
+    total_requests = models.PositiveIntegerField(default=0)
+    total_events = models.PositiveIntegerField(default=0)
+    total_failures = models.PositiveIntegerField(default=0)
+    consecutive_failures = models.PositiveIntegerField(default=0)
+    total_latency_ms = models.PositiveBigIntegerField(default=0)
+    last_status_code = models.PositiveIntegerField(null=True, blank=True)
+    last_success_at = models.DateTimeField(null=True, blank=True)
+    last_failure_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
     class Meta:
         ordering = ['-created_at']
 
     def __str__(self):
-        return f"{self.get_type_display()} - {self.title}"
\ No newline at end of file
+        return f"{self.client_id} -> {self.url}"
+
+    def wants(self, status):
+        return not self.statuses or status in self.statuses
+
+    @property
+    def average_latency_ms(self):
+        if not self.total_requests:
+            return None
+        return round(self.total_latency_ms / self.total_requests, 1)
+
+
+class WebhookDelivery(models.Model):
+    """One status-change event waiting to be (or already) pushed to a ClientWebhook"""
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('SENDING', 'Sending'),
+        ('SENT', 'Sent'),
+        ('FAILED', 'Failed')
+    ]
+
+    webhook = models.ForeignKey(ClientWebhook, on_delete=models.CASCADE, related_name='deliveries')
+    event_id = models.UUIDField(default=uuid.uuid4, unique=True)
+    event = models.CharField(max_length=50)
+    payload = models.JSONField()
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    response_status = models.PositiveIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    delivered_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.event} -> {self.webhook_id} ({self.status})"
+
+
+
+class Reminder(models.Model):
+    """
+    Deadline / session reminder due at fire_at, sent by the reminder
+    dispatcher (mvp.services.reminder_dispatcher). `offset` is in days for
+    document reminders and in hours for meeting reminders.
+    """
+    KIND_CHOICES = [
+        ('DOCUMENT', 'Document deadline'),
+        ('MEETING', 'Interpretation session')
+    ]
+
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('SENDING', 'Sending'),
+        ('SENT', 'Sent'),
+        ('CANCELLED', 'Cancelled'),
+        ('FAILED', 'Failed')
+    ]
+
+    translation = models.ForeignKey(TranslationRequest, on_delete=models.CASCADE, related_name='reminders')
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    offset = models.PositiveIntegerField()
+    fire_at = models.DateTimeField()
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['fire_at']
+        indexes = [
+            models.Index(fields=['fire_at', 'status']),
+        ]
+
+    def __str__(self):
+        unit = 'd' if self.kind == 'DOCUMENT' else 'h'
+        return f"{self.translation_id} {self.kind} -{self.offset}{unit} at {self.fire_at} ({self.status})"
+
+
+class ReminderLedger(models.Model):
+    """
+    One row per reminder actually sent, whichever path sent it (the reminder
+    dispatcher or the periodic check in mvp.tasks). The unique constraint
+    makes each reminder fire once; `anchor` is the deadline or session start
+    the offset was counted from, so a rescheduled session gets new reminders.
+    """
+    translation = models.ForeignKey(TranslationRequest, on_delete=models.CASCADE, related_name='sent_reminders')
+    kind = models.CharField(max_length=20, choices=Reminder.KIND_CHOICES)
+    offset = models.PositiveIntegerField()
+    anchor = models.DateTimeField()
+    sent_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-sent_at']
+        constraints = [
+            models.UniqueConstraint(fields=['translation', 'kind', 'offset', 'anchor'],
+                                    name='unique_reminder_per_anchor'),
+        ]
+
+    def __str__(self):
+        return f"{self.translation_id} {self.kind} -{self.offset} ({self.sent_at})"
+
+    @classmethod
+    def claim(cls, translation_id, kind, offset, anchor):
+        """Record a reminder before sending it; False if it was already sent"""
+        try:
+            with transaction.atomic():
+                cls.objects.create(translation_id=translation_id, kind=kind, offset=offset, anchor=anchor)
+        except IntegrityError:
+            return False
+        return True
+
+    @classmethod
+    def release(cls, translation_id, kind, offset, anchor):
+        """Forget a claimed reminder whose sending failed, so it can be retried"""
+        cls.objects.filter(translation_id=translation_id, kind=kind, offset=offset, anchor=anchor).delete()
+
+
+class SchedulerLease(models.Model):
+    """
+    Leadership lease for a singleton background role (mvp.leader). The
+    holder renews expires_at on every heartbeat; once it has passed, any
+    other process may take the lease over.
+    """
+    name = models.CharField(max_length=100, primary_key=True)
+    holder = models.CharField(max_length=255, blank=True)
+    acquired_at = models.DateTimeField(null=True, blank=True)
+    renewed_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.name}: {self.holder or '-'} until {self.expires_at}"
+
+
+class JobExecutionSummary(models.Model):
+    """
+    Daily per-job roll-up of django_apscheduler executions, written before
+    the raw DjangoJobExecution rows are purged (mvp.services.job_retention)
+    """
+    job_id = models.CharField(max_length=255)
+    day = models.DateField()
+    runs = models.PositiveIntegerField(default=0)
+    failures = models.PositiveIntegerField(default=0)
+    # Exécutions ayant une durée enregistrée, et leur durée totale (secondes)
+    timed_runs = models.PositiveIntegerField(default=0)
+    total_duration = models.FloatField(default=0)
+
+    class Meta:
+        ordering = ['-day', 'job_id']
+        constraints = [
+            models.UniqueConstraint(fields=['job_id', 'day'], name='unique_job_execution_summary_per_day'),
+        ]
+
+    def __str__(self):
+        return f"{self.job_id} {self.day}: {self.runs} runs, {self.failures} failures"
+
+    @property
+    def mean_duration(self):
+        if not self.timed_runs:
+            return None
+        return round(self.total_duration / self.timed_runs, 2)
@@ -16,6 +16,8 @@ from django.db.models import Avg
 from django.template.loader import render_to_string
 from django.core.mail import send_mail
 from django.conf import settings
+from .services.notification import NotificationService
+from .services.inbox import InboxService
 class CustomAdminSite(AdminSite):
     """
     Custom Admin Site Configuration
@@ -505,24 +507,27 @@ class TranslationRequestAdmin(admin.ModelAdmin):
 
     def send_reminder(self, request, queryset):
         """Send reminder to relevant parties"""
-        for translation in queryset:
+        notifications = []
+        for translation in queryset.filter(status__in=['IN_PROGRESS', 'QUOTED']):
             if translation.status == 'IN_PROGRESS':
                 # Create notification for translator
-                Notification.objects.create(
-                    user=translation.translator,
+                notifications.append(Notification(
+                    user_id=translation.translator_id,
                     type='PROGRESS',
                     title='Translation Reminder',
                     message=f'Reminder: Translation "{translation.title}" is due on {translation.deadline}'
-                )
+                ))
             elif translation.status == 'QUOTED':
                 # Create notification for client
-                Notification.objects.create(
-                    user=translation.client,
+                notifications.append(Notification(
+                    user_id=translation.client_id,
                     type='QUOTE',
                     title='Quote Reminder',
                     message=f'Reminder: You have a pending quote for "{translation.title}"'
-                )
+                ))
         
+        # One INSERT for the whole selection
+        NotificationService().create_bulk_notifications(notifications)
         self.message_user(request, 'Reminders sent successfully.')
     send_reminder.short_description = "Send reminders"
 
@@ -593,12 +598,12 @@ class NotificationAdmin(admin.ModelAdmin):
     created_at_formatted.short_description = 'Created'
 
     def mark_as_read(self, request, queryset):
-        updated = queryset.update(is_read=True)
+        updated = InboxService().set_read_state(queryset, True)
         self.message_user(request, f'{updated} notifications marked as read.')
     mark_as_read.short_description = "Mark selected as read"
 
     def mark_as_unread(self, request, queryset):
-        updated = queryset.update(is_read=False)
+        updated = InboxService().set_read_state(queryset, False)
         self.message_user(request, f'{updated} notifications marked as unread.')
     mark_as_unread.short_description = "Mark selected as unread"
 
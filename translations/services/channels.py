@@ -0,0 +1,227 @@
+from collections import namedtuple
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db.models import QuerySet
+from django.utils import timezone
+import threading
+import time
+import logging
+
+from mvp.services.email_outbox import EmailOutboxService
+from mvp.services.mail_merge import MailMerge
+from mvp.sms_backends import get_sms_backend
+
+from ..models import Notification, NotificationPreference
+from .digest import DigestService
+
+logger = logging.getLogger(__name__)
+
+ChannelPreference = namedtuple('ChannelPreference', ['email_notifications', 'sms_notifications', 'reminder_frequency'])
+
+# Same defaults as the NotificationPreference model, for users without a row
+DEFAULT_PREFERENCE = ChannelPreference(email_notifications=True, sms_notifications=False, reminder_frequency=24)
+
+
+class PreferenceCache:
+    """
+    Per-process cache of the routing fields of NotificationPreference
+
+    Missing users are loaded with one query per call whatever their number.
+    Saves and deletes made in this process invalidate the user's entry
+    (see mvp.signals); entries older than NOTIFICATION_PREFERENCE_CACHE_SECONDS
+    are reloaded so that changes made by other processes are picked up.
+    """
+
+    MAX_ENTRIES = 50000
+    QUERY_CHUNK = 1000
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        return self.get_many([user_id])[user_id]
+
+    def get_many(self, user_ids):
+        """
+        Returns:
+            dict: {user_id: ChannelPreference}
+        """
+        ttl = getattr(settings, 'NOTIFICATION_PREFERENCE_CACHE_SECONDS', 300)
+        now = time.monotonic()
+        result, missing = {}, []
+        for user_id in set(user_ids):
+            entry = self._entries.get(user_id)
+            if entry is not None and now - entry[1] <= ttl:
+                result[user_id] = entry[0]
+            else:
+                missing.append(user_id)
+
+        if missing:
+            loaded = {}
+            for start in range(0, len(missing), self.QUERY_CHUNK):
+                rows = NotificationPreference.objects.filter(
+                    user_id__in=missing[start:start + self.QUERY_CHUNK]
+                ).values_list('user_id', 'email_notifications', 'sms_notifications', 'reminder_frequency')
+                for user_id, *fields in rows:
+                    loaded[user_id] = ChannelPreference(*fields)
+            with self._lock:
+                if len(self._entries) + len(missing) > self.MAX_ENTRIES:
+                    self._entries.clear()
+                for user_id in missing:
+                    preference = loaded.get(user_id, DEFAULT_PREFERENCE)
+                    self._entries[user_id] = (preference, now)
+                    result[user_id] = preference
+        return result
+
+    def invalidate(self, user_id=None):
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+
+preference_cache = PreferenceCache()
+
+
+class ChannelRouter:
+    """
+    Splits one logical notification into per-channel batches
+
+        - in-app: every recipient
+        - email: recipients with email_notifications, either sent now (one
+          rendering merged per recipient, queued in the outbox) or buffered
+          into their digest, following DigestService routing
+        - sms: recipients with sms_notifications and a primary phone number,
+          sent through the SMS_BACKEND in one call
+
+    Recipients and preferences are each loaded with a single query.
+    """
+
+    IN_APP = 'in_app'
+    EMAIL = 'email'
+    SMS = 'sms'
+    ALL_CHANNELS = (IN_APP, EMAIL, SMS)
+
+    def __init__(self, sms_backend=None):
+        self.sms_backend = sms_backend
+        self.digest = DigestService()
+
+    def split(self, users, channels=ALL_CHANNELS):
+        """
+        Resolve recipients and preferences into batches
+
+        Args:
+            users (QuerySet|iterable): Users or user ids
+            channels (tuple): Channels to consider
+
+        Returns:
+            dict: {'recipients': int, 'in_app': [user_id], 'email': [User],
+                   'digest': [User], 'sms': [(User, phone)]}
+        """
+        batches = {'recipients': 0, self.IN_APP: [], self.EMAIL: [], 'digest': [], self.SMS: []}
+        recipients = self._recipients(users)
+        if self.EMAIL not in channels and self.SMS not in channels:
+            # In-app only: ids are enough, no preference lookup
+            user_ids = list(recipients.values_list('id', flat=True))
+            batches['recipients'] = len(user_ids)
+            if self.IN_APP in channels:
+                batches[self.IN_APP] = user_ids
+            return batches
+
+        recipients = list(recipients.select_related('profile'))
+        batches['recipients'] = len(recipients)
+        preferences = preference_cache.get_many([user.id for user in recipients])
+        for user in recipients:
+            if self.IN_APP in channels:
+                batches[self.IN_APP].append(user.id)
+            preference = preferences[user.id]
+            if self.EMAIL in channels and user.email:
+                route = self.digest._route_for(preference)
+                if route == DigestService.IMMEDIATE:
+                    batches[self.EMAIL].append(user)
+                elif route == DigestService.DIGEST:
+                    batches['digest'].append(user)
+            if self.SMS in channels and preference.sms_notifications:
+                profile = getattr(user, 'profile', None)
+                phone = str(profile.phone_primary) if profile is not None and profile.phone_primary else ''
+                if phone:
+                    batches[self.SMS].append((user, phone))
+        return batches
+
+    def send(self, users, notification_type, title, message, link='', channels=ALL_CHANNELS,
+             email_subject=None, email_template=None, email_context=None, sms_message=None,
+             translation=None):
+        """
+        Deliver a notification on every channel the recipients accept
+
+        Args:
+            users (QuerySet|iterable): Users or user ids
+            notification_type (str): One of Notification.NOTIFICATION_TYPES
+            title (str): In-app title, digest entry title and default subject
+            message (str): In-app message and digest entry text
+            link (str): Optional link
+            channels (tuple): Channels to use
+            email_subject (str): Subject of the immediate email (default: title)
+            email_template (str): Template of the immediate email; without one the
+                email is a one-entry digest summary. The context may use
+                {{ user_name }}, merged per recipient
+            email_context (dict): Context shared by every recipient
+            sms_message (str): SMS text (default: "title: message")
+            translation (TranslationRequest): Translation the event is about
+
+        Returns:
+            dict: Number of recipients reached per batch
+        """
+        from .notification import NotificationService
+
+        batches = self.split(users, channels)
+
+        NotificationService().create_bulk_notifications(
+            Notification(user_id=user_id, type=notification_type, title=title, message=message, link=link or '')
+            for user_id in batches[self.IN_APP]
+        )
+        emails = self._send_emails(
+            batches[self.EMAIL], email_subject or title, email_template, email_context or {},
+            title, message, link
+        )
+        self.digest.add_events(batches['digest'], title, message, link=link, translation=translation)
+        sms = self._send_sms(batches[self.SMS], sms_message or f'{title}: {message}')
+
+        return {
+            'recipients': batches['recipients'],
+            self.IN_APP: len(batches[self.IN_APP]),
+            self.EMAIL: emails,
+            'digest': len(batches['digest']),
+            self.SMS: sms
+        }
+
+    def _recipients(self, users):
+        recipients = User.objects.filter(is_active=True)
+        if isinstance(users, QuerySet):
+            return recipients.filter(id__in=users.values('id'))
+        return recipients.filter(id__in=[getattr(user, 'id', user) for user in users])
+
+    def _send_emails(self, users, subject, template, context, title, message, link):
+        if not users:
+            return 0
+        if template:
+            merge = MailMerge(subject, template, context, merge_fields=('user_name',))
+            messages = merge.messages(
+                (user.email, {'user_name': user.get_full_name() or user.username}) for user in users
+            )
+        else:
+            entry = DigestService.Entry(title=title, message=message, link=link or '', last_event_at=timezone.now())
+            messages = [self.digest.build_summary(user, [entry]) for user in users]
+        return EmailOutboxService.queue_messages([email for email in messages if email is not None])
+
+    def _send_sms(self, recipients, text):
+        if not recipients:
+            return 0
+        try:
+            backend = self.sms_backend or get_sms_backend()
+            return backend.send_messages([(phone, text) for user, phone in recipients])
+        except Exception as e:
+            logger.error(f"Error sending {len(recipients)} SMS: {e}")
+            return 0
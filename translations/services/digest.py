@@ -0,0 +1,228 @@
+from collections import namedtuple
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.mail import EmailMultiAlternatives
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+from datetime import timedelta
+import logging
+
+from mvp.services.email_outbox import EmailOutboxService
+from mvp.services.email_rendering import render_email
+
+from ..models import NotificationDigestEntry, NotificationPreference
+
+logger = logging.getLogger(__name__)
+
+DIGEST_TEMPLATE = 'emails/notification_digest.html'
+
+
+class DigestService:
+    """
+    Coalesces per-user email events into periodic digests
+
+    NotificationPreference drives the routing:
+        - email_notifications False: the event is dropped
+        - reminder_frequency <= 0: the event is emailed immediately
+        - otherwise the event is buffered and flushed at most once every
+          reminder_frequency hours, events about the same translation being
+          merged into a single entry
+    """
+
+    IMMEDIATE = 'immediate'
+    DIGEST = 'digest'
+    SKIP = 'skip'
+
+    # Stand-in for a NotificationDigestEntry when build_summary() is given a single event
+    Entry = namedtuple('Entry', ['title', 'message', 'link', 'event_count', 'last_event_at'],
+                       defaults=('', 1, None))
+
+    def route(self, user):
+        """
+        Decide how an email event for this user is delivered
+        """
+        from .channels import preference_cache
+
+        return self._route_for(preference_cache.get(user.id))
+
+    def add_event(self, user, title, message, link='', translation=None):
+        """
+        Buffer an event for the user's next digest
+
+        Returns:
+            NotificationDigestEntry: The new or merged entry
+        """
+        if translation is not None:
+            merged = self._merge(user, translation, title, message, link)
+            if merged is not None:
+                return merged
+            try:
+                with transaction.atomic():
+                    return NotificationDigestEntry.objects.create(
+                        user=user, translation=translation,
+                        title=title, message=message, link=link or ''
+                    )
+            except IntegrityError:
+                # Another process created the entry first
+                return self._merge(user, translation, title, message, link)
+
+        return NotificationDigestEntry.objects.create(
+            user=user, title=title, message=message, link=link or ''
+        )
+
+    def add_events(self, users, title, message, link='', translation=None):
+        """
+        Buffer the same event for several users
+
+        With a translation, the users' existing entries for it are merged
+        with one UPDATE and the missing ones written with one INSERT;
+        without one there is nothing to merge and only the INSERT runs.
+
+        Returns:
+            int: Number of users the event was buffered for
+        """
+        user_ids = list(dict.fromkeys(getattr(user, 'id', user) for user in users))
+        if not user_ids:
+            return 0
+
+        merged = set()
+        if translation is not None:
+            existing = NotificationDigestEntry.objects.filter(user_id__in=user_ids, translation=translation)
+            merged = set(existing.values_list('user_id', flat=True))
+            if merged:
+                existing.filter(user_id__in=merged).update(
+                    title=title,
+                    message=message,
+                    link=link or '',
+                    event_count=F('event_count') + 1,
+                    last_event_at=timezone.now()
+                )
+
+        missing = [user_id for user_id in user_ids if user_id not in merged]
+        try:
+            with transaction.atomic():
+                NotificationDigestEntry.objects.bulk_create([
+                    NotificationDigestEntry(user_id=user_id, translation=translation, title=title,
+                                            message=message, link=link or '')
+                    for user_id in missing
+                ])
+        except IntegrityError:
+            # Another process created some of the entries first: merge those one by one
+            for user_id in missing:
+                self.add_event(User(id=user_id), title, message, link=link, translation=translation)
+        return len(user_ids)
+
+    def flush_due(self, now=None):
+        """
+        Send one digest to every user whose reminder_frequency window has elapsed
+
+        Returns:
+            int: Number of digests queued
+        """
+        now = now or timezone.now()
+        user_ids = set(NotificationDigestEntry.objects.values_list('user_id', flat=True).distinct())
+        if not user_ids:
+            return 0
+
+        preferences = {
+            preference.user_id: preference
+            for preference in NotificationPreference.objects.filter(user_id__in=user_ids)
+        }
+
+        due_user_ids, dropped_user_ids = [], []
+        for user_id in user_ids:
+            preference = preferences.get(user_id)
+            route = self._route_for(preference)
+            if route == self.SKIP:
+                dropped_user_ids.append(user_id)
+            elif route == self.IMMEDIATE or preference is None or preference.last_digest_sent_at is None:
+                due_user_ids.append(user_id)
+            elif preference.last_digest_sent_at <= now - timedelta(hours=preference.reminder_frequency):
+                due_user_ids.append(user_id)
+
+        if dropped_user_ids:
+            NotificationDigestEntry.objects.filter(user_id__in=dropped_user_ids).delete()
+        if not due_user_ids:
+            return 0
+
+        entries_by_user = {}
+        entries = NotificationDigestEntry.objects.filter(
+            user_id__in=due_user_ids
+        ).select_related('user').order_by('user_id', 'first_event_at')
+        for entry in entries:
+            entries_by_user.setdefault(entry.user_id, []).append(entry)
+
+        messages, sent_entry_ids = [], []
+        for user_id, user_entries in entries_by_user.items():
+            preference = preferences.get(user_id)
+            period_hours = preference.reminder_frequency if preference else None
+            message = self.build_summary(user_entries[0].user, user_entries, period_hours)
+            if message is not None:
+                messages.append(message)
+            sent_entry_ids.extend(entry.id for entry in user_entries)
+
+        with transaction.atomic():
+            EmailOutboxService.queue_messages(messages)
+            NotificationDigestEntry.objects.filter(id__in=sent_entry_ids).delete()
+            NotificationPreference.objects.filter(user_id__in=entries_by_user).update(last_digest_sent_at=now)
+            NotificationPreference.objects.bulk_create(
+                [NotificationPreference(user_id=user_id, last_digest_sent_at=now)
+                 for user_id in entries_by_user if user_id not in preferences],
+                ignore_conflicts=True
+            )
+
+        logger.info(f"Queued {len(messages)} notification digests")
+        return len(messages)
+
+    def build_summary(self, user, entries, period_hours=None):
+        """
+        Build the summary email listing several entries for one user
+
+        Entries only need title, message, link, event_count and last_event_at,
+        so callers may pass plain objects as well as NotificationDigestEntry rows.
+        """
+        if not user.email:
+            return None
+        context = {
+            'user_name': user.get_full_name() or user.username,
+            'entries': entries,
+            'period_hours': period_hours,
+            'site_name': getattr(settings, 'SITE_NAME', '')
+        }
+        html_content, text_content = render_email(DIGEST_TEMPLATE, context)
+        if len(entries) == 1:
+            subject = entries[0].title
+        else:
+            subject = f'{len(entries)} updates on your translations'
+
+        email = EmailMultiAlternatives(
+            subject=subject,
+            body=text_content,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[user.email]
+        )
+        email.attach_alternative(html_content, "text/html")
+        return email
+
+    def _route_for(self, preference):
+        if preference is None:
+            # Same defaults as the NotificationPreference model
+            return self.DIGEST
+        if not preference.email_notifications:
+            return self.SKIP
+        if preference.reminder_frequency <= 0:
+            return self.IMMEDIATE
+        return self.DIGEST
+
+    def _merge(self, user, translation, title, message, link):
+        updated = NotificationDigestEntry.objects.filter(user=user, translation=translation).update(
+            title=title,
+            message=message,
+            link=link or '',
+            event_count=F('event_count') + 1,
+            last_event_at=timezone.now()
+        )
+        if updated:
+            return NotificationDigestEntry.objects.get(user=user, translation=translation)
+        return None
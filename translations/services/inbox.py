@@ -0,0 +1,109 @@
+from collections import Counter
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.db import transaction
+from django.db.models import Q
+
+from ..models import Notification, NotificationCounter
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+class InboxService:
+    """
+    Per-user notification inbox
+
+    Unread badges read a denormalized counter (NotificationCounter) instead of
+    counting the user's whole history, and listings use keyset pagination on
+    (created_at, id) backed by the (user, is_read, created_at) index.
+    """
+
+    def unread_count(self, user):
+        """
+        Unread notifications for the badge, O(1)
+        """
+        return NotificationCounter.get_unread_count(user.id)
+
+    def list_notifications(self, user, cursor=None, limit=20, unread_only=False):
+        """
+        Keyset-paginated listing, newest first
+
+        Args:
+            user (User): Inbox owner
+            cursor (str): Value returned as next_cursor by the previous page
+            limit (int): Page size
+            unread_only (bool): Only return unread notifications
+
+        Returns:
+            tuple: (list of Notification, next_cursor or None)
+        """
+        queryset = Notification.objects.filter(user=user)
+        if unread_only:
+            queryset = queryset.filter(is_read=False)
+        if cursor:
+            created_at, notification_id = self.decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) |
+                Q(created_at=created_at, id__lt=notification_id)
+            )
+
+        page = list(queryset.order_by('-created_at', '-id')[:limit + 1])
+        next_cursor = None
+        if len(page) > limit:
+            page = page[:limit]
+            next_cursor = self.encode_cursor(page[-1])
+        return page, next_cursor
+
+    def mark_read(self, user, notification_ids):
+        """
+        Mark some of the user's notifications as read
+        """
+        with transaction.atomic():
+            updated = Notification.objects.filter(
+                user=user, id__in=notification_ids, is_read=False
+            ).update(is_read=True)
+            NotificationCounter.adjust([user.id], -updated)
+        return updated
+
+    def mark_all_read(self, user):
+        """
+        Mark every notification of the user as read with a single UPDATE
+        """
+        with transaction.atomic():
+            updated = Notification.objects.filter(user=user, is_read=False).update(is_read=True)
+            NotificationCounter.objects.update_or_create(user=user, defaults={'unread_count': 0})
+        return updated
+
+    def set_read_state(self, queryset, is_read):
+        """
+        Bulk read/unread for an arbitrary queryset (admin actions)
+        """
+        with transaction.atomic():
+            user_ids = set(queryset.values_list('user_id', flat=True).distinct())
+            updated = queryset.update(is_read=is_read)
+            NotificationCounter.resync(user_ids)
+        return updated
+
+    def record_created(self, notifications):
+        """
+        Update the counters after a bulk_create (which sends no signals)
+        """
+        per_user = Counter(n.user_id for n in notifications if not n.is_read)
+        by_delta = {}
+        for user_id, count in per_user.items():
+            by_delta.setdefault(count, []).append(user_id)
+        for delta, user_ids in by_delta.items():
+            NotificationCounter.adjust(user_ids, delta)
+
+    @staticmethod
+    def encode_cursor(notification):
+        delta = notification.created_at - EPOCH
+        micros = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+        return f"{micros}_{notification.id}"
+
+    @staticmethod
+    def decode_cursor(cursor):
+        try:
+            micros, notification_id = cursor.split('_', 1)
+            return EPOCH + timedelta(microseconds=int(micros)), int(notification_id)
+        except (ValueError, AttributeError):
+            raise ValueError(f"Invalid inbox cursor: {cursor!r}")
@@ -1,9 +1,16 @@
 from django.core.mail import send_mail
-from django.template.loader import render_to_string
 from django.conf import settings
-from django.utils.html import strip_tags
+from django.contrib.auth.models import User
+from django.db.models import QuerySet
 
-from .models import Notification
+from mvp.realtime import publish_notifications
+from mvp.services.email_rendering import render_email
+from mvp.services.suppression import suppression_list
+
+from ..models import Notification
+from .inbox import InboxService
+from .digest import DigestService
+from .channels import ChannelRouter
 
 class NotificationService:
     def send_email_notification(self, template, context, recipient, subject):
@@ -16,13 +23,12 @@ class NotificationService:
             recipient (str): Email address of the recipient
             subject (str): Email subject
         """
-        # Render HTML version
-        html_message = render_to_string(f'emails/{template}.html', context)
-        
-        # Render text version
-        plain_message = render_to_string(f'emails/{template}.txt', context)
-        if not plain_message:
-            plain_message = strip_tags(html_message)
+        if suppression_list.is_suppressed(recipient):
+            return 0
+
+        # Render HTML and text versions; the .txt lookup is cached so a
+        # missing text template is only looked up once per process
+        html_message, plain_message = render_email(f'emails/{template}.html', context)
         
         return send_mail(
             subject=subject,
@@ -32,6 +38,37 @@ class NotificationService:
             html_message=html_message
         )
 
+    def send_event_email(self, user, template, context, subject, summary, link='', translation=None):
+        """
+        Email a status event, honouring the user's NotificationPreference
+
+        Depending on the preference the email is sent now, buffered into the
+        user's next digest (merged with other events about the same
+        translation), or dropped.
+
+        Args:
+            user (User): Recipient
+            template (str): Base template name for the immediate email
+            context (dict): Context for the immediate email
+            subject (str): Subject, also used as the digest entry title
+            summary (str): One-line description used in the digest
+            link (str): Optional link shown in the digest
+            translation (TranslationRequest): Translation the event is about
+        """
+        digest = DigestService()
+        route = digest.route(user)
+        if route == DigestService.SKIP:
+            return 0
+        if route == DigestService.DIGEST:
+            digest.add_event(user, subject, summary, link=link, translation=translation)
+            return 0
+        return self.send_email_notification(
+            template=template,
+            context=context,
+            recipient=user.email,
+            subject=subject
+        )
+
     def create_notification(self, user, notification_type, title, message, link=None):
         """
         Create in-app notification
@@ -44,6 +81,70 @@ class NotificationService:
             link=link
         )
 
+    def create_bulk_notifications(self, notifications):
+        """
+        Insert several prepared Notification instances with one query
+
+        Args:
+            notifications (list): Unsaved Notification instances
+
+        Returns:
+            int: Number of notifications created
+        """
+        notifications = list(notifications)
+        if not notifications:
+            return 0
+        Notification.objects.bulk_create(notifications)
+        # bulk_create sends no post_save, keep the unread counters in step
+        # and push the rows to open event streams here
+        InboxService().record_created(notifications)
+        publish_notifications(notifications)
+        return len(notifications)
+
+    def broadcast(self, notification_type, title, message, link='', role=None, users=None,
+                  channels=(ChannelRouter.IN_APP,), **channel_options):
+        """
+        Send the same notification to many users
+
+        Recipients are resolved with a single query and the in-app rows are
+        written with a single bulk INSERT. Email and SMS, when requested, are
+        sent according to each recipient's NotificationPreference (see
+        ChannelRouter), still without per-recipient queries.
+
+        Args:
+            notification_type (str): One of Notification.NOTIFICATION_TYPES
+            title (str): Notification title
+            message (str): Notification body
+            link (str): Optional link
+            role (str): Restrict recipients to active users with this profile role
+            users (QuerySet|iterable): Restrict recipients to these users (or user ids)
+            channels (tuple): ChannelRouter channels (default: in-app only)
+            **channel_options: email_subject, email_template, email_context,
+                sms_message, translation (see ChannelRouter.send)
+
+        Returns:
+            dict: {'recipients': int, 'created': int} plus the per-channel counts
+        """
+        if role is None and users is None:
+            raise ValueError("broadcast() needs a role, a set of users, or both")
+
+        recipients = User.objects.filter(is_active=True)
+        if role is not None:
+            recipients = recipients.filter(profile__role=role)
+        if users is not None:
+            if isinstance(users, QuerySet):
+                recipients = recipients.filter(id__in=users.values('id'))
+            else:
+                recipients = recipients.filter(
+                    id__in=[getattr(user, 'id', user) for user in users]
+                )
+
+        sent = ChannelRouter().send(
+            recipients, notification_type, title, message, link=link,
+            channels=channels, **channel_options
+        )
+        return {'created': sent[ChannelRouter.IN_APP], **sent}
+
     def send_quote_processed_notification(self, quote):
         """
         Send notification when a quote is processed
@@ -57,12 +158,15 @@ class NotificationService:
             'site_name': settings.SITE_NAME
         }
         
-        # Send email
-        self.send_email_notification(
+        # Send email (or buffer it into the client's digest)
+        self.send_event_email(
+            user=quote.client,
             template='quote_processed',
             context=context,
-            recipient=quote.client.email,
-            subject='Your Translation Quote is Ready'
+            subject='Your Translation Quote is Ready',
+            summary=f'Your quote for "{quote.title}" has been processed.',
+            link=f'/client/quotes/{quote.id}/',
+            translation=quote
         )
         
         # Create in-app notification
@@ -113,11 +217,14 @@ class NotificationService:
             'site_name': settings.SITE_NAME
         }
         
-        self.send_email_notification(
+        self.send_event_email(
+            user=translation.client,
             template='translator_assigned',
             context=client_context,
-            recipient=translation.client.email,
-            subject='Translator Assigned to Your Project'
+            subject='Translator Assigned to Your Project',
+            summary=f'A translator has been assigned to "{translation.title}".',
+            link=f'/client/translations/{translation.id}/',
+            translation=translation
         )
 
     def send_payment_received_notification(self, payment):
@@ -177,12 +284,15 @@ class NotificationService:
             'site_name': settings.SITE_NAME
         }
         
-        # Send email to client
-        self.send_email_notification(
+        # Send email to client (or buffer it into the client's digest)
+        self.send_event_email(
+            user=translation.client,
             template='translation_completed',
             context=client_context,
-            recipient=translation.client.email,
-            subject='Your Translation is Complete'
+            subject='Your Translation is Complete',
+            summary=f'Your translation "{translation.title}" is now complete.',
+            link=f'/client/translations/{translation.id}/',
+            translation=translation
         )
         
         # Create in-app notification for client
@@ -195,12 +305,10 @@ class NotificationService:
         )
         
         # Notify admin for review
-        admin_users = User.objects.filter(profile__role='ADMIN')
-        for admin in admin_users:
-            self.create_notification(
-                user=admin,
-                notification_type='SYSTEM',
-                title='Translation Ready for Review',
-                message=f'Translation "{translation.title}" has been completed and is ready for review.',
-                link=f'/admin/translations/{translation.id}/'
-            )
\ No newline at end of file
+        self.broadcast(
+            role='ADMIN',
+            notification_type='SYSTEM',
+            title='Translation Ready for Review',
+            message=f'Translation "{translation.title}" has been completed and is ready for review.',
+            link=f'/admin/translations/{translation.id}/'
+        )
\ No newline at end of file
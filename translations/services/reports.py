@@ -0,0 +1,39 @@
+from django.contrib.auth.models import User
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+from datetime import timedelta
+
+from ..models import TranslationRequest
+
+
+def generate_admin_report(now=None, period=timedelta(days=1)):
+    """
+    Platform figures for the admin report, from two aggregate queries
+
+    Returns:
+        dict: period_start, period_end, new_requests, completed, paid_revenue,
+            new_users, active, overdue and by_status ([(label, count)])
+    """
+    now = now or timezone.now()
+    since = now - period
+
+    totals = TranslationRequest.objects.aggregate(
+        new_requests=Count('id', filter=Q(created_at__gte=since)),
+        completed=Count('id', filter=Q(status='COMPLETED', completed_date__gte=since)),
+        paid_revenue=Sum('client_price', filter=Q(is_paid=True, updated_at__gte=since)),
+        active=Count('id', filter=Q(status__in=TranslationRequest.ACTIVE_STATUSES)),
+        overdue=Count('id', filter=Q(status='OVERDUE')),
+    )
+    counts = dict(
+        TranslationRequest.objects.order_by().values_list('status').annotate(count=Count('id'))
+    )
+    return {
+        'period_start': since,
+        'period_end': now,
+        **totals,
+        'paid_revenue': totals['paid_revenue'] or 0,
+        'new_users': User.objects.filter(date_joined__gte=since).count(),
+        'by_status': [
+            (label, counts.get(status, 0)) for status, label in TranslationRequest.STATUS_CHOICES
+        ],
+    }
@@ -0,0 +1,110 @@
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from datetime import timedelta
+import logging
+
+from ..models import Notification, NotificationArchive
+
+logger = logging.getLogger(__name__)
+
+
+class RetentionService:
+    """
+    Keeps the live Notification table small
+
+    Read notifications older than NOTIFICATION_RETENTION_DAYS are moved to
+    NotificationArchive, bucketed by month; archive months older than
+    NOTIFICATION_ARCHIVE_RETENTION_DAYS are then deleted. Every step works on
+    at most NOTIFICATION_RETENTION_CHUNK_SIZE rows per transaction so locks
+    stay short. Unread notifications are never archived.
+    """
+
+    def __init__(self, retention_days=None, archive_retention_days=None, chunk_size=None):
+        self.retention_days = retention_days or settings.NOTIFICATION_RETENTION_DAYS
+        self.archive_retention_days = archive_retention_days or settings.NOTIFICATION_ARCHIVE_RETENTION_DAYS
+        self.chunk_size = chunk_size or settings.NOTIFICATION_RETENTION_CHUNK_SIZE
+
+    def run(self, now=None):
+        """
+        Archive then purge
+
+        Returns:
+            dict: {'archived': int, 'purged': int}
+        """
+        now = now or timezone.now()
+        archived = self.archive_read(now)
+        purged = self.purge_archive(now)
+        logger.info(f"Notification retention: {archived} archived, {purged} archive rows purged")
+        return {'archived': archived, 'purged': purged}
+
+    def archive_read(self, now=None):
+        """
+        Move old read notifications to the archive, one chunk per transaction
+
+        Returns:
+            int: Number of notifications archived
+        """
+        cutoff = (now or timezone.now()) - timedelta(days=self.retention_days)
+        total = 0
+        while True:
+            moved = self._archive_chunk(cutoff)
+            total += moved
+            if moved < self.chunk_size:
+                return total
+
+    def purge_archive(self, now=None):
+        """
+        Delete archive months that ended before the archive retention window
+
+        Returns:
+            int: Number of archive rows deleted
+        """
+        cutoff = (now or timezone.now()) - timedelta(days=self.archive_retention_days)
+        cutoff_month = self.month_of(cutoff)
+        total = 0
+        while True:
+            ids = list(
+                NotificationArchive.objects.filter(month__lt=cutoff_month)
+                .order_by('id')
+                .values_list('id', flat=True)[:self.chunk_size]
+            )
+            if not ids:
+                return total
+            deleted, _ = NotificationArchive.objects.filter(id__in=ids).delete()
+            total += deleted
+
+    def _archive_chunk(self, cutoff):
+        with transaction.atomic():
+            # Rows locked by a concurrent mark-unread are picked up on the next run
+            rows = list(
+                Notification.objects.select_for_update(skip_locked=True)
+                .filter(is_read=True, created_at__lt=cutoff)
+                .order_by('id')
+                .values('id', 'user_id', 'type', 'title', 'message', 'link', 'created_at')[:self.chunk_size]
+            )
+            if not rows:
+                return 0
+
+            NotificationArchive.objects.bulk_create([
+                NotificationArchive(
+                    user_id=row['user_id'],
+                    month=self.month_of(row['created_at']),
+                    type=row['type'],
+                    title=row['title'],
+                    message=row['message'],
+                    link=row['link'],
+                    created_at=row['created_at']
+                )
+                for row in rows
+            ])
+            # Read rows do not affect NotificationCounter
+            Notification.objects.filter(id__in=[row['id'] for row in rows]).delete()
+        return len(rows)
+
+    @staticmethod
+    def month_of(moment):
+        """First day of the (local) month containing a datetime"""
+        if timezone.is_aware(moment):
+            moment = timezone.localtime(moment)
+        return moment.date().replace(day=1)
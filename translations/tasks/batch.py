@@ -0,0 +1,249 @@
+"""
+Multi-id variants of the notification tasks in notifications.py
+
+Each task loads all of its translations with one select_related query,
+writes every in-app notification with one bulk INSERT and queues one
+summary email per recipient (however many events they have) in the
+email outbox.
+"""
+from celery import shared_task
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+from datetime import timedelta
+import logging
+
+from mvp.services.email_outbox import EmailOutboxService
+
+from ..models import Notification, TranslationHistory, TranslationRequest
+from ..services.channels import preference_cache
+from ..services.digest import DigestService
+from ..services.notification import NotificationService
+
+logger = logging.getLogger(__name__)
+
+
+def load_translations(translation_ids, **filters):
+    """Translations with client, translator and languages in a single query"""
+    return list(
+        TranslationRequest.objects.select_related(
+            'client', 'translator', 'source_language', 'target_language'
+        ).filter(id__in=set(translation_ids), **filters).order_by('id')
+    )
+
+
+class RecipientBatch:
+    """
+    Collects (user, notification) events for several translations, then
+    writes the notifications in bulk and sends each recipient one email
+    summarizing all of their events.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def add(self, user, notification_type, title, message, link=''):
+        if user is not None:
+            self.events.append((user, notification_type, title, message, link))
+
+    def deliver(self):
+        """
+        Returns:
+            dict: {'notifications': int, 'emails': int}
+        """
+        if not self.events:
+            return {'notifications': 0, 'emails': 0}
+
+        created = NotificationService().create_bulk_notifications(
+            Notification(user_id=user.id, type=notification_type, title=title, message=message, link=link)
+            for user, notification_type, title, message, link in self.events
+        )
+
+        now = timezone.now()
+        per_user, users = {}, {}
+        for user, notification_type, title, message, link in self.events:
+            users[user.id] = user
+            per_user.setdefault(user.id, []).append(
+                DigestService.Entry(title=title, message=message, link=link, last_event_at=now)
+            )
+
+        preferences = preference_cache.get_many(per_user)
+        digest = DigestService()
+        messages = [
+            digest.build_summary(users[user_id], entries)
+            for user_id, entries in per_user.items()
+            if preferences[user_id].email_notifications
+        ]
+        emails = EmailOutboxService.queue_messages([email for email in messages if email is not None])
+        return {'notifications': created, 'emails': emails}
+
+
+@shared_task
+def send_quote_notifications(quote_ids):
+    """
+    Batch variant of send_quote_notification
+    """
+    batch = RecipientBatch()
+    quotes = load_translations(quote_ids)
+    for quote in quotes:
+        batch.add(
+            quote.client, 'QUOTE', 'Quote Processed',
+            f'Your quote request "{quote.title}" has been processed.',
+            f'/client/quotes/{quote.id}/'
+        )
+    result = batch.deliver()
+    return f"Quote notifications sent for {len(quotes)} quote(s): {result}"
+
+
+@shared_task
+def send_translation_reminders(translation_ids):
+    """
+    Batch variant of send_translation_reminder
+    """
+    batch = RecipientBatch()
+    translations = load_translations(translation_ids, status='IN_PROGRESS')
+    for translation in translations:
+        batch.add(
+            translation.translator, 'PROGRESS',
+            f'Deadline Reminder: {translation.title}',
+            f'Translation deadline is approaching: {translation.deadline}',
+            f'/translator/translations/{translation.id}/'
+        )
+    result = batch.deliver()
+    return f"Reminders sent for {len(translations)} translation(s): {result}"
+
+
+@shared_task
+def schedule_deadline_checks():
+    """
+    Daily deadline check: reminders for the IN_PROGRESS translations due
+    within 3 days, DEADLINE_CHECK_BATCH_SIZE ids per send_translation_reminders
+    task instead of one task per translation
+    """
+    now = timezone.now()
+    batch_size = settings.DEADLINE_CHECK_BATCH_SIZE
+    translation_ids = TranslationRequest.objects.filter(
+        status='IN_PROGRESS',
+        deadline__gte=now,
+        deadline__lte=now + timedelta(days=3)
+    ).order_by('id').values_list('id', flat=True)
+
+    # Without a broker (Celery is optional) the batches run in this process
+    send = send_translation_reminders.delay if settings.CELERY_BROKER_URL else send_translation_reminders
+
+    # Stream the ids rather than loading them all
+    batch, batches = [], 0
+    for translation_id in translation_ids.iterator(chunk_size=batch_size):
+        batch.append(translation_id)
+        if len(batch) == batch_size:
+            send(batch)
+            batch, batches = [], batches + 1
+    if batch:
+        send(batch)
+        batches += 1
+
+    return f"Deadline reminders queued in {batches} batch(es)"
+
+
+def mark_overdue(now, translation_ids=None):
+    """
+    Flag IN_PROGRESS translations past their deadline as OVERDUE
+
+    One conditional UPDATE for every row, TranslationHistory written with one
+    INSERT; webhooks and status streams are told as for a unit save, which
+    the bulk UPDATE bypasses.
+
+    Returns:
+        list: Flagged translations, with client and translator loaded
+    """
+    from mvp.services.webhooks import WebhookService
+    from mvp.signals import publish_status_change
+
+    with transaction.atomic():
+        candidates = TranslationRequest.objects.select_for_update(skip_locked=True).filter(
+            status='IN_PROGRESS', deadline__lt=now
+        )
+        if translation_ids is not None:
+            candidates = candidates.filter(id__in=set(translation_ids))
+        ids = list(candidates.values_list('id', flat=True))
+        if not ids:
+            return []
+
+        # The status condition is repeated so a concurrent change is never overwritten
+        TranslationRequest.objects.filter(id__in=ids, status='IN_PROGRESS').update(status='OVERDUE', updated_at=now)
+        TranslationHistory.objects.bulk_create([
+            TranslationHistory(translation_id=translation_id, status='OVERDUE', notes='Deadline passed')
+            for translation_id in ids
+        ])
+        overdue = load_translations(ids)
+        WebhookService.enqueue_status_changes(overdue, 'IN_PROGRESS')
+        for translation in overdue:
+            publish_status_change(translation, 'IN_PROGRESS')
+    return overdue
+
+
+def notify_overdue(overdue):
+    """Translator and admin notifications for flagged translations, delivered in bulk"""
+    batch = RecipientBatch()
+    admin = User.objects.filter(profile__role='ADMIN').first()
+    for translation in overdue:
+        batch.add(
+            translation.translator, 'PROGRESS', 'Translation Overdue',
+            f'Translation "{translation.title}" is now overdue.',
+            f'/translator/translations/{translation.id}/'
+        )
+        batch.add(
+            admin, 'SYSTEM', 'Translation Overdue',
+            f'Translation {translation.id} is overdue.',
+            f'/admin/translations/{translation.id}/'
+        )
+    return batch.deliver()
+
+
+@shared_task(acks_late=True)
+def update_translation_statuses(translation_ids):
+    """
+    Batch variant of update_translation_status
+    """
+    overdue = mark_overdue(timezone.now(), translation_ids)
+    if not overdue:
+        return "No overdue translation"
+    result = notify_overdue(overdue)
+    return f"{len(overdue)} translation(s) flagged overdue: {result}"
+
+
+@shared_task(acks_late=True)
+def sweep_overdue_translations():
+    """
+    Periodic overdue sweep: a handful of statements whatever the number of
+    active translations, instead of one update_translation_status per row
+    """
+    overdue = mark_overdue(timezone.now())
+    if not overdue:
+        return "No overdue translation"
+    result = notify_overdue(overdue)
+    logger.info(f"Overdue sweep: {len(overdue)} translation(s) flagged, {result}")
+    return f"{len(overdue)} translation(s) flagged overdue: {result}"
+
+
+@shared_task
+def process_payment_notifications(translation_ids):
+    """
+    Batch variant of process_payment_notification
+    """
+    batch = RecipientBatch()
+    translations = load_translations(translation_ids)
+    for translation in translations:
+        batch.add(
+            translation.client, 'PAYMENT', 'Payment Processed',
+            f'Your payment for "{translation.title}" has been processed.',
+            f'/client/translations/{translation.id}/'
+        )
+        batch.add(
+            translation.translator, 'PAYMENT', 'New Translation Available',
+            f'A new paid translation "{translation.title}" is available.',
+            f'/translator/translations/{translation.id}/'
+        )
+    result = batch.deliver()
+    return f"Payment notifications processed for {len(translations)} translation(s): {result}"
@@ -6,7 +6,6 @@ from django.conf import settings
 from datetime import timedelta
 
 from .models import TranslationRequest, Notification
-from .services.reports import generate_admin_report
 from .services.email import (
     send_quote_processed_email,
     send_payment_received_email,
@@ -152,72 +151,14 @@ def process_payment_notification(payment_id):
     except Exception as e:
         return f"Error processing payment notification: {str(e)}"
 
-@shared_task
-def generate_periodic_reports():
-    """
-    Generate periodic reports for administrators
-    Runs daily by default
-    """
-    try:
-        # Get all admin users
-        admin_users = User.objects.filter(profile__role='ADMIN')
-        
-        # Generate report data
-        report_data = generate_admin_report()
-        
-        # Create notification for each admin
-        for admin in admin_users:
-            Notification.objects.create(
-                user=admin,
-                type='SYSTEM',
-                title='Daily Platform Report',
-                message='Your daily platform report is now available.',
-                link='/admin/reports/'
-            )
-            
-            # Send email with report
-            context = {
-                'admin_name': admin.get_full_name(),
-                'report_data': report_data
-            }
-            
-            send_mail(
-                subject='Daily Platform Report',
-                message=render_to_string('emails/daily_report.txt', context),
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[admin.email],
-                html_message=render_to_string('emails/daily_report.html', context)
-            )
-        
-        return "Periodic reports generated and sent successfully"
-    except Exception as e:
-        return f"Error generating periodic reports: {str(e)}"
-
-# Schedule periodic tasks
-@shared_task
-def schedule_deadline_checks():
-    """
-    Scheduled task to check for approaching deadlines
-    Runs every hour by default
-    """
-    translations = TranslationRequest.objects.filter(
-        status='IN_PROGRESS',
-        deadline__gte=timezone.now(),
-        deadline__lte=timezone.now() + timedelta(days=3)
-    )
-    
-    for translation in translations:
-        send_translation_reminder.delay(translation.id)
-
+# Schedule periodic tasks (schedule_deadline_checks lives in batch.py,
+# generate_periodic_reports in reports.py)
 @shared_task
 def schedule_status_updates():
     """
     Scheduled task to check and update translation statuses
     Runs every hour by default
     """
-    translations = TranslationRequest.objects.filter(
-        status__in=['IN_PROGRESS', 'ASSIGNED']
-    )
-    
-    for translation in translations:
-        update_translation_status.delay(translation.id)
\ No newline at end of file
+    # One set-based sweep instead of one task per active translation
+    from .batch import sweep_overdue_translations
+    return sweep_overdue_translations()
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Periodic admin report, moved out of notifications.py
+"""
+from celery import shared_task
+from django.contrib.auth.models import User
+
+from mvp.services.email_outbox import EmailOutboxService
+from mvp.services.mail_merge import MailMerge
+
+from ..services.notification import NotificationService
+from ..services.reports import generate_admin_report
+
+
+@shared_task
+def generate_periodic_reports():
+    """
+    Generate periodic reports for administrators
+    Runs daily (DAILY_REPORT_HOUR)
+    """
+    report_data = generate_admin_report()
+
+    # Notify every admin with a single bulk INSERT
+    notified = NotificationService().broadcast(
+        role='ADMIN',
+        notification_type='SYSTEM',
+        title='Daily Platform Report',
+        message='Your daily platform report is now available.',
+        link='/admin/'
+    )
+
+    # Render the report once and personalize admin_name per recipient
+    report = MailMerge(
+        subject='Daily Platform Report',
+        template_name='emails/daily_report.html',
+        context={'report_data': report_data},
+        merge_fields=('admin_name',)
+    )
+    admins = User.objects.filter(is_active=True, profile__role='ADMIN').only('email', 'first_name', 'last_name')
+    emails = EmailOutboxService.queue_messages(report.messages(
+        (admin.email, {'admin_name': admin.get_full_name()})
+        for admin in admins
+    ))
+    return f"Daily report sent to {notified['recipients']} admin(s), {emails} email(s) queued"